@@ -0,0 +1,100 @@
+"""
+Driver startup per launch profile - cold and warm time to a ready driver and to the first loaded page.
+
+Cold: first launch with an empty browser disk cache. Warm: the following launches, which reuse the
+cache the performance profile keeps in BROWSER_CACHE_PATH (the default profile starts each browser
+with a fresh temporary profile, so its warm launches only gain from the operating system's caches).
+
+Usage:
+    python -m benchmarks.driver_startup
+    python -m benchmarks.driver_startup --launches 8 --profiles default performance --browser chrome --url https://demoqa.com/text-box
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from config.config import Config
+from config.settings import Settings
+from utils.driver_factory import DriverFactory
+
+PROFILES = ("default", "performance")
+
+
+def launch(url):
+    """
+    Start a driver with the active settings, load a page and quit.
+
+    Args:
+        url (str): Page loaded after startup
+
+    Returns:
+        tuple: (seconds until the driver was ready, seconds for the first page load)
+    """
+    start = time.perf_counter()
+    driver = DriverFactory.get_driver(use_daemon=False)
+    ready = time.perf_counter()
+    try:
+        driver.get(url)
+        return ready - start, time.perf_counter() - ready
+    finally:
+        driver.quit()
+
+
+def measure(profile, browser, launches, url, headless):
+    """
+    Args:
+        profile (str): Launch profile
+        browser (str): Browser name
+        launches (int): Launches in total; the first one is the cold start
+        url (str): Page loaded after each startup
+        headless (bool): Run headless
+
+    Returns:
+        dict: Cold and median warm startup / first load times in seconds
+    """
+    previous = Settings.current()
+    with tempfile.TemporaryDirectory() as cache_path:  # Empty cache: the first launch is cold
+        Settings.activate(Settings.resolve(overrides={
+            "LAUNCH_PROFILE": profile, "BROWSER": browser, "HEADLESS": headless,
+            "BROWSER_CACHE_PATH": cache_path, "USE_BROWSER_DAEMON": False,
+        }))
+        try:
+            DriverFactory.get_options(browser)  # Resolve option imports before timing
+            timings = [launch(url) for _ in range(launches)]
+        finally:
+            Settings.activate(previous)
+    warm = timings[1:] or timings
+    return {
+        "cold_start": timings[0][0], "cold_load": timings[0][1],
+        "warm_start": statistics.median(start for start, _ in warm),
+        "warm_load": statistics.median(load for _, load in warm),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold and warm driver startup per launch profile")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=PROFILES)
+    parser.add_argument("--browser", default=Config.BROWSER)
+    parser.add_argument("--launches", type=int, default=5, help="Launches per profile (the first is cold)")
+    parser.add_argument("--url", default=Config.TEXT_BOX_URL, help="Page loaded after each startup")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    args = parser.parse_args()
+
+    # Resolve the driver executable once, so the first measured launch is not a download
+    Settings.activate(Settings.resolve(overrides={"BROWSER": args.browser, "HEADLESS": not args.headed}))
+    launch("about:blank")
+
+    print(f"{'profile':<14}{'cold start':>12}{'cold load':>12}{'warm start':>12}{'warm load':>12}   (ms)")
+    results = {}
+    for profile in args.profiles:
+        results[profile] = measure(profile, args.browser, args.launches, args.url, not args.headed)
+        r = results[profile]
+        print(f"{profile:<14}{r['cold_start'] * 1000:>12.0f}{r['cold_load'] * 1000:>12.0f}"
+              f"{r['warm_start'] * 1000:>12.0f}{r['warm_load'] * 1000:>12.0f}")
+    if len(results) > 1:
+        fastest = min(results, key=lambda profile: results[profile]["warm_start"] + results[profile]["warm_load"])
+        print(f"\nFastest warm start to loaded page: {fastest} (set LAUNCH_PROFILE or --set LAUNCH_PROFILE={fastest})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+Page-object flows run by the benchmarks; the flows live with the tests (tests/flows.py).
+"""
+from tests.flows import buttons_flow, text_box_flow
+
+
+# Default set of independent flows used by the benchmarks
+DEFAULT_FLOWS = [buttons_flow, text_box_flow]
@@ -0,0 +1,67 @@
+"""
+Locator lookup cost - time find_elements for every registered locator on its page, and for the CSS
+form of XPath locators that have one. Slowest locators are listed first.
+
+Usage:
+    python -m benchmarks.locator_cost
+    python -m benchmarks.locator_cost --repeat 50 --top 15
+"""
+import argparse
+import time
+from utils.driver_factory import DriverFactory
+from utils.locator_registry import LocatorRegistry
+
+
+def lookup_ms(driver, locator, repeat):
+    """
+    Args:
+        driver: WebDriver on the page of the locator
+        locator (tuple): Locator tuple (By.TYPE, "value")
+        repeat (int): Number of lookups
+
+    Returns:
+        float: Median milliseconds per find_elements call
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        driver.find_elements(*locator)
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Locator lookup cost per locator")
+    parser.add_argument("--repeat", type=int, default=20, help="Lookups per locator")
+    parser.add_argument("--top", type=int, default=10, help="Slowest locators to list")
+    args = parser.parse_args()
+
+    registry = LocatorRegistry.all()
+    results = []  # (ms, name, locator, CSS ms or None)
+    driver = DriverFactory.get_driver()
+    try:
+        for url, names in LocatorRegistry.page_locators().items():
+            driver.get(url)
+            for name in names:
+                locator = registry[name]
+                if "{" in locator[1]:
+                    continue  # Template, formatted at runtime
+                css = LocatorRegistry.to_css(locator)
+                results.append((lookup_ms(driver, locator, args.repeat), name, locator,
+                                lookup_ms(driver, css, args.repeat) if css else None))
+    finally:
+        driver.quit()
+
+    results.sort(key=lambda result: result[0], reverse=True)
+    print(f"{'locator':<48} {'median ms':>10} {'CSS ms':>8}")
+    for ms, name, locator, css_ms in results[:args.top]:
+        print(f"{name:<48} {ms:>10.2f} {'' if css_ms is None else f'{css_ms:.2f}':>8}")
+    rewrites = [result for result in results if result[3] is not None]
+    if rewrites:
+        saved = sum(ms - css_ms for ms, _, _, css_ms in rewrites) / len(rewrites)
+        print(f"\n{len(rewrites)} XPath locators with a CSS form: {saved:+.2f} ms saved per lookup on average")
+    print(f"{len(results)} locators timed, {sum(result[0] for result in results):.1f} ms for one lookup of each")
+
+
+if __name__ == "__main__":
+    main()
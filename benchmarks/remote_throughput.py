@@ -0,0 +1,62 @@
+"""
+Local vs. remote throughput - runs the benchmark flows on a local driver and on a grid and
+compares flows per second and per-command round trip time.
+
+Usage (against a locally launched standalone server):
+    java -jar selenium-server-4.16.1.jar standalone
+    python -m benchmarks.remote_throughput --grid-url http://localhost:4444 --runs 6
+"""
+import argparse
+import time
+from benchmarks.flows import DEFAULT_FLOWS
+from config.config import Config
+from utils.command_timer import CommandTimer
+from utils.driver_factory import DriverFactory
+
+
+def run(runs):
+    """
+    Run the flows sequentially, one driver per flow, as the test fixture does.
+
+    Args:
+        runs (int): Number of flows to run
+
+    Returns:
+        tuple: (flows per second, CommandTimer with the recorded commands)
+    """
+    timer = CommandTimer.shared()
+    timer.reset()
+    start = time.perf_counter()
+    for i in range(runs):
+        driver = DriverFactory.get_driver()
+        try:
+            DEFAULT_FLOWS[i % len(DEFAULT_FLOWS)](driver)
+        finally:
+            driver.quit()
+    return runs / (time.perf_counter() - start), timer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare local and remote WebDriver throughput")
+    parser.add_argument("--grid-url", required=True, help="Grid or standalone server URL")
+    parser.add_argument("--runs", type=int, default=4, help="Flows to run per backend")
+    args = parser.parse_args()
+
+    Config.COMMAND_TIMING = True
+    local_rate, local_timer = run(args.runs)
+    local_stats = dict(local_timer.stats)
+
+    Config.GRID_URL = args.grid_url
+    remote_rate, remote_timer = run(args.runs)
+
+    print(f"throughput: local {local_rate:.2f} flows/s, remote {remote_rate:.2f} flows/s\n")
+    print(f"{'command':<28}{'local ms':>10}{'remote ms':>11}{'overhead ms':>13}")
+    for command, remote in sorted(remote_timer.stats.items(), key=lambda item: -item[1].total):
+        local = local_stats.get(command)
+        local_mean = local.mean * 1000 if local else float("nan")
+        print(f"{command:<28}{local_mean:>10.1f}{remote.mean * 1000:>11.1f}"
+              f"{remote.mean * 1000 - local_mean:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
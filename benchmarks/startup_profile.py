@@ -0,0 +1,111 @@
+"""
+Startup profile - reports import time per module and collection time per test module.
+
+Usage:
+    python -m benchmarks.startup_profile              # profile pytest --collect-only
+    python -m benchmarks.startup_profile tests/test_buttons.py --top 20
+
+The module doubles as a pytest plugin (loaded with -p) that times the collection of each test module.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Packages that belong to this repository
+PROJECT_PACKAGES = ("config", "pages", "locators", "utils", "tests", "benchmarks")
+
+# Environment variable telling the plugin where to write collection timings
+OUTPUT_ENV = "STARTUP_PROFILE_OUTPUT"
+
+_collect_started = {}
+_collect_durations = {}
+
+
+def pytest_collectstart(collector):
+    """Remember when collection of a node started."""
+    _collect_started[collector.nodeid] = time.perf_counter()
+
+
+def pytest_collectreport(report):
+    """Record collection time (including the module import) of each test module."""
+    started = _collect_started.pop(report.nodeid, None)
+    if started is not None and report.nodeid.endswith(".py"):
+        _collect_durations[report.nodeid] = time.perf_counter() - started
+
+
+def pytest_sessionfinish(session):
+    """Write the collected timings for the parent process."""
+    output = os.environ.get(OUTPUT_ENV)
+    if output:
+        with open(output, "w") as output_file:
+            json.dump(_collect_durations, output_file)
+
+
+def parse_importtime(stderr):
+    """
+    Parse the output of python -X importtime.
+
+    Args:
+        stderr (str): Captured stderr of the profiled process
+
+    Returns:
+        list: (module, depth, self_us, cumulative_us) tuples in import order
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report import and collection time per module")
+    parser.add_argument("pytest_args", nargs="*", help="Extra arguments passed to pytest")
+    parser.add_argument("--top", type=int, default=15, help="Number of third-party imports to list")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = os.path.join(temp_dir, "collect.json")
+        command = [
+            # --capture=no: importtime writes to the stderr file descriptor pytest would capture
+            sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q", "--capture=no",
+            "-p", "benchmarks.startup_profile", *args.pytest_args,
+        ]
+        start = time.perf_counter()
+        result = subprocess.run(command, capture_output=True, text=True, env={**os.environ, OUTPUT_ENV: output})
+        wall_time = time.perf_counter() - start
+        with open(output) as output_file:
+            collect_durations = json.load(output_file)
+
+    entries = parse_importtime(result.stderr)
+    project = [entry for entry in entries if entry[0].split(".")[0] in PROJECT_PACKAGES]
+    # Top-level imports triggered by project modules, i.e. the third-party cost we pay
+    third_party = {}
+    for name, depth, _, cumulative in entries:
+        if name.split(".")[0] not in PROJECT_PACKAGES and depth <= 2:
+            root = name.split(".")[0]
+            third_party[root] = max(third_party.get(root, 0), cumulative)
+
+    print(f"pytest --collect-only wall time: {wall_time * 1000:.0f} ms\n")
+    print(f"{'project module':<45}{'self ms':>10}{'cumul. ms':>12}")
+    for name, _, self_us, cumulative in sorted(project, key=lambda entry: -entry[3]):
+        print(f"{name:<45}{self_us / 1000:>10.1f}{cumulative / 1000:>12.1f}")
+
+    print(f"\n{'third-party package':<45}{'cumul. ms':>22}")
+    for root, cumulative in sorted(third_party.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{root:<45}{cumulative / 1000:>22.1f}")
+
+    print(f"\n{'test module collection':<45}{'ms':>22}")
+    for nodeid, duration in sorted(collect_durations.items(), key=lambda item: -item[1]):
+        print(f"{nodeid:<45}{duration * 1000:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
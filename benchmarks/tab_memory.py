@@ -0,0 +1,120 @@
+"""
+Memory-per-test comparison: one browser per test vs. one browser with several tabs.
+
+Usage:
+    python -m benchmarks.tab_memory --tests 6 --tabs 3
+"""
+import argparse
+import threading
+import time
+import psutil
+from benchmarks.flows import DEFAULT_FLOWS
+from utils.driver_factory import DriverFactory
+from utils.tab_scheduler import TabScheduler
+
+
+class PeakMemorySampler:
+    """Samples the resident memory of a driver's process tree in the background and keeps the peak"""
+
+    def __init__(self, driver, interval=0.2):
+        """
+        Args:
+            driver: WebDriver whose service process (and its browser children) is sampled
+            interval (float): Seconds between samples
+        """
+        self.process = psutil.Process(driver.service.process.pid)
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+
+    def current_rss(self):
+        """
+        Returns:
+            int: Combined RSS in bytes of the driver service and all browser processes
+        """
+        total = 0
+        for process in [self.process] + self.process.children(recursive=True):
+            try:
+                total += process.memory_info().rss
+            except psutil.NoSuchProcess:
+                continue
+        return total
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current_rss())
+            self._stop.wait(self.interval)
+
+
+def run_browser_per_test(flows):
+    """
+    Run each flow in its own freshly launched browser, one after the other.
+
+    Returns:
+        tuple: (peak RSS in bytes of a single browser, total duration in seconds)
+    """
+    peak = 0
+    start = time.perf_counter()
+    for flow in flows:
+        driver = DriverFactory.get_driver()
+        try:
+            with PeakMemorySampler(driver) as sampler:
+                flow(driver)
+            peak = max(peak, sampler.peak)
+        finally:
+            driver.quit()
+    return peak, time.perf_counter() - start
+
+
+def run_tabs(flows, tabs):
+    """
+    Run all flows interleaved across the tabs of a single browser.
+
+    Returns:
+        tuple: (peak RSS in bytes of the shared browser, total duration in seconds)
+    """
+    driver = DriverFactory.get_driver(page_load_strategy="none")
+    start = time.perf_counter()
+    try:
+        with PeakMemorySampler(driver) as sampler, TabScheduler(driver, tabs=tabs) as scheduler:
+            results = scheduler.run(flows)
+    finally:
+        driver.quit()
+    failed = [result for result in results if not result.passed]
+    if failed:
+        print(f"Warning: {len(failed)} flow(s) failed in tab mode: {failed}")
+    return sampler.peak, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tests", type=int, default=4, help="Number of flows to run")
+    parser.add_argument("--tabs", type=int, default=2, help="Tabs in the shared browser")
+    args = parser.parse_args()
+
+    flows = [DEFAULT_FLOWS[i % len(DEFAULT_FLOWS)] for i in range(args.tests)]
+    mb = 1024 * 1024
+
+    # With one browser per test, a worker holds one browser at a time; the equivalent
+    # concurrency of N tabs therefore costs N browsers
+    single_peak, single_time = run_browser_per_test(flows)
+    tabs_peak, tabs_time = run_tabs(flows, args.tabs)
+
+    print(f"{'mode':<22}{'peak MB':>10}{'MB/test':>10}{'seconds':>10}")
+    print(f"{'browser per test':<22}{single_peak * args.tabs / mb:>10.1f}"
+          f"{single_peak / mb:>10.1f}{single_time:>10.1f}")
+    print(f"{f'{args.tabs} tabs, 1 browser':<22}{tabs_peak / mb:>10.1f}"
+          f"{tabs_peak / args.tabs / mb:>10.1f}{tabs_time:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Visual diff speed - decode, perceptual hash and region diff of full HD screenshot pairs, single and batched.
+
+Usage:
+    python -m benchmarks.visual_diff
+    python -m benchmarks.visual_diff --pairs 64 --workers 8
+"""
+import argparse
+import os
+import time
+from io import BytesIO
+import numpy as np
+from PIL import Image
+from utils.visual_diff import VisualDiff
+
+REGIONS = [
+    {"name": "header", "box": (0, 0, 1920, 120), "threshold": 0.0},
+    {"name": "content", "box": (0, 120, 1920, 960), "threshold": 0.001},
+]
+
+
+def screenshot(seed, changed=False):
+    """
+    Synthetic 1920x1080 page: a grid of coloured blocks, optionally with a changed button.
+
+    Args:
+        seed (int): Random seed of the page content
+        changed (bool): Paint a 200x40 block white
+
+    Returns:
+        bytes: PNG image
+    """
+    blocks = np.random.default_rng(seed).integers(0, 256, (108, 192, 3), dtype=np.uint8)
+    image = np.repeat(np.repeat(blocks, 10, axis=0), 10, axis=1)
+    if changed:
+        image[500:540, 800:1000] = 255
+    buffer = BytesIO()
+    Image.fromarray(image).save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def best_of(function, repeat=5):
+    """
+    Args:
+        function: Callable without arguments
+        repeat (int): Number of runs
+
+    Returns:
+        float: Fastest run in milliseconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure visual diff speed on 1920x1080 screenshots")
+    parser.add_argument("--pairs", type=int, default=32, help="Screenshot pairs in the batch run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Threads for the batch run")
+    args = parser.parse_args()
+
+    baseline_png, actual_png = screenshot(0), screenshot(0, changed=True)
+    baseline, actual = VisualDiff.load(baseline_png), VisualDiff.load(actual_png)
+    print(f"Decode PNG:        {best_of(lambda: VisualDiff.load(actual_png)):7.1f} ms")
+    print(f"Perceptual hash:   {best_of(lambda: VisualDiff.phash(actual)):7.1f} ms")
+    print(f"Identical pair:    {best_of(lambda: VisualDiff.compare(baseline, baseline.copy())):7.1f} ms")
+    print(f"Region diff:       {best_of(lambda: VisualDiff.compare(baseline, actual, REGIONS)):7.1f} ms "
+          f"(decoded arrays)")
+
+    pairs = [(screenshot(seed), screenshot(seed, changed=seed % 2 == 1)) for seed in range(args.pairs)]
+    start = time.perf_counter()
+    VisualDiff.compare_batch(pairs, workers=1, regions=REGIONS)
+    sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    VisualDiff.compare_batch(pairs, workers=args.workers, regions=REGIONS)
+    parallel = time.perf_counter() - start
+    print(f"Batch of {args.pairs} PNG pairs: {args.pairs / sequential:6.1f} pairs/s on 1 thread, "
+          f"{args.pairs / parallel:6.1f} pairs/s on {args.workers} threads")
+
+
+if __name__ == "__main__":
+    main()
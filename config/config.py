@@ -1,6 +1,8 @@
 """
 Configuration management for the test automation framework.
 Contains all configuration settings, URLs, timeouts, and test data.
+These are the defaults; profiles, QA_<NAME> environment variables and --set override them per session
+(see config/settings.py).
 """
 
 
@@ -19,27 +21,152 @@ class Config:
     EXPLICIT_WAIT = 15         # Maximum time to wait for specific conditions
     PAGE_LOAD_TIMEOUT = 30     # Maximum time to wait for a page to load
     
+    # Fail fast when the application under test is down (see utils/circuit_breaker.py)
+    CIRCUIT_BREAKER_ENABLED = True    # Check the application before the first browser starts and on every navigation
+    CIRCUIT_BREAKER_THRESHOLD = 3     # Consecutive failed page loads that open the breaker
+    CIRCUIT_BREAKER_COOLDOWN = 30     # Seconds before an open breaker probes the application again
+    PREFLIGHT_TIMEOUT = 5             # Seconds allowed for the HTTP health probe
+    
+    # Browser daemon settings - keep one browser alive between local pytest runs
+    USE_BROWSER_DAEMON = False                  # Attach to the daemon's browser (or pass --browser-daemon)
+    DAEMON_STATE_FILE = ".browser_daemon.json"  # File where the daemon publishes its session details
+    DAEMON_IDLE_TIMEOUT = 3600                  # Stop the daemon after this many seconds without an attach
+    
+    # Selenium Grid settings - set GRID_URL (e.g. "http://localhost:4444") to run on a grid or standalone server
+    GRID_URL = None
+    GRID_POOL_SIZE = 8           # Keep-alive HTTP connections to the hub shared by all sessions
+    GRID_MAX_SESSIONS = 4        # Sessions this process may hold at once; further requests queue locally
+    GRID_QUEUE_TIMEOUT = 300     # Seconds to wait for a free grid slot before failing
+    GRID_REUSE_SESSIONS = True   # Reset and reuse sessions across tests instead of creating new ones
+    
+    # Collect Navigation Timing, paint and Web Vitals metrics after every page load (or pass --page-metrics)
+    COLLECT_PAGE_METRICS = False
+    
+    # Run tests grouped by page object on one shared driver and reset already loaded pages in place
+    # instead of reloading them (or pass --reuse-pages; see utils/page_reuse.py)
+    REUSE_PAGES = False
+    
+    # OpenMetrics export of run throughput and latencies (or pass --metrics / --metrics-port; see utils/metrics.py)
+    METRICS_ENABLED = False
+    METRICS_FILE = "reports/metrics.prom"  # Written at the end of the session
+    METRICS_PORT = None                    # Serve live metrics at http://127.0.0.1:<port>/metrics during the run
+    
+    # Retry failing tests in place on the same driver and keep their history (see utils/smart_rerun.py)
+    TEST_RETRIES = 0                          # Extra attempts per failing test (or pass --retries N)
+    RETRY_BACKOFF = 1.0                       # Seconds before the first retry, doubled for each further one
+    RETRY_BACKOFF_MAX = 8                     # Cap on the retry delay
+    TEST_HISTORY_FILE = ".test_history.json"  # Outcome and flakiness history per test
+    LAST_FAILED_FIRST = False                 # Run tests that failed last session first (or pass --last-failed-first)
+
+    # Test impact selection
+    IMPACT_INDEX_FILE = ".impact_index.json"  # Cached test -> page object / locator dependency index
+    IMPACT_BASE = "HEAD"                      # Git revision changes are measured against (or pass --impact-base)
+    
+    # Record the round trip time of every WebDriver command (or pass --command-timing)
+    COMMAND_TIMING = False
+    
+    # Browser resource monitor (utils/resource_monitor.py): sample memory, CPU and JS heap after every test
+    # (or pass --resource-monitor) and recycle long-lived drivers crossing a threshold (None disables it)
+    RESOURCE_MONITOR = False
+    RECYCLE_RSS_MB = 1500         # Driver service plus all browser processes (local drivers)
+    RECYCLE_JS_HEAP_MB = 256      # Used JavaScript heap of the current page (Chromium)
+    RECYCLE_DOM_NODES = None      # Live DOM nodes, including detached ones not yet collected (Chromium)
+    RECYCLE_AFTER_TESTS = None    # Tests one browser may serve
+    
+    # Widget drivers (pages/widgets.py): poll interval while waiting for calendar / suggestion state,
+    # and the date format of the date picker input
+    WIDGET_POLL_INTERVAL = 0.05
+    DATE_FORMAT = "%d %b %Y"
+    
+    # Action batches (BasePage.batch): dispatch DOM events from one script instead of native W3C input.
+    # One WebDriver command per batch; set to False for handlers that require trusted events.
+    SYNTHETIC_ACTIONS = True
+    
+    # Locator registry (utils/locator_registry.py): look XPath locators up by their equivalent CSS
+    # selector when one exists (python -m utils.locator_registry lists the rewrites)
+    PREFER_CSS_LOCATORS = True
+    
     # Window settings
     WINDOW_SIZE = "maximize"  # or tuple like (1920, 1080) for custom resolution
     
+    # Browser launch profile: "default", or "performance" for new headless mode without background
+    # networking, extensions and component updates, a window sized at launch (WINDOW_SIZE, or
+    # PERFORMANCE_VIEWPORT when that is "maximize") and a disk cache kept between sessions.
+    # Compare startup times with python -m benchmarks.driver_startup.
+    LAUNCH_PROFILE = "default"
+    PERFORMANCE_VIEWPORT = (1920, 1080)
+    BROWSER_CACHE_PATH = ".browser_cache"  # Disk cache of the performance profile, one directory per xdist worker
+    
     # Screenshot settings for debugging failures
     SCREENSHOT_ON_FAILURE = True   # Automatically capture screenshot on test failure
     SCREENSHOT_PATH = "screenshots"  # Directory to save screenshots
     
+    # Visual regression checks (see utils/visual_diff.py)
+    VISUAL_BASELINE_PATH = "visual_baselines"  # Reference screenshots, committed with the tests
+    VISUAL_DIFF_PATH = "screenshots/visual"    # Actual screenshot and highlighted diff of failed checks
+    VISUAL_PIXEL_TOLERANCE = 16                # Channel difference treated as anti-aliasing noise
+    VISUAL_THRESHOLD = 0.001                   # Share of changed pixels allowed per region
+    VISUAL_TRUST_PHASH = False                 # Pass on equal perceptual hashes without a pixel diff (misses tiny changes)
+    UPDATE_BASELINES = False                   # Overwrite baselines with current screenshots (or pass --update-baselines)
+    
+    # Artifact store for failure screenshots, DOM snapshots and old logs (see utils/artifact_store.py)
+    ARTIFACT_STORE = True                      # Store artifacts once per content hash instead of per failure
+    ARTIFACT_STORE_PATH = "artifacts"
+    ARTIFACT_MAX_BYTES = 500 * 1024 * 1024     # Least recently referenced artifacts are deleted above this size
+    ARTIFACT_MAX_AGE_DAYS = 14                 # Artifacts not referenced for this long are deleted
+    CAPTURE_DOM_ON_FAILURE = True              # Store the page source next to the failure screenshot
+    
+    # Record BasePage actions, batches and widget steps of each test; failed tests keep the trace for
+    # python -m utils.command_recorder (see utils/command_recorder.py)
+    RECORD_COMMANDS = True
+    TRACE_PATH = "reports/traces"  # Used when ARTIFACT_STORE is off
+    
+    # Console messages and failed requests pushed by DevTools into a per-driver ring buffer, read by
+    # BasePage.browser_errors() and stored for failed tests (Chromium only, see utils/browser_events.py)
+    CAPTURE_BROWSER_EVENTS = True
+    BROWSER_EVENT_BUFFER = 200                 # Events kept per driver; the oldest are dropped first
+    CONSOLE_LEVELS = ("error", "warning")      # Console / browser log levels that are kept
+    NETWORK_ERROR_STATUS = 400                 # Responses with this status or higher count as failed
+    
     # Logging settings
     LOG_LEVEL = "INFO"  # Logging level (INFO, DEBUG, ERROR)
     LOG_PATH = "logs"   # Directory to save log files
     
     # Report settings
     REPORT_PATH = "reports"  # Directory to save HTML/Allure reports
+    STREAM_REPORT = True                    # Stream results to JSONL as tests finish (see utils/stream_report.py)
+    STREAM_REPORT_DIR = "reports/stream"    # results.jsonl + index.html viewer
+    STREAM_REPORT_MAX_TRACEBACK = 20000     # Characters of failure output kept per test
+    
+    # Data-driven test settings (see utils/data_provider.py)
+    SYNTHETIC_DATASET_SIZE = 5   # Records per synthetic dataset (or pass --dataset-size)
+    SYNTHETIC_DATASET_SEED = 0   # Same seed, same records on every run and every worker
+    
+    # Authenticated session cache (see utils/session_cache.py)
+    USE_SESSION_CACHE = True                # Log in through the UI once per credential set, then replay the session
+    SESSION_CACHE_PATH = ".session_cache"   # Directory holding the cached sessions (contains auth tokens)
+    SESSION_CACHE_TTL = 1800                # Seconds a cached session is trusted, capped by its cookies' expiry
+    SESSION_BOOTSTRAP_PATH = "/favicon.ico" # Lightweight same-origin page used to write state in non-Chromium browsers
     
     # Test data - Default credentials
     VALID_USERNAME = "testuser"
     VALID_PASSWORD = "Test@123"
     
-    # Page URLs - constructed dynamically using the BASE_URL
+    # Page URLs - constructed dynamically using the BASE_URL (config/settings.py recomputes them when a
+    # profile, QA_BASE_URL or --set BASE_URL=... changes the base)
     LOGIN_URL = f"{BASE_URL}/login"
+    PROFILE_URL = f"{BASE_URL}/profile"
     TEXT_BOX_URL = f"{BASE_URL}/text-box"
     BUTTONS_URL = f"{BASE_URL}/buttons"
     WEB_TABLES_URL = f"{BASE_URL}/webtables"
     FORMS_URL = f"{BASE_URL}/automation-practice-form"
+    
+    # Performance budgets per page, checked when COLLECT_PAGE_METRICS is on (timings in ms).
+    # Any metric collected by utils/page_metrics.py can be budgeted, e.g. "resource_bytes" or "cumulative_layout_shift".
+    PERFORMANCE_BUDGETS = {
+        LOGIN_URL: {"load": 8000, "first_contentful_paint": 3000, "largest_contentful_paint": 4000},
+        TEXT_BOX_URL: {"load": 8000, "first_contentful_paint": 3000, "largest_contentful_paint": 4000},
+        BUTTONS_URL: {"load": 8000, "first_contentful_paint": 3000, "largest_contentful_paint": 4000},
+        WEB_TABLES_URL: {"load": 8000, "first_contentful_paint": 3000, "largest_contentful_paint": 4000},
+        FORMS_URL: {"load": 10000, "first_contentful_paint": 3000, "largest_contentful_paint": 5000},
+    }
@@ -0,0 +1,237 @@
+"""
+Layered settings - profiles, environment variables and command line values resolved once per session
+into an immutable snapshot, then applied to Config in place.
+
+Layers, lowest precedence first:
+    1. Config class defaults (config/config.py)
+    2. Profile file config/profiles/<name>.json (--profile NAME or QA_PROFILE=NAME); its "workers"
+       section holds per-worker overrides keyed by xdist worker id ("gw0") or "*" for every worker
+    3. Environment variables QA_<NAME>, e.g. QA_HEADLESS=true QA_BASE_URL=http://localhost:3000
+    4. Command line values (--set NAME=VALUE and the dedicated pytest options)
+
+String values may use {worker} (xdist worker id, "main" without xdist) and {worker_index}, e.g.
+"http://localhost:30{worker_index:02d}" gives every worker its own replica. URLs derived from BASE_URL
+(LOGIN_URL, ..., the PERFORMANCE_BUDGETS keys) follow the active BASE_URL unless set explicitly.
+
+Every module reads Config.<NAME>, so switching profiles is Settings.activate(Settings.resolve(...))
+with no re-import.
+
+    python -m config.settings --profile ci --set BROWSER=firefox   # print the resolved settings
+"""
+import argparse
+import copy
+import json
+import os
+import re
+from config.config import Config
+
+ENV_PREFIX = "QA_"
+PROFILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+
+# Config as defined in config.py, before any profile was applied
+DEFAULTS = {name: copy.deepcopy(value) for name, value in vars(Config).items() if name.isupper()}
+
+# {worker} / {worker_index} fields with an optional format spec; other braces are kept as they are
+_WORKER_FIELD = re.compile(r"\{(worker|worker_index)(?::([^{}]*))?\}")
+
+_TRUE = {"1", "true", "yes", "on"}
+_FALSE = {"0", "false", "no", "off"}
+
+
+class Settings:
+    """Immutable snapshot of resolved settings; read values as attributes (settings.BASE_URL)"""
+
+    _cache = {}      # Resolution inputs -> Settings, so switching back to a profile costs nothing
+    _active = None  # Settings last applied to Config
+
+    def __init__(self, values, profile=None, worker="main", sources=None):
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "profile", profile)
+        object.__setattr__(self, "worker", worker)
+        object.__setattr__(self, "sources", sources or {})  # Name -> layer that set it
+
+    def __getattr__(self, name):
+        try:
+            value = self._values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return copy.deepcopy(value) if isinstance(value, (dict, list, set)) else value
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Settings are immutable; resolve a new snapshot instead")
+
+    def as_dict(self):
+        """
+        Returns:
+            dict: Copy of all setting values
+        """
+        return copy.deepcopy(self._values)
+
+    @staticmethod
+    def resolve(profile=None, overrides=None, environ=None, worker=None):
+        """
+        Resolve the settings layers; results are cached per set of inputs.
+
+        Args:
+            profile (str): Profile name in config/profiles (defaults to QA_PROFILE)
+            overrides (dict): Command line values, by setting name (strings are parsed like env values)
+            environ (dict): Environment to read (defaults to os.environ)
+            worker (str): xdist worker id (defaults to PYTEST_XDIST_WORKER, or "main")
+
+        Returns:
+            Settings: Resolved snapshot
+
+        Raises:
+            ValueError: Unknown setting name or missing profile
+        """
+        environ = os.environ if environ is None else environ
+        profile = profile or environ.get(f"{ENV_PREFIX}PROFILE") or None
+        worker = worker or environ.get("PYTEST_XDIST_WORKER") or "main"
+        env = {name[len(ENV_PREFIX):]: value for name, value in environ.items()
+               if name.startswith(ENV_PREFIX) and name[len(ENV_PREFIX):] in DEFAULTS}
+        overrides = overrides or {}
+        key = (profile, worker, json.dumps(env, sort_keys=True), json.dumps(overrides, sort_keys=True, default=repr))
+        if key not in Settings._cache:
+            Settings._cache[key] = Settings._resolve(profile, worker, env, overrides)
+        return Settings._cache[key]
+
+    @staticmethod
+    def _resolve(profile, worker, env, overrides):
+        layers = []
+        if profile:
+            data = Settings.load_profile(profile)
+            workers = data.pop("workers", {})
+            layers.append((f"profile {profile}", data))
+            layers.append((f"profile {profile} (all workers)", workers.get("*", {})))
+            layers.append((f"profile {profile} ({worker})", workers.get(worker, {})))
+        layers.append(("environment", {name: _parse(value, DEFAULTS[name]) for name, value in env.items()}))
+        layers.append(("command line", {name: _parse(value, DEFAULTS.get(name)) if isinstance(value, str) else value
+                                        for name, value in overrides.items()}))
+
+        values = copy.deepcopy(DEFAULTS)
+        sources = {}
+        fields = {"worker": worker, "worker_index": int(re.sub(r"\D", "", worker) or 0)}
+        for source, layer in layers:
+            for name, value in layer.items():
+                if name not in DEFAULTS:
+                    raise ValueError(f"Unknown setting '{name}' in {source}")
+                if isinstance(value, list):
+                    value = tuple(value)  # JSON has no tuples; Config uses them, e.g. WINDOW_SIZE
+                if isinstance(value, str):
+                    try:
+                        value = _WORKER_FIELD.sub(lambda field: format(fields[field.group(1)], field.group(2) or ""), value)
+                    except ValueError as error:
+                        raise ValueError(f"Invalid worker field in {name} from {source}: {error}")
+                values[name] = value
+                sources[name] = source
+
+        # URLs derived from BASE_URL follow the active base unless they were set explicitly
+        default_base, base = DEFAULTS["BASE_URL"], values["BASE_URL"].rstrip("/")
+        if base != default_base:
+            values["BASE_URL"] = base
+            for name, value in values.items():
+                if name.endswith("_URL") and name not in sources and isinstance(value, str):
+                    values[name] = _rebase(value, default_base, base)
+            values["PERFORMANCE_BUDGETS"] = {_rebase(url, default_base, base): budget
+                                             for url, budget in values["PERFORMANCE_BUDGETS"].items()}
+        return Settings(values, profile, worker, sources)
+
+    @staticmethod
+    def load_profile(name):
+        """
+        Args:
+            name (str): Profile name, or path to a profile JSON file
+
+        Returns:
+            dict: Setting values of the profile ("description" removed)
+
+        Raises:
+            ValueError: The profile does not exist
+        """
+        path = name if name.endswith(".json") else os.path.join(PROFILE_PATH, f"{name}.json")
+        if not os.path.isfile(path):
+            available = sorted(f[:-5] for f in os.listdir(PROFILE_PATH) if f.endswith(".json"))
+            raise ValueError(f"Profile '{name}' not found (available: {', '.join(available)})")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data.pop("description", None)
+        return data
+
+    @staticmethod
+    def activate(settings):
+        """
+        Apply a snapshot to Config in place; every module sees the new values without re-importing.
+
+        Args:
+            settings (Settings): Resolved snapshot
+        """
+        for name, value in settings.as_dict().items():
+            setattr(Config, name, value)
+        Settings._active = settings
+
+    @staticmethod
+    def current():
+        """
+        Returns:
+            Settings: Snapshot last applied to Config (resolved from the environment when none was)
+        """
+        if Settings._active is None:
+            Settings.activate(Settings.resolve())
+        return Settings._active
+
+
+def _parse(value, default):
+    """Parse an environment / command line string according to the type of the default value."""
+    if isinstance(default, bool):
+        if value.lower() in _TRUE | _FALSE:
+            return value.lower() in _TRUE
+        raise ValueError(f"Expected a boolean, got '{value}'")
+    if value.lower() in ("none", "null"):
+        return None
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        parsed = value
+    if isinstance(default, (int, float)) and not isinstance(parsed, (int, float)):
+        raise ValueError(f"Expected a number, got '{value}'")
+    if isinstance(parsed, list):
+        return tuple(parsed)
+    return value if isinstance(default, str) and not isinstance(parsed, dict) else parsed
+
+
+def _rebase(url, default_base, base):
+    return base + url[len(default_base):] if url.startswith(default_base) else url
+
+
+def parse_assignments(assignments):
+    """
+    Args:
+        assignments (list): "NAME=VALUE" strings
+
+    Returns:
+        dict: Values by setting name
+    """
+    values = {}
+    for assignment in assignments or []:
+        name, separator, value = assignment.partition("=")
+        if not separator:
+            raise ValueError(f"Expected NAME=VALUE, got '{assignment}'")
+        values[name.strip().upper()] = value
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the resolved settings")
+    parser.add_argument("--profile", help="Profile in config/profiles")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="Override a setting")
+    parser.add_argument("--worker", help="Resolve as this xdist worker, e.g. gw1")
+    args = parser.parse_args()
+
+    settings = Settings.resolve(args.profile, parse_assignments(args.set), worker=args.worker)
+    for name, value in sorted(settings.as_dict().items()):
+        source = settings.sources.get(name)
+        print(f"{name} = {value!r}" + (f"    # {source}" if source else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,9 @@ class FormsLocators:
     MOBILE_INPUT = (By.ID, "userNumber")
     DATE_OF_BIRTH_INPUT = (By.ID, "dateOfBirthInput")
     
-    # Subjects is an auto-complete field
+    # Subjects is an auto-complete field (react-select; its menu and values use this class prefix)
     SUBJECTS_INPUT = (By.ID, "subjectsInput")
+    SUBJECTS_CLASS_PREFIX = "subjects-auto-complete"
     
     # Hobbies checkboxes
     HOBBIES_SPORTS = (By.CSS_SELECTOR, "label[for='hobbies-checkbox-1']")
@@ -17,3 +17,5 @@ class WebTablesLocators:
     TABLE_ROWS = (By.CSS_SELECTOR, ".rt-tr-group")
     EDIT_BUTTONS = (By.CSS_SELECTOR, "span[title='Edit']")
     DELETE_BUTTONS = (By.CSS_SELECTOR, "span[title='Delete']")
+    # Template: format with email=...; scoped to the table body so the header is not scanned
+    RECORD_CELL = (By.XPATH, "//div[@class='rt-tbody']//div[@class='rt-td' and contains(text(), '{email}')]")
@@ -0,0 +1,16 @@
+from selenium.webdriver.common.by import By
+
+class DatePickerLocators:
+    """Locators for the react-datepicker calendar (date of birth on the practice form)"""
+    POPUP = (By.CSS_SELECTOR, ".react-datepicker")
+    MONTH_SELECT = (By.CSS_SELECTOR, ".react-datepicker__month-select")
+    YEAR_SELECT = (By.CSS_SELECTOR, ".react-datepicker__year-select")
+    
+    # Day cell of the displayed month - format with the day number; days of the neighbouring months are excluded
+    DAY = (By.CSS_SELECTOR, ".react-datepicker__day--{day:03d}:not(.react-datepicker__day--outside-month)")
+
+class AutocompleteLocators:
+    """Locators for react-select auto-complete fields - format with the field's class prefix"""
+    MENU = (By.CSS_SELECTOR, ".{prefix}__menu")
+    OPTION = (By.CSS_SELECTOR, ".{prefix}__option")
+    SELECTED_VALUE = (By.CSS_SELECTOR, ".{prefix}__multi-value__label")
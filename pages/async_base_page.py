@@ -0,0 +1,386 @@
+"""
+Async Base Page class - asyncio counterpart of BasePage driven over the DevTools protocol.
+Locator tuples from locators/ are reused as-is, so async page objects share them with the sync ones.
+"""
+import asyncio  # Event loop primitives for non-blocking waits
+import base64  # Screenshot payload decoding
+import collections  # Recent document loads
+import json  # Serializing locator values into JavaScript
+import os  # Operations with the operating system
+import time  # Monotonic clock for wait deadlines
+from datetime import datetime  # Date and time operations
+from selenium.common.exceptions import TimeoutException  # Same exception type as the sync page objects
+from config.config import Config  # Import configuration constants
+from utils.logger import Logger  # Import Logger class
+
+
+# Resolves a Selenium (By.TYPE, "value") locator to a DOM node inside the page
+FIND_ELEMENT_JS = """
+(strategy, value) => {
+    switch (strategy) {
+        case 'id': return document.getElementById(value);
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'link text':
+            return Array.from(document.links).find(a => a.textContent.trim() === value) || null;
+        case 'partial link text':
+            return Array.from(document.links).find(a => a.textContent.includes(value)) || null;
+    }
+    throw new Error('Unsupported locator strategy: ' + strategy);
+}
+"""
+
+# Returns true when the element is rendered and not disabled
+IS_CLICKABLE_JS = "function() { return this.getClientRects().length > 0 && !this.disabled; }"
+IS_DISPLAYED_JS = "function() { return this.getClientRects().length > 0; }"
+SCROLL_AND_CENTER_JS = """
+function() {
+    this.scrollIntoView({block: 'center'});
+    const rect = this.getBoundingClientRect();
+    return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2};
+}
+"""
+
+
+class AsyncBasePage:
+    """Base class for async page objects. Every method is a coroutine, so one event loop can drive many pages."""
+
+    # Interval (in seconds) between condition checks in explicit waits
+    POLL_INTERVAL = 0.1
+    # Object group of the located elements' remote objects, so the page can release them
+    OBJECT_GROUP = "async-page-elements"
+
+    def __init__(self, connection, session_id):
+        """
+        Initialize AsyncBasePage with a DevTools session.
+        Use AsyncBrowser.new_page() to create page objects instead of calling this directly.
+
+        Args:
+            connection (CDPConnection): Shared DevTools connection
+            session_id (str): Session of the tab this page object drives
+        """
+        self.connection = connection
+        self.session_id = session_id
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._loads = {}  # loaderId -> future of the document load open() waits for
+        self._loaded = collections.deque(maxlen=50)  # loaderIds of documents loaded before open() waited
+        self._lifecycle_events = False
+
+    async def send(self, method, params=None):
+        """Send a DevTools command to this page's tab."""
+        return await self.connection.send(method, params, session_id=self.session_id)
+
+    async def evaluate(self, expression):
+        """
+        Evaluate a JavaScript expression in the page and return its value.
+
+        Args:
+            expression (str): JavaScript expression
+
+        Returns:
+            Value of the expression
+        """
+        response = await self.send("Runtime.evaluate", {
+            "expression": expression, "returnByValue": True, "awaitPromise": True
+        })
+        return response["result"].get("value")
+
+    async def call_function_on(self, object_id, function, *args):
+        """
+        Call a JavaScript function with 'this' bound to an element.
+
+        Args:
+            object_id (str): Remote object id returned by find_element
+            function (str): JavaScript function declaration
+            *args: JSON-serializable arguments
+
+        Returns:
+            Return value of the function
+        """
+        response = await self.send("Runtime.callFunctionOn", {
+            "objectId": object_id,
+            "functionDeclaration": function,
+            "arguments": [{"value": arg} for arg in args],
+            "returnByValue": True,
+        })
+        return response["result"].get("value")
+
+    async def wait_until(self, condition, timeout=None, message=""):
+        """
+        Await a condition coroutine until it returns a truthy value.
+
+        Args:
+            condition (callable): Zero-argument coroutine function
+            timeout (int): Custom timeout in seconds (defaults to Config.EXPLICIT_WAIT)
+            message (str): Message of the TimeoutException
+
+        Returns:
+            The first truthy value returned by the condition
+        """
+        timeout = timeout or Config.EXPLICIT_WAIT
+        deadline = time.monotonic() + timeout
+        while True:
+            value = await condition()
+            if value:
+                return value
+            if time.monotonic() >= deadline:
+                raise TimeoutException(message or f"Condition not met within {timeout}s")
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+    async def _query(self, locator):
+        """Look the locator up once. Returns the remote object id or None."""
+        strategy, value = locator
+        response = await self.send("Runtime.evaluate", {
+            "expression": f"({FIND_ELEMENT_JS})({json.dumps(strategy)}, {json.dumps(value)})",
+            "objectGroup": self.OBJECT_GROUP,
+        })
+        if "exceptionDetails" in response:
+            raise ValueError(f"Invalid locator {locator}: {response['exceptionDetails'].get('text')}")
+        return response["result"].get("objectId")
+
+    async def find_element(self, locator, timeout=None):
+        """
+        Find a single element with explicit wait.
+        Waits until the element is present in the DOM.
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+            timeout (int): Custom timeout in seconds (optional)
+
+        Returns:
+            str: Remote object id of the element; pass it to release_element() once done with it
+                (navigating away releases it too)
+        """
+        try:
+            object_id = await self.wait_until(
+                lambda: self._query(locator), timeout, f"Element not found: {locator}"
+            )
+            self.logger.debug(f"Element found: {locator}")
+            return object_id
+        except TimeoutException:
+            self.logger.error(f"Element not found: {locator}")
+            raise
+
+    async def wait_for_element(self, locator, timeout=None):
+        """
+        Wait for an element to be present, allowing custom timeout.
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+            timeout (int): Custom timeout in seconds (optional)
+
+        Returns:
+            str: Remote object id of the element
+        """
+        return await self.find_element(locator, timeout)
+
+    async def release_element(self, object_id):
+        """
+        Release the remote object of an element returned by find_element.
+
+        Args:
+            object_id (str): Remote object id
+        """
+        await self.send("Runtime.releaseObject", {"objectId": object_id})
+
+    async def release_elements(self):
+        """Release the remote objects of every element located on this page."""
+        await self.send("Runtime.releaseObjectGroup", {"objectGroup": self.OBJECT_GROUP})
+
+    async def _element_center(self, locator):
+        """Wait until the element is clickable, scroll it into view and return its center point."""
+        async def clickable_center():
+            object_id = await self._query(locator)
+            if not object_id:
+                return None
+            try:
+                if await self.call_function_on(object_id, IS_CLICKABLE_JS):
+                    return await self.call_function_on(object_id, SCROLL_AND_CENTER_JS)
+                return None
+            finally:
+                await self.release_element(object_id)  # Every poll locates the element anew
+
+        return await self.wait_until(clickable_center, message=f"Element not clickable: {locator}")
+
+    async def _dispatch_click(self, point, button="left", click_count=1):
+        """Send native mouse press/release events at a point."""
+        base = {"x": point["x"], "y": point["y"], "button": button}
+        await self.send("Input.dispatchMouseEvent", {**base, "type": "mouseMoved", "button": "none"})
+        for count in range(1, click_count + 1):
+            await self.send("Input.dispatchMouseEvent", {**base, "type": "mousePressed", "clickCount": count})
+            await self.send("Input.dispatchMouseEvent", {**base, "type": "mouseReleased", "clickCount": count})
+
+    async def click(self, locator):
+        """
+        Click on an element.
+        Waits until the element is clickable before clicking.
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+        """
+        await self._dispatch_click(await self._element_center(locator))
+        self.logger.info(f"Clicked on element: {locator}")
+
+    async def double_click(self, locator):
+        """
+        Double click on an element.
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+        """
+        await self._dispatch_click(await self._element_center(locator), click_count=2)
+        self.logger.info(f"Double clicked on element: {locator}")
+
+    async def context_click(self, locator):
+        """
+        Right click (context click) on an element.
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+        """
+        await self._dispatch_click(await self._element_center(locator), button="right")
+        self.logger.info(f"Right clicked on element: {locator}")
+
+    async def send_keys(self, locator, text, clear_first=True):
+        """
+        Type text into an input field.
+        Optionally clears the field first.
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+            text (str): Text to type
+            clear_first (bool): Clear field before typing (default: True)
+        """
+        object_id = await self.find_element(locator)
+        await self.call_function_on(object_id, "function() { this.focus(); }")
+        if clear_first:
+            # Select the current value so the typed text replaces it (works with React controlled inputs)
+            await self.call_function_on(object_id, "function() { if (this.select) { this.select(); } }")
+            await self.send("Input.dispatchKeyEvent", {
+                "type": "keyDown", "key": "Delete", "code": "Delete", "windowsVirtualKeyCode": 46
+            })
+            await self.send("Input.dispatchKeyEvent", {"type": "keyUp", "key": "Delete", "code": "Delete"})
+        await self.send("Input.insertText", {"text": text})
+        await self.release_element(object_id)
+        self.logger.info(f"Typed '{text}' into element: {locator}")
+
+    async def get_text(self, locator):
+        """
+        Get the visible text from an element.
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+
+        Returns:
+            str: Element text
+        """
+        object_id = await self.find_element(locator)
+        text = await self.call_function_on(object_id, "function() { return this.innerText; }")
+        await self.release_element(object_id)
+        self.logger.debug(f"Got text '{text}' from element: {locator}")
+        return text
+
+    async def is_displayed(self, locator):
+        """
+        Check if an element is currently displayed (visible) on the page.
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+
+        Returns:
+            bool: True if displayed, False otherwise
+        """
+        try:
+            object_id = await self.find_element(locator)
+            is_visible = await self.call_function_on(object_id, IS_DISPLAYED_JS)
+            await self.release_element(object_id)
+            self.logger.debug(f"Element {locator} displayed: {is_visible}")
+            return bool(is_visible)
+        except TimeoutException:
+            return False
+
+    async def scroll_to_element(self, locator):
+        """
+        Scroll the page view until the element is visible.
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+        """
+        object_id = await self.find_element(locator)
+        await self.call_function_on(object_id, "function() { this.scrollIntoView(true); }")
+        await self.release_element(object_id)
+        self.logger.debug(f"Scrolled to element: {locator}")
+
+    async def open(self, url):
+        """
+        Navigate the tab to a URL and wait until the new document fired its load event. The wait is on
+        the loader of this navigation, so re-opening the current URL does not return on the old document.
+
+        Args:
+            url (str): URL to open
+        """
+        if not self._lifecycle_events:
+            self.connection.on("Page.lifecycleEvent", self._on_lifecycle_event, session_id=self.session_id)
+            await self.send("Page.setLifecycleEventsEnabled", {"enabled": True})
+            self._lifecycle_events = True
+        navigation = await self.send("Page.navigate", {"url": url})
+        loader_id = navigation.get("loaderId")  # None for a same-document (fragment) navigation
+        if loader_id and loader_id not in self._loaded:
+            self._loads[loader_id] = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.wait_for(self._loads[loader_id], Config.PAGE_LOAD_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise TimeoutException(f"Page did not load: {url}") from None
+            finally:
+                del self._loads[loader_id]
+        self.logger.info(f"Navigated to: {url}")
+
+    def _on_lifecycle_event(self, params):
+        if params["name"] != "load":
+            return
+        future = self._loads.get(params["loaderId"])
+        if future is None:
+            self._loaded.append(params["loaderId"])  # Loaded before open() got the navigation's loaderId
+        elif not future.done():
+            future.set_result(None)
+
+    async def take_screenshot(self, name="screenshot"):
+        """
+        Capture a screenshot and save it to the screenshots directory.
+
+        Args:
+            name (str): Prefix name for the screenshot file
+
+        Returns:
+            str: File path of the saved screenshot
+        """
+        os.makedirs(Config.SCREENSHOT_PATH, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = os.path.join(Config.SCREENSHOT_PATH, f"{name}_{timestamp}.png")
+        response = await self.send("Page.captureScreenshot", {"format": "png"})
+        with open(filepath, "wb") as screenshot:
+            screenshot.write(base64.b64decode(response["data"]))
+        self.logger.info(f"Screenshot saved: {filepath}")
+        return filepath
+
+    async def get_current_url(self):
+        """
+        Get the current active page URL.
+
+        Returns:
+            str: Current URL
+        """
+        return await self.evaluate("location.href")
+
+    async def get_title(self):
+        """
+        Get the current page title.
+
+        Returns:
+            str: Page title
+        """
+        return await self.evaluate("document.title")
@@ -0,0 +1,71 @@
+"""
+Async Buttons Page Object - Elements > Buttons
+Async counterpart of ButtonsPage, sharing its locators.
+"""
+from config.config import Config  # Page URL
+from pages.async_base_page import AsyncBasePage  # Async base class
+from locators.buttons_locators import ButtonsLocators
+
+
+class AsyncButtonsPage(AsyncBasePage):
+    """Async Page Object for Buttons Page. Native mouse events replace ActionChains."""
+
+    async def navigate_to_buttons(self):
+        """
+        Navigate to the buttons page.
+        """
+        await self.open(Config.BUTTONS_URL)
+
+    async def double_click_button(self):
+        """
+        Perform a double click action on the double click button.
+        """
+        await self.double_click(ButtonsLocators.DOUBLE_CLICK_BUTTON)
+
+    async def right_click_button(self):
+        """
+        Perform a right click (context click) action.
+        """
+        await self.context_click(ButtonsLocators.RIGHT_CLICK_BUTTON)
+
+    async def click_dynamic_button(self):
+        """
+        Click on the dynamic button (simple click).
+        """
+        await self.click(ButtonsLocators.DYNAMIC_CLICK_BUTTON)
+
+    async def get_double_click_message(self):
+        """
+        Get the success message displayed after double click.
+
+        Returns:
+            str: Message text
+        """
+        return await self.get_text(ButtonsLocators.DOUBLE_CLICK_MESSAGE)
+
+    async def get_right_click_message(self):
+        """
+        Get the success message displayed after right click.
+
+        Returns:
+            str: Message text
+        """
+        return await self.get_text(ButtonsLocators.RIGHT_CLICK_MESSAGE)
+
+    async def get_dynamic_click_message(self):
+        """
+        Get the success message displayed after dynamic click.
+
+        Returns:
+            str: Message text
+        """
+        return await self.get_text(ButtonsLocators.DYNAMIC_CLICK_MESSAGE)
+
+    async def is_double_click_message_displayed(self):
+        """
+        Check if double click message is displayed.
+
+        Returns:
+            bool: True if displayed
+        """
+        return await self.is_displayed(ButtonsLocators.DOUBLE_CLICK_MESSAGE)
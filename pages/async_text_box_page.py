@@ -0,0 +1,54 @@
+"""
+Async Text Box Page Object - Elements > Text Box
+Async counterpart of TextBoxPage, sharing its locators.
+"""
+from config.config import Config  # Page URL
+from pages.async_base_page import AsyncBasePage  # Async base class
+from locators.text_box_locators import TextBoxLocators
+
+
+class AsyncTextBoxPage(AsyncBasePage):
+    """Async Page Object for Text Box Page."""
+
+    async def navigate_to_text_box(self):
+        """
+        Navigate to the text box page using the URL from config.
+        """
+        await self.open(Config.TEXT_BOX_URL)
+
+    async def fill_form(self, full_name, email, current_address, permanent_address):
+        """
+        Fill the complete text box form with provided data.
+
+        Args:
+            full_name (str): Full name
+            email (str): Email address
+            current_address (str): Current address
+            permanent_address (str): Permanent address
+        """
+        self.logger.info("Filling text box form")
+        await self.send_keys(TextBoxLocators.FULL_NAME_INPUT, full_name)
+        await self.send_keys(TextBoxLocators.EMAIL_INPUT, email)
+        await self.send_keys(TextBoxLocators.CURRENT_ADDRESS_INPUT, current_address)
+        await self.send_keys(TextBoxLocators.PERMANENT_ADDRESS_INPUT, permanent_address)
+        await self.click(TextBoxLocators.SUBMIT_BUTTON)
+
+    async def is_output_displayed(self):
+        """
+        Check if the output area is displayed after submission.
+
+        Returns:
+            bool: True if output is displayed, False otherwise
+        """
+        return await self.is_displayed(TextBoxLocators.OUTPUT_BOX)
+
+    async def get_output_text(self):
+        """
+        Get the complete text content of the output area.
+
+        Returns:
+            str: Output text if displayed, empty string otherwise
+        """
+        if await self.is_output_displayed():
+            return await self.get_text(TextBoxLocators.OUTPUT_BOX)
+        return ""
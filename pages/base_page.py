@@ -6,14 +6,34 @@ import time  # Time operations for delays
 from datetime import datetime  # Date and time operations
 from selenium.webdriver.support.ui import WebDriverWait  # Explicit waits
 from selenium.webdriver.support import expected_conditions as EC  # Expected conditions for waits
-from selenium.common.exceptions import TimeoutException, NoSuchElementException  # Exception handling
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException  # Exception handling
 from config.config import Config  # Import configuration constants
+from utils.action_batch import ActionBatch  # Several actions in one or two WebDriver commands
+from utils.artifact_store import ArtifactStore  # Deduplicated screenshot storage
+from utils.browser_events import BrowserEvents  # Buffered console and network errors
+from utils.circuit_breaker import CircuitBreaker  # Fail fast while the application is down
+from utils.command_recorder import CommandRecorder  # Trace of actions for replaying failed tests
+from utils.locator_registry import LocatorRegistry  # CSS form of XPath locators
 from utils.logger import Logger  # Import Logger class
+from utils.metrics import Metrics  # Action and navigation latency for --metrics
+from utils.page_metrics import PageMetrics  # Navigation Timing / Web Vitals for --page-metrics
+from utils.page_reuse import PageReuse  # Navigation statistics for --reuse-pages
 
 
 class BasePage:
     """Base class for all page objects, providing wrapper methods for Selenium actions"""
     
+    # Whether reset_page() can return this page to a clean state without reloading it (see utils/page_reuse.py)
+    REUSABLE = False
+    
+    # Cheap in-page reset: close open modals, clear forms, drop focus and scroll back to the top
+    RESET_PAGE_JS = """
+        document.querySelectorAll('.modal.show .close, .modal.show [id^=close]').forEach(b => b.click());
+        document.querySelectorAll('form').forEach(form => form.reset());
+        if (document.activeElement) document.activeElement.blur();
+        window.scrollTo(0, 0);
+    """
+    
     def __init__(self, driver):
         """
         Initialize BasePage with the WebDriver instance
@@ -27,6 +47,50 @@ class BasePage:
         # Initialize logger for this class
         self.logger = Logger.get_logger(self.__class__.__name__)
     
+    @CommandRecorder.recorded
+    def navigate(self, url):
+        """
+        Open a page of the application through the circuit breaker.
+        Fails immediately while the application is known to be down instead of waiting out the page load timeout.
+        With Config.REUSE_PAGES, a reusable page that is already loaded is reset in place instead.
+        
+        Args:
+            url (str): URL to open
+        """
+        if Config.REUSE_PAGES and self.REUSABLE and self.driver.current_url == url:
+            # The previous test left this page loaded - reset it in place instead of reloading
+            self.reset_page()
+            PageReuse.count_navigation(saved=True)
+            return
+        breaker = CircuitBreaker.shared()
+        if Config.CIRCUIT_BREAKER_ENABLED:
+            breaker.check()
+        PageReuse.count_navigation(saved=False)
+        start = time.perf_counter()
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            breaker.record_failure(f"{url} did not load within {Config.PAGE_LOAD_TIMEOUT}s")
+            raise
+        except WebDriverException as error:
+            # Connection errors (net::ERR_..., Reached error page) - not a problem of the test itself
+            breaker.record_failure(f"{url}: {error.msg}")
+            raise
+        breaker.record_success()
+        Metrics.record(Metrics.navigation, time.perf_counter() - start, url=url)
+        if Config.COLLECT_PAGE_METRICS:
+            PageMetrics.record(self.driver, url)
+    
+    def reset_page(self):
+        """
+        Return the loaded page to a clean state without reloading it.
+        Page objects with REUSABLE = True may override this with page-specific cleanup.
+        """
+        self.driver.execute_script(self.RESET_PAGE_JS)
+        self.logger.debug(f"Reset page in place: {self.driver.current_url}")
+    
+    @CommandRecorder.recorded
+    @Metrics.timed_action
     def find_element(self, locator):
         """
         Find a single element with explicit wait.
@@ -38,6 +102,7 @@ class BasePage:
         Returns:
             WebElement: Found element
         """
+        locator = LocatorRegistry.preferred(locator)  # CSS when the XPath has an equivalent
         try:
             # Wait until element is located
             element = self.wait.until(EC.presence_of_element_located(locator))
@@ -48,6 +113,8 @@ class BasePage:
             self.logger.error(f"Element not found: {locator}")
             raise
     
+    @CommandRecorder.recorded
+    @Metrics.timed_action
     def find_elements(self, locator):
         """
         Find multiple elements with explicit wait.
@@ -58,6 +125,7 @@ class BasePage:
         Returns:
             list: List of WebElements. Returns empty list if none found.
         """
+        locator = LocatorRegistry.preferred(locator)  # CSS when the XPath has an equivalent
         try:
             # Wait until all elements are present
             elements = self.wait.until(EC.presence_of_all_elements_located(locator))
@@ -67,6 +135,8 @@ class BasePage:
             self.logger.error(f"Elements not found: {locator}")
             return []
     
+    @CommandRecorder.recorded
+    @Metrics.timed_action
     def click(self, locator):
         """
         Click on an element.
@@ -75,6 +145,7 @@ class BasePage:
         Args:
             locator (tuple): Locator tuple (By.TYPE, "value")
         """
+        locator = LocatorRegistry.preferred(locator)  # CSS when the XPath has an equivalent
         # Wait until element is visible and enabled
         element = self.wait.until(EC.element_to_be_clickable(locator))
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
@@ -82,6 +153,8 @@ class BasePage:
         element.click()
         self.logger.info(f"Clicked on element: {locator}")
     
+    @CommandRecorder.recorded
+    @Metrics.timed_action
     def send_keys(self, locator, text, clear_first=True):
         """
         Type text into an input field.
@@ -100,6 +173,8 @@ class BasePage:
         self.logger.info(f"Typed '{text}' into element: {locator}")
         time.sleep(0.5)  # Small delay after typing
     
+    @CommandRecorder.recorded
+    @Metrics.timed_action
     def get_text(self, locator):
         """
         Get the visible text from an element.
@@ -115,6 +190,8 @@ class BasePage:
         self.logger.debug(f"Got text '{text}' from element: {locator}")
         return text
     
+    @CommandRecorder.recorded
+    @Metrics.timed_action
     def is_displayed(self, locator):
         """
         Check if an element is currently displayed (visible) on the page.
@@ -133,6 +210,21 @@ class BasePage:
         except (TimeoutException, NoSuchElementException):
             return False
     
+    def batch(self, synthetic=None, timeout=None):
+        """
+        Start a batch of actions sent to the browser together (see utils/action_batch.py).
+        
+        Args:
+            synthetic (bool): Dispatch DOM events instead of native input (defaults to Config.SYNTHETIC_ACTIONS)
+            timeout (int): Seconds to wait for elements and expected results (optional)
+            
+        Returns:
+            ActionBatch: Chainable batch; call perform() to run it
+        """
+        return ActionBatch(self.driver, synthetic, timeout)
+    
+    @CommandRecorder.recorded
+    @Metrics.timed_action
     def wait_for_element(self, locator, timeout=None):
         """
         Specific wait for an element to be present, allowing custom timeout.
@@ -146,18 +238,25 @@ class BasePage:
         """
         timeout = timeout or Config.EXPLICIT_WAIT
         wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_element_located(locator))
+        return wait.until(EC.presence_of_element_located(LocatorRegistry.preferred(locator)))
     
+    @Metrics.timed_action
     def take_screenshot(self, name="screenshot"):
         """
-        Capture a screenshot and save it to the screenshots directory.
+        Capture a screenshot and save it to the artifact store, or to the screenshots directory
+        when the store is disabled.
         
         Args:
             name (str): Prefix name for the screenshot file
             
         Returns:
-            str: Absolute file path of the saved screenshot
+            str: File path of the saved screenshot
         """
+        if Config.ARTIFACT_STORE:
+            # Named by content hash: repeated identical screenshots take no extra space
+            filepath = ArtifactStore().put(self.driver.get_screenshot_as_png(), "screenshot", name)
+            self.logger.info(f"Screenshot saved: {filepath}")
+            return filepath
         # Create directory if it doesn't exist
         os.makedirs(Config.SCREENSHOT_PATH, exist_ok=True)
         # Generate timestamp for unique filename
@@ -169,6 +268,65 @@ class BasePage:
         self.logger.info(f"Screenshot saved: {filepath}")
         return filepath
     
+    @Metrics.timed_action
+    def assert_visual_match(self, name, regions=None, ignore=None):
+        """
+        Compare the current viewport with its stored baseline (see utils/visual_diff.py).
+        The first run, or a run with --update-baselines, saves the baseline instead.
+        
+        Args:
+            name (str): Baseline name, unique per page state
+            regions (list): Dicts with "name", "box" (x, y, width, height) and "threshold"; whole page if omitted
+            ignore (list): Locator tuples or (x, y, width, height) boxes to exclude, e.g. ad slots
+            
+        Returns:
+            VisualDiffResult: Comparison result
+        """
+        from utils.visual_diff import VisualDiff  # Imported here: NumPy and Pillow are only needed for visual checks
+        boxes = [self._element_box(area) if isinstance(area[0], str) else area for area in ignore or []]
+        result = VisualDiff.check(name, self.driver.get_screenshot_as_png(), regions, boxes)
+        self.logger.info(f"Visual check {result!r}")
+        assert result.passed, f"Visual check failed: {result!r}"
+        return result
+    
+    def browser_errors(self, kind=None, ignore=()):
+        """
+        Get the console errors, uncaught exceptions and failed requests of the current test (Chromium only).
+        Events are pushed into a buffer by DevTools while the test runs; reading it sends no browser command.
+        
+        Args:
+            kind (str): Only "console", "exception", "log" or "network" events; all kinds if omitted
+            ignore (iterable): Regular expressions for known noise, matched against the message and URL
+            
+        Returns:
+            list: Error events (dicts with kind, level, text, url, time), oldest first; empty when not captured
+        """
+        collector = BrowserEvents.for_driver(self.driver)
+        return collector.get(kind, "error", ignore) if collector is not None else []
+    
+    def assert_no_browser_errors(self, kind=None, ignore=()):
+        """
+        Assert the page logged no console errors and no request failed since the test started.
+        
+        Args:
+            kind (str): Only check this kind of event ("console", "exception", "log", "network")
+            ignore (iterable): Regular expressions for known noise, e.g. third-party ad requests
+        """
+        errors = self.browser_errors(kind, ignore)
+        assert not errors, "Browser errors:\n" + "\n".join(
+            f"  [{event['kind']}] {event['text']} {event.get('url', '')}".rstrip() for event in errors)
+    
+    def _element_box(self, locator):
+        """Bounding box of an element in viewport screenshot pixels."""
+        x, y, width, height, ratio = self.driver.execute_script(
+            "const r = arguments[0].getBoundingClientRect();"
+            "return [r.left, r.top, r.width, r.height, window.devicePixelRatio || 1];",
+            self.find_element(locator),
+        )
+        return tuple(int(round(value * ratio)) for value in (max(x, 0), max(y, 0), width, height))
+    
+    @CommandRecorder.recorded
+    @Metrics.timed_action
     def scroll_to_element(self, locator):
         """
         Scroll the page view until the element is visible.
@@ -2,8 +2,6 @@
 Buttons Page Object - Elements > Buttons
 Handles interactions with different types of button clicks (double, right, dynamic).
 """
-from selenium.webdriver.common.by import By  # For element location
-from selenium.webdriver.common.action_chains import ActionChains  # For advanced actions like double click
 from pages.base_page import BasePage  # Base class
 from locators.buttons_locators import ButtonsLocators
 
@@ -13,37 +11,60 @@ class ButtonsPage(BasePage):
     
     
     def __init__(self, driver):
-        """Initialize ButtonsPage with driver and ActionChains"""
+        """Initialize ButtonsPage with driver"""
         super().__init__(driver)
-        # ActionChains is needed for double click and context click (right click)
-        self.actions = ActionChains(driver)
     
     def navigate_to_buttons(self):
         """
         Navigate to the buttons page.
         """
         from config.config import Config
-        self.driver.get(Config.BUTTONS_URL)
+        self.navigate(Config.BUTTONS_URL)
         self.logger.info(f"Navigated to buttons page: {Config.BUTTONS_URL}")
     
     def double_click_button(self):
         """
         Perform a double click action on the double click button.
         """
-        element = self.find_element(ButtonsLocators.DOUBLE_CLICK_BUTTON)
-        # Use ActionChains to perform double click
-        self.actions.double_click(element).perform()
+        # Wait, find and double click in one batch instead of a find and a separate perform
+        self.batch().double_click(ButtonsLocators.DOUBLE_CLICK_BUTTON).perform()
         self.logger.info("Performed double click")
     
     def right_click_button(self):
         """
         Perform a right click (context click) action.
         """
-        element = self.find_element(ButtonsLocators.RIGHT_CLICK_BUTTON)
-        # Use ActionChains to perform context click
-        self.actions.context_click(element).perform()
+        self.batch().context_click(ButtonsLocators.RIGHT_CLICK_BUTTON).perform()
         self.logger.info("Performed right click")
     
+    def double_click_and_get_message(self):
+        """
+        Double click the button and wait for its message in the same batch.
+        
+        Returns:
+            str: Message text
+        """
+        message, = self.batch() \
+            .double_click(ButtonsLocators.DOUBLE_CLICK_BUTTON) \
+            .expect_text(ButtonsLocators.DOUBLE_CLICK_MESSAGE) \
+            .perform()
+        self.logger.info("Performed double click")
+        return message
+    
+    def right_click_and_get_message(self):
+        """
+        Right click the button and wait for its message in the same batch.
+        
+        Returns:
+            str: Message text
+        """
+        message, = self.batch() \
+            .context_click(ButtonsLocators.RIGHT_CLICK_BUTTON) \
+            .expect_text(ButtonsLocators.RIGHT_CLICK_MESSAGE) \
+            .perform()
+        self.logger.info("Performed right click")
+        return message
+    
     def click_dynamic_button(self):
         """
         Click on the dynamic button (simple click).
@@ -2,10 +2,8 @@
 Forms Page Object - Forms > Practice Form
 Handles interactions with the Student Registration Form.
 """
-from selenium.webdriver.common.by import By  # Element locator strategy
-from selenium.webdriver.support.ui import Select  # For handling dropdowns (though not currently used as custom elements are handled differently)
-from selenium.webdriver.common.keys import Keys  # For keyboard interactions (e.g., ENTER key)
 from pages.base_page import BasePage  # Base class
+from pages.widgets import DatePicker, Autocomplete  # Deterministic date picker / auto-complete drivers
 from locators.forms_locators import FormsLocators
 
 
@@ -16,13 +14,15 @@ class FormsPage(BasePage):
     def __init__(self, driver):
         """Initialize FormsPage"""
         super().__init__(driver)
+        self.date_of_birth_picker = DatePicker(self, FormsLocators.DATE_OF_BIRTH_INPUT)
+        self.subjects_autocomplete = Autocomplete(self, FormsLocators.SUBJECTS_INPUT, FormsLocators.SUBJECTS_CLASS_PREFIX)
     
     def navigate_to_forms(self):
         """
         Navigate to practice form page using URL from config.
         """
         from config.config import Config
-        self.driver.get(Config.FORMS_URL)
+        self.navigate(Config.FORMS_URL)
         self.logger.info(f"Navigated to forms page: {Config.FORMS_URL}")
     
     def enter_first_name(self, first_name):
@@ -60,29 +60,23 @@ class FormsPage(BasePage):
     def enter_date_of_birth(self, date):
         """
         Enter date of birth.
-        Uses keyboard shortcuts to select all and replace text, then hit Enter.
+        Picks the date from the calendar and waits until the input shows it.
         
         Args:
             date (str): Date in format "DD MMM YYYY" (e.g., "15 Jan 1995")
         """
-        self.click(FormsLocators.DATE_OF_BIRTH_INPUT)  # Focus the element
-        element = self.find_element(FormsLocators.DATE_OF_BIRTH_INPUT)
-        # Select existing text (Ctrl/Cmd + A) - using Control for simplicity, might need Command on Mac if not handled by driver
-        element.send_keys(Keys.CONTROL + "a")
-        element.send_keys(date) # Type new date
-        element.send_keys(Keys.ENTER) # Confirm selection
+        self.date_of_birth_picker.set_date(date)
     
     def enter_subjects(self, subjects):
         """
         Enter subjects into auto-complete field.
-        Types the subject and hits Enter to select the first match.
+        Waits for each subject's suggestion, picks it and confirms it was added.
         
         Args:
-            subjects (str): Subject name
+            subjects (str or list): Subject name, or several names
         """
-        element = self.find_element(FormsLocators.SUBJECTS_INPUT)
-        element.send_keys(subjects)
-        element.send_keys(Keys.ENTER)
+        for subject in [subjects] if isinstance(subjects, str) else subjects:
+            self.subjects_autocomplete.select(subject)
     
     def select_hobbies(self, hobby):
         """
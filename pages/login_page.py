@@ -2,7 +2,6 @@
 Login Page Object - Book Store Application Login Page
 Inherits from BasePage to leverage common functionality.
 """
-from selenium.webdriver.common.by import By  # Import By class for locator strategies
 from pages.base_page import BasePage  # Import BasePage class
 from locators.login_locators import LoginLocators
 
@@ -19,7 +18,7 @@ class LoginPage(BasePage):
         Navigate to the login page using the URL from config.
         """
         from config.config import Config  # Import locally to avoid circular import if any
-        self.driver.get(Config.LOGIN_URL)
+        self.navigate(Config.LOGIN_URL)
         self.logger.info(f"Navigated to login page: {Config.LOGIN_URL}")
     
     def enter_username(self, username):
@@ -64,6 +63,43 @@ class LoginPage(BasePage):
         self.enter_password(password)
         self.click_login_button()
     
+    def login_with_session_cache(self, username, password):
+        """
+        Log in, replaying a cached session when one exists so the login UI is skipped.
+        A cached session the application rejects is invalidated and replaced by a fresh UI login.
+        
+        Args:
+            username (str): Username
+            password (str): Password
+            
+        Returns:
+            bool: True if the browser ends up logged in
+        """
+        from config.config import Config  # Import locally to avoid circular import if any
+        from utils.session_cache import SessionCache  # Only needed by authenticated flows
+        
+        if Config.USE_SESSION_CACHE:
+            state = SessionCache.load(username, password)
+            if state:
+                SessionCache.inject(self.driver, state)
+                self.navigate(Config.PROFILE_URL)
+                if self.is_login_successful():
+                    self.logger.info(f"Reused cached session for username: {username}")
+                    return True
+                # Expired or revoked on the server side - forget it and log in through the UI
+                self.logger.info(f"Cached session rejected for username: {username}")
+                SessionCache.invalidate(username, password)
+                SessionCache.remove_injected(self.driver)
+                self.driver.delete_all_cookies()
+        
+        self.navigate_to_login()
+        self.login(username, password)
+        if not self.is_login_successful():
+            return False
+        if Config.USE_SESSION_CACHE:
+            SessionCache.save(username, password, SessionCache.capture(self.driver))
+        return True
+    
     def is_login_successful(self):
         """
         Check if login was successful by looking for the logout button.
@@ -2,7 +2,6 @@
 Text Box Page Object - Elements > Text Box
 Handles the interaction with the Text Box section of the application.
 """
-from selenium.webdriver.common.by import By  # Import By class for locator strategies
 from pages.base_page import BasePage  # Import BasePage class
 from locators.text_box_locators import TextBoxLocators
 
@@ -10,6 +9,23 @@ from locators.text_box_locators import TextBoxLocators
 class TextBoxPage(BasePage):
     """Page Object for Text Box Page. Contains locators and actions specific to the Text Box form."""
     
+    # Reused with --reuse-pages: reset_page() empties the fields and hides the submitted output
+    REUSABLE = True
+    
+    # The fields are React controlled inputs, which form.reset() does not clear in the component state:
+    # each one is emptied through the native value setter plus an input event. The output panel keeps the
+    # last submission until the next submit, so it is hidden here and shown again by click_submit().
+    RESET_PAGE_JS = """
+        document.querySelectorAll('input#userName, input#userEmail, textarea#currentAddress, textarea#permanentAddress')
+            .forEach(field => {
+                Object.getOwnPropertyDescriptor(Object.getPrototypeOf(field), 'value').set.call(field, '');
+                field.dispatchEvent(new Event('input', {bubbles: true}));
+            });
+        const output = document.getElementById('output');
+        if (output) output.style.display = 'none';
+        if (document.activeElement) document.activeElement.blur();
+        window.scrollTo(0, 0);
+    """
     
     def __init__(self, driver):
         """Initialize TextBoxPage with the driver"""
@@ -20,7 +36,7 @@ class TextBoxPage(BasePage):
         Navigate to the text box page using the URL from config.
         """
         from config.config import Config
-        self.driver.get(Config.TEXT_BOX_URL)
+        self.navigate(Config.TEXT_BOX_URL)
         self.logger.info(f"Navigated to text box page: {Config.TEXT_BOX_URL}")
     
     def enter_full_name(self, name):
@@ -64,6 +80,10 @@ class TextBoxPage(BasePage):
         Click the submit button.
         Scrolls to element first to ensure visibility.
         """
+        from config.config import Config
+        if Config.REUSE_PAGES:
+            # Show the output panel again if reset_page() hid it
+            self.driver.execute_script("const output = document.getElementById('output'); if (output) output.style.display = '';")
         self.scroll_to_element(TextBoxLocators.SUBMIT_BUTTON)
         self.click(TextBoxLocators.SUBMIT_BUTTON)
     
@@ -10,6 +10,9 @@ from locators.web_tables_locators import WebTablesLocators
 class WebTablesPage(BasePage):
     """Page Object for Web Tables Page. Contains methods to manage table records."""
     
+    # Not reused with --reuse-pages: added, edited and deleted records live in the table component's state,
+    # and only a reload brings back the seeded rows
+    REUSABLE = False
     
     def __init__(self, driver):
         """Initialize WebTablesPage"""
@@ -20,7 +23,7 @@ class WebTablesPage(BasePage):
         Navigate to web tables page using URL from config.
         """
         from config.config import Config
-        self.driver.get(Config.WEB_TABLES_URL)
+        self.navigate(Config.WEB_TABLES_URL)
         self.logger.info(f"Navigated to web tables page: {Config.WEB_TABLES_URL}")
     
     def click_add_button(self):
@@ -100,8 +103,8 @@ class WebTablesPage(BasePage):
             bool: True if record exists, False otherwise
         """
         try:
-            # Construct xpath to find a cell containing the email
-            locator = (By.XPATH, f"//div[@class='rt-td' and contains(text(), '{email}')]")
+            # Cell containing the email, searched within the table body only
+            locator = (By.XPATH, WebTablesLocators.RECORD_CELL[1].format(email=email))
             return self.is_displayed(locator)
         except:
             return False
@@ -0,0 +1,122 @@
+"""
+Widget drivers - deterministic helpers for the date picker and auto-complete widgets.
+Each step waits for the exact widget state it needs (calendar open and showing the right month,
+matching suggestion rendered, popup closed) with a short poll interval, then confirms the value
+the widget committed. No fixed sleeps and no reliance on animation timing.
+"""
+from datetime import datetime
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException
+from config.config import Config
+from utils.command_recorder import CommandRecorder
+from locators.widget_locators import DatePickerLocators, AutocompleteLocators
+
+
+def _widget_wait(driver):
+    """Explicit wait polling at Config.WIDGET_POLL_INTERVAL, tolerating re-rendered elements."""
+    return WebDriverWait(driver, Config.EXPLICIT_WAIT, poll_frequency=Config.WIDGET_POLL_INTERVAL,
+                         ignored_exceptions=[StaleElementReferenceException])
+
+
+class DatePicker:
+    """Driver for a react-datepicker input"""
+
+    # Attributes recorded with each step, so a replay can rebuild the widget driver
+    RECORDED_STATE = ("input_locator",)
+
+    def __init__(self, page, input_locator):
+        """
+        Args:
+            page: Page object (BasePage) owning the widget
+            input_locator (tuple): Locator of the date input
+        """
+        self.page = page
+        self.input_locator = input_locator
+
+    @CommandRecorder.recorded
+    def set_date(self, date):
+        """
+        Pick a date from the calendar and confirm the input shows it.
+
+        Args:
+            date (str): Date in Config.DATE_FORMAT, e.g. "15 Jan 1995"
+        """
+        target = datetime.strptime(date, Config.DATE_FORMAT)
+        expected = target.strftime(Config.DATE_FORMAT)
+        wait = _widget_wait(self.page.driver)
+        date_input = self.page.find_element(self.input_locator)
+        if date_input.get_attribute("value") == expected:
+            return
+        date_input.click()
+        wait.until(EC.visibility_of_element_located(DatePickerLocators.POPUP))
+        month, year = str(target.month - 1), str(target.year)
+        Select(self.page.find_element(DatePickerLocators.YEAR_SELECT)).select_by_value(year)
+        Select(self.page.find_element(DatePickerLocators.MONTH_SELECT)).select_by_value(month)
+        # The calendar re-renders after each select; wait until it shows the target month
+        wait.until(
+            lambda driver: driver.find_element(*DatePickerLocators.MONTH_SELECT).get_attribute("value") == month
+            and driver.find_element(*DatePickerLocators.YEAR_SELECT).get_attribute("value") == year,
+            message=f"Calendar did not switch to {target:%B %Y}"
+        )
+        day = (By.CSS_SELECTOR, DatePickerLocators.DAY[1].format(day=target.day))
+        wait.until(EC.element_to_be_clickable(day)).click()
+        wait.until(EC.invisibility_of_element_located(DatePickerLocators.POPUP))
+        wait.until(
+            lambda driver: driver.find_element(*self.input_locator).get_attribute("value") == expected,
+            message=f"Date picker did not commit {expected}"
+        )
+        self.page.logger.info(f"Picked date {expected}")
+
+
+class Autocomplete:
+    """Driver for a react-select multi-value auto-complete input"""
+
+    RECORDED_STATE = ("input_locator", "class_prefix")
+
+    def __init__(self, page, input_locator, class_prefix):
+        """
+        Args:
+            page: Page object (BasePage) owning the widget
+            input_locator (tuple): Locator of the text input
+            class_prefix (str): react-select class name prefix, e.g. "subjects-auto-complete"
+        """
+        self.page = page
+        self.input_locator = input_locator
+        self.class_prefix = class_prefix
+        self.option_locator = (By.CSS_SELECTOR, AutocompleteLocators.OPTION[1].format(prefix=class_prefix))
+        self.menu_locator = (By.CSS_SELECTOR, AutocompleteLocators.MENU[1].format(prefix=class_prefix))
+        self.selected_locator = (By.CSS_SELECTOR, AutocompleteLocators.SELECTED_VALUE[1].format(prefix=class_prefix))
+
+    def selected_values(self):
+        """
+        Returns:
+            list: Labels of the committed values
+        """
+        return [element.text for element in self.page.driver.find_elements(*self.selected_locator)]
+
+    @CommandRecorder.recorded
+    def select(self, value):
+        """
+        Type a value, wait for its suggestion and pick it, then confirm it was added.
+
+        Args:
+            value (str): Option label; an exact (case-insensitive) match is preferred over a partial one
+        """
+        wait = _widget_wait(self.page.driver)
+        self.page.find_element(self.input_locator).send_keys(value)
+
+        def matching_option(driver):
+            options = driver.find_elements(*self.option_locator)
+            exact = [option for option in options if option.text.strip().lower() == value.lower()]
+            partial = [option for option in options if value.lower() in option.text.lower()]
+            return (exact or partial or [False])[0]
+
+        wait.until(matching_option, message=f"No suggestion for '{value}'").click()
+        wait.until(EC.invisibility_of_element_located(self.menu_locator))
+        wait.until(
+            lambda driver: any(value.lower() in label.lower() for label in self.selected_values()),
+            message=f"Auto-complete did not commit '{value}'"
+        )
+        self.page.logger.info(f"Selected '{value}'")
@@ -1,30 +1,457 @@
 """
 Pytest configuration file - Contains fixtures and hooks that allow tests to share setup/teardown logic.
 """
+import json
 import pytest
 import os
+import time
 from datetime import datetime
+from utils.artifact_store import ArtifactStore
+from utils.browser_events import BrowserEvents
+from utils.circuit_breaker import CircuitBreaker
+from utils.command_recorder import CommandRecorder
+from utils.data_provider import DataProvider
 from utils.driver_factory import DriverFactory
+from utils.logger import Logger
+from utils.metrics import Metrics
+from utils.page_metrics import PageMetrics
+from utils.page_reuse import PageReuse
 from config.config import Config
+from config.settings import Settings, parse_assignments
+
+# pytester runs the smart rerun plugin in isolated inner sessions (tests/test_smart_rerun.py)
+pytest_plugins = ["pytester"]
+
+
+def pytest_addoption(parser):
+    """
+    Register custom command line options.
+    
+    Args:
+        parser: Pytest command line parser
+    """
+    parser.addoption(
+        "--profile", default=None,
+        help="Settings profile from config/profiles, e.g. ci or local (default: $QA_PROFILE)"
+    )
+    parser.addoption(
+        "--set", action="append", default=[], metavar="NAME=VALUE", dest="settings",
+        help="Override a Config setting for this run, e.g. --set HEADLESS=true (repeatable)"
+    )
+    parser.addoption(
+        "--browser-daemon", action="store_true", default=False,
+        help="Attach to the persistent browser daemon (python -m utils.browser_daemon start)"
+    )
+    parser.addoption(
+        "--grid-url", default=None,
+        help="Run on a Selenium Grid / standalone server, e.g. http://localhost:4444"
+    )
+    parser.addoption(
+        "--page-metrics", action="store_true", default=False,
+        help="Collect page load metrics on every navigation and enforce Config.PERFORMANCE_BUDGETS"
+    )
+    parser.addoption(
+        "--reuse-pages", action="store_true", default=False,
+        help="Group tests by page object and reuse already loaded pages on one shared driver"
+    )
+    parser.addoption(
+        "--metrics", action="store_true", default=False,
+        help=f"Write run metrics in OpenMetrics format to {Config.METRICS_FILE}"
+    )
+    parser.addoption(
+        "--metrics-port", type=int, default=None,
+        help="Also serve live metrics at http://127.0.0.1:<port>/metrics during the run (implies --metrics)"
+    )
+    parser.addoption(
+        "--no-stream-report", action="store_true", default=False,
+        help=f"Don't stream results to {Config.STREAM_REPORT_DIR}"
+    )
+    parser.addoption(
+        "--retries", type=int, default=None,
+        help="Retry a failing test up to N times right away, on the same driver"
+    )
+    parser.addoption(
+        "--last-failed-first", action="store_true", default=False,
+        help=f"Run the tests that failed in the previous session first (history in {Config.TEST_HISTORY_FILE})"
+    )
+    parser.addoption(
+        "--impact", action="store_true", default=False,
+        help="Run only the tests affected by the changes since --impact-base"
+    )
+    parser.addoption(
+        "--impact-base", default=None,
+        help=f"Git revision --impact compares the working tree with (default {Config.IMPACT_BASE})"
+    )
+    parser.addoption(
+        "--impact-trace", action="store_true", default=False,
+        help=f"Record the functions each test calls in {Config.IMPACT_INDEX_FILE} to refine --impact"
+    )
+    parser.addoption(
+        "--update-baselines", action="store_true", default=False,
+        help=f"Save current screenshots as the visual baselines in {Config.VISUAL_BASELINE_PATH}"
+    )
+    parser.addoption(
+        "--command-timing", action="store_true", default=False,
+        help="Record the round trip time of every WebDriver command and print a summary"
+    )
+    parser.addoption(
+        "--resource-monitor", action="store_true", default=False,
+        help="Attach browser memory / CPU / JS heap to every result and recycle long-lived drivers over the thresholds"
+    )
+    parser.addoption(
+        "--data-shard", default=None,
+        help="Run only shard N of M of each dataset, e.g. 2/4 (one shard per parallel job)"
+    )
+    parser.addoption(
+        "--data-limit", type=int, default=None,
+        help="Run at most this many records of each dataset"
+    )
+    parser.addoption(
+        "--dataset-size", type=int, default=None,
+        help="Number of records in synthetic datasets"
+    )
+
+
+def pytest_configure(config):
+    """
+    Resolve the session settings (profile, QA_* environment variables, command line options) once
+    and apply them to the framework configuration.
+    
+    Args:
+        config: Pytest config object
+    """
+    # Dedicated options are command line settings like --set NAME=VALUE (see config/settings.py), and win over it
+    cli = {}
+    flags = {
+        "--browser-daemon": "USE_BROWSER_DAEMON", "--page-metrics": "COLLECT_PAGE_METRICS",
+        "--reuse-pages": "REUSE_PAGES", "--metrics": "METRICS_ENABLED", "--update-baselines": "UPDATE_BASELINES",
+        "--command-timing": "COMMAND_TIMING", "--last-failed-first": "LAST_FAILED_FIRST",
+        "--resource-monitor": "RESOURCE_MONITOR",
+    }
+    for option, name in flags.items():
+        if config.getoption(option):
+            cli[name] = True
+    values = {
+        "--grid-url": "GRID_URL", "--metrics-port": "METRICS_PORT", "--retries": "TEST_RETRIES",
+        "--impact-base": "IMPACT_BASE", "--dataset-size": "SYNTHETIC_DATASET_SIZE",
+    }
+    for option, name in values.items():
+        if config.getoption(option) is not None:
+            cli[name] = config.getoption(option)
+    if config.getoption("--metrics-port") is not None:
+        cli["METRICS_ENABLED"] = True
+    if config.getoption("--no-stream-report"):
+        cli["STREAM_REPORT"] = False
+    try:
+        cli = {**parse_assignments(config.getoption("settings")), **cli}
+        Settings.activate(Settings.resolve(config.getoption("--profile"), cli))
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+    
+    if Config.METRICS_ENABLED:
+        Metrics.started = time.time()  # Throughput is measured from here
+    if Config.METRICS_PORT is not None:
+        port = Metrics.serve(Config.METRICS_PORT)
+        Logger.get_logger("Metrics").info(f"Serving metrics at http://127.0.0.1:{port}/metrics")
+    from utils.smart_rerun import SmartRerun  # Imported here: registered as a plugin object
+    config.pluginmanager.register(SmartRerun(Config.TEST_RETRIES, Config.LAST_FAILED_FIRST), "smart_rerun")
+    if config.getoption("--impact") or config.getoption("--impact-trace"):
+        from utils.impact_index import ImpactSelection  # Imported here: registered as a plugin object
+        config.pluginmanager.register(ImpactSelection(
+            str(config.rootpath), config.getoption("--impact"), Config.IMPACT_BASE, config.getoption("--impact-trace")
+        ), "impact_selection")
+    # With pytest-xdist the controller receives every worker's reports, so only it writes the stream
+    if Config.STREAM_REPORT and "PYTEST_XDIST_WORKER" not in os.environ:
+        from utils.stream_report import StreamReport  # Imported here: not needed on workers
+        config.pluginmanager.register(StreamReport(Config.STREAM_REPORT_DIR), "stream_report")
+
+
+def pytest_collection_modifyitems(items):
+    """
+    With --reuse-pages, run tests that use the same page object back to back.
+    
+    Args:
+        items: Collected test items, reordered in place
+    """
+    if Config.REUSE_PAGES:
+        items[:] = PageReuse.reorder(items)
+
+
+def pytest_runtest_setup(item):
+    """
+    Start recording the test's actions, including those of its fixtures.
+    
+    Args:
+        item: Test item about to be set up
+    """
+    CommandRecorder.start()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """
+    Attach the page metrics collected during the test to its result and fail it on budget violations.
+    Runs after the test body, so a slow page never hides a functional failure.
+    
+    Args:
+        item: Test item being run
+    """
+    PageMetrics.reset()
+    outcome = yield
+    if not PageMetrics.records:
+        return
+    import allure  # Imported here: only needed when metrics were collected
+    violations = []
+    for url, metrics, page_violations in PageMetrics.records:
+        item.user_properties.append(("page_metrics", json.dumps({"url": url, **metrics})))
+        allure.attach(json.dumps(metrics, indent=2), name=f"Page metrics: {url}",
+                      attachment_type=allure.attachment_type.JSON)
+        violations.extend(f"{url}: {violation}" for violation in page_violations)
+    if violations and outcome.excinfo is None:
+        outcome.force_exception(pytest.fail.Exception(
+            "Performance budget exceeded:\n" + "\n".join(violations), pytrace=False
+        ))
+
+
+def pytest_runtest_logreport(report):
+    """
+    Count finished tests by outcome for the metrics export.
+    
+    Args:
+        report: Report of one test phase (setup, call, teardown)
+    """
+    if not Config.METRICS_ENABLED:
+        return
+    if report.when == "call" or (report.when == "setup" and not report.passed):
+        # Setup failures/skips never reach the call phase; count them once here
+        outcome = "error" if report.when == "setup" and report.failed else report.outcome
+        Metrics.record(Metrics.tests, 1, outcome=outcome)
+        if report.when == "call":
+            Metrics.record(Metrics.test_duration, report.duration)
+
+
+def pytest_sessionfinish(session):
+    """
+    Write the metrics export at the end of the run. Parallel workers write one file each.
+    Then move finished logs into the artifact store and apply its retention policy.
+    
+    Args:
+        session: Pytest session
+    """
+    # Workers are done once the controller finishes; only this process's own log is still open
+    if Config.ARTIFACT_STORE and "PYTEST_XDIST_WORKER" not in os.environ:
+        store = ArtifactStore()
+        store.archive_logs(keep=[Logger.log_file] if Logger.log_file else [])
+        store.enforce_retention()
+    if not Config.METRICS_ENABLED:
+        return
+    path = Config.METRICS_FILE
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        root, extension = os.path.splitext(path)
+        path = f"{root}-{worker}{extension}"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    Metrics.write(path)
+    Metrics.stop()
+
+
+def _open_dataset(config, marker):
+    """Open the dataset named by a 'dataset' marker; file paths are relative to the project root."""
+    source = marker.args[0]
+    if not source.startswith("synthetic:") and not os.path.isabs(source):
+        source = os.path.join(str(config.rootpath), source)
+    return DataProvider.open(source, **marker.kwargs)
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize tests marked with @pytest.mark.dataset(...) over the records of the dataset.
+    Only record numbers are collected; the record itself is loaded by the data_record fixture.
+    
+    Args:
+        metafunc: Pytest metafunc of the test being collected
+    """
+    marker = metafunc.definition.get_closest_marker("dataset")
+    if marker is None or "data_record" not in metafunc.fixturenames:
+        return
+    dataset = _open_dataset(metafunc.config, marker)
+    shard, shards = DataProvider.parse_shard(metafunc.config.getoption("--data-shard"))
+    indices = DataProvider.shard_indices(len(dataset), shard, shards, metafunc.config.getoption("--data-limit"))
+    metafunc.parametrize("data_record", indices, indirect=True, ids=lambda index: f"record{index}")
+
+
+@pytest.fixture
+def data_record(request):
+    """
+    One record of the test's dataset, loaded only when the test runs.
+    
+    Returns:
+        dict: Record with the same keys as the matching TestData dict
+    """
+    marker = request.node.get_closest_marker("dataset")
+    return _open_dataset(request.config, marker).load(request.param)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Print the circuit breaker, page reuse and WebDriver command timing summaries at the end of the run.
+    
+    Args:
+        terminalreporter: Pytest terminal reporter
+    """
+    breaker = CircuitBreaker.shared()
+    if breaker.rejected:
+        terminalreporter.write_sep("-", "circuit breaker")
+        terminalreporter.write_line(f"{breaker.rejected} test(s) failed fast without contacting {breaker.url}")
+        terminalreporter.write_line(f"Reason: {breaker.reason or 'recovered later in the run'}")
+    if Config.REUSE_PAGES:
+        total = PageReuse.navigations + PageReuse.navigations_saved
+        terminalreporter.write_sep("-", "page reuse")
+        terminalreporter.write_line(f"{PageReuse.navigations_saved} of {total} page navigations saved")
+    if Config.COMMAND_TIMING:
+        from utils.command_timer import CommandTimer
+        target = Config.GRID_URL or "local driver"
+        terminalreporter.write_sep("-", f"WebDriver command timing ({target})")
+        for line in CommandTimer.shared().summary_lines():
+            terminalreporter.write_line(line)
+
+
+def _begin_resource_monitor(driver):
+    """
+    Args:
+        driver: Driver handed to the test
+    
+    Returns:
+        ResourceMonitor: Monitor of the driver with its CPU mark set, or None when monitoring is off
+    """
+    if not Config.RESOURCE_MONITOR:
+        return None
+    from utils.resource_monitor import ResourceMonitor  # Imported here: psutil is only needed when monitoring
+    monitor = ResourceMonitor.for_driver(driver)
+    monitor.begin_test()
+    return monitor
+
+
+def _sample_resources(item, monitor, long_lived):
+    """
+    Attach the browser's resource usage to the test result and recycle a long-lived driver over the thresholds.
+    
+    Args:
+        item: Test item that used the driver
+        monitor (ResourceMonitor): Monitor from _begin_resource_monitor(), or None
+        long_lived (bool): The driver serves further tests after this one
+    """
+    if monitor is None:
+        return
+    sample = monitor.sample()
+    item.user_properties.append(("resources", json.dumps(sample)))
+    reason = monitor.recycle_reason(sample) if long_lived else None
+    if reason:
+        Metrics.record(Metrics.driver_recycles, 1)
+        monitor.recycle(reason)
+
+
+def _begin_browser_events(driver):
+    """
+    Args:
+        driver: Driver handed to the test
+    
+    Returns:
+        BrowserEvents: The driver's event collector with an empty buffer, or None when capture is off or
+            the browser has no DevTools endpoint
+    """
+    if not Config.CAPTURE_BROWSER_EVENTS:
+        return None
+    collector = BrowserEvents.start(driver)
+    if collector is not None:
+        collector.clear()  # Only this test's events; a shared driver carries the previous test's
+    return collector
+
+
+@pytest.fixture(scope="session")
+def shared_driver():
+    """
+    One driver kept for the whole session when pages are reused (--reuse-pages).
+    
+    Yields:
+        WebDriver: Browser driver instance shared by consecutive tests
+    """
+    start = time.perf_counter()
+    driver = DriverFactory.get_driver()
+    Metrics.record(Metrics.driver_startup, time.perf_counter() - start)
+    yield driver
+    events = BrowserEvents.for_driver(driver)
+    if events is not None:
+        events.stop()
+    driver.quit()
 
 
 @pytest.fixture(scope="function")
-def driver():
+def driver(request):
     """
     WebDriver fixture - Creates and quits driver for each test function.
     'scope="function"' means this fixture is re-run for every test.
+    With --reuse-pages the session's shared driver is handed out instead, keeping its loaded page.
     
     Yields:
         WebDriver: Browser driver instance ready for use
     """
+    # Don't launch a browser for an application that is known to be down
+    if Config.CIRCUIT_BREAKER_ENABLED:
+        CircuitBreaker.shared().preflight()
+        CircuitBreaker.shared().check()
+    if Config.REUSE_PAGES:
+        driver = request.getfixturevalue("shared_driver")
+        monitor = _begin_resource_monitor(driver)
+        _begin_browser_events(driver)
+        yield driver
+        _sample_resources(request.node, monitor, long_lived=True)
+        # Light cleanup that keeps the current document loaded for the next test
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.delete_all_cookies()
+        if getattr(request.node, "page_reuse_failed", False):
+            # Don't hand a page in an unknown state to the next test
+            driver.get("about:blank")
+        return
     # Create driver instance using logic in DriverFactory
+    start = time.perf_counter()
     driver = DriverFactory.get_driver()
+    Metrics.record(Metrics.driver_startup, time.perf_counter() - start)
+    monitor = _begin_resource_monitor(driver)
+    events = _begin_browser_events(driver)
     # 'yield' acts like return, but allows code execution after the test finishes (teardown)
     yield driver
+    # Pooled grid sessions and the daemon's browser outlive quit(); fresh local drivers end with it
+    _sample_resources(request.node, monitor, long_lived=hasattr(type(driver), "recycle_reason"))
+    if events is not None:
+        events.stop()
     # Cleanup: Close the browser window
     driver.quit()
 
 
+@pytest.fixture(scope="function")
+def logged_in_driver(driver):
+    """
+    Driver logged in as TestData.VALID_USER. The login UI runs once per credential set;
+    later tests get the cached session injected (see utils/session_cache.py).
+    
+    Yields:
+        WebDriver: Browser driver on the profile page of the logged-in user
+    """
+    from pages.login_page import LoginPage  # Imported here: only authenticated tests need it
+    from utils.test_data import TestData
+    logged_in = LoginPage(driver).login_with_session_cache(
+        TestData.VALID_USER["username"], TestData.VALID_USER["password"]
+    )
+    if not logged_in:
+        pytest.skip(f"Could not log in as {TestData.VALID_USER['username']} (user not registered?)")
+    yield driver
+
+
 @pytest.fixture(scope="function")
 def setup_teardown(driver):
     """
@@ -37,9 +464,7 @@ def setup_teardown(driver):
     Yields:
         WebDriver: Browser driver instance
     """
-    # Setup step: Maximize window to ensure all elements are visible
-    driver.maximize_window()
-    
+    # The window was already sized by DriverFactory (WINDOW_SIZE / LAUNCH_PROFILE)
     # Pass control to the test function
     yield driver
     
@@ -47,6 +472,23 @@ def setup_teardown(driver):
     driver.delete_all_cookies()
 
 
+def _dump_browser_events(item, driver):
+    """
+    Store the console and network errors buffered during a failed test and attach them to its result.
+    
+    Args:
+        item: Failed test item
+        driver: Driver the test used
+    """
+    collector = BrowserEvents.for_driver(driver)
+    events_path = collector.dump(item.nodeid) if collector is not None else None
+    if events_path:
+        item.user_properties.append(("artifact", events_path))
+        errors = collector.get(level="error")
+        network = sum(event["kind"] == "network" for event in errors)
+        print(f"\nBrowser errors: {len(errors) - network} console, {network} network ({events_path})")
+
+
 def pytest_runtest_makereport(item, call):
     """
     Pytest hook to capture screenshot on test failure.
@@ -60,9 +502,27 @@ def pytest_runtest_makereport(item, call):
     if call.when == "call":
         # Check if an exception occurred (test failed)
         if call.excinfo is not None:
+            # A failed test's page is reloaded rather than reused (--reuse-pages)
+            item.page_reuse_failed = True
+            # Keep the recorded actions for python -m utils.command_recorder
+            trace_path = CommandRecorder.save(item.nodeid) if Config.RECORD_COMMANDS else None
+            if trace_path:
+                item.user_properties.append(("artifact", trace_path))
+                print(f"\nReplay with: python -m utils.command_recorder {trace_path}")
             # Retrieve the driver from the test's fixtures
             driver = item.funcargs.get('driver')
-            if driver and Config.SCREENSHOT_ON_FAILURE:
+            if driver and Config.CAPTURE_BROWSER_EVENTS:
+                _dump_browser_events(item, driver)
+            if driver and Config.SCREENSHOT_ON_FAILURE and Config.ARTIFACT_STORE:
+                # Identical failure pages are stored once; reports link the hash-named objects
+                store = ArtifactStore()
+                screenshot_path = store.put(driver.get_screenshot_as_png(), "screenshot", item.name, item.nodeid)
+                item.user_properties.append(("artifact", screenshot_path))
+                if Config.CAPTURE_DOM_ON_FAILURE:
+                    dom_path = store.put(driver.page_source, "dom", item.name, item.nodeid)
+                    item.user_properties.append(("artifact", dom_path))
+                print(f"\nScreenshot saved: {screenshot_path}")
+            elif driver and Config.SCREENSHOT_ON_FAILURE:
                 # Ensure screenshot directory exists
                 os.makedirs(Config.SCREENSHOT_PATH, exist_ok=True)
                 # Generate unique filename with timestamp
@@ -71,6 +531,8 @@ def pytest_runtest_makereport(item, call):
                 screenshot_path = os.path.join(Config.SCREENSHOT_PATH, screenshot_name)
                 # Save screenshot
                 driver.save_screenshot(screenshot_path)
+                # Reports reference the file instead of embedding it
+                item.user_properties.append(("artifact", screenshot_path))
                 print(f"\nScreenshot saved: {screenshot_path}")
 
 
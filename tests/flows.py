@@ -0,0 +1,29 @@
+"""
+Reusable page-object flows shared by the multi-tab tests and the benchmarks.
+Each flow mirrors one of the tests in tests/ and takes a WebDriver instance.
+"""
+from pages.buttons_page import ButtonsPage
+from pages.text_box_page import TextBoxPage
+from utils.test_data import TestData
+
+
+def buttons_flow(driver):
+    """Double click flow from tests/test_buttons.py"""
+    buttons_page = ButtonsPage(driver)
+    buttons_page.navigate_to_buttons()
+    buttons_page.double_click_button()
+    assert "double" in buttons_page.get_double_click_message().lower()
+
+
+def text_box_flow(driver):
+    """Form submission flow from tests/test_text_box.py"""
+    text_box_page = TextBoxPage(driver)
+    test_data = TestData.TEXT_BOX_DATA
+    text_box_page.navigate_to_text_box()
+    text_box_page.fill_form(
+        test_data["full_name"],
+        test_data["email"],
+        test_data["current_address"],
+        test_data["permanent_address"]
+    )
+    assert test_data["full_name"] in text_box_page.get_output_text()
@@ -0,0 +1,53 @@
+"""
+Action Batch Unit Tests - Batched actions and expectations in one WebDriver command (no browser needed)
+"""
+import pytest  # Import pytest
+from selenium.common.exceptions import TimeoutException
+from locators.buttons_locators import ButtonsLocators
+from utils.action_batch import ActionBatch
+
+
+class RecordingDriver:
+    """Stand-in WebDriver recording execute_async_script calls"""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(args)
+        return self.result
+
+
+@pytest.mark.unit
+def test_synthetic_batch_is_one_command():
+    """
+    Test Case: Verify actions on several elements and their expected messages go out in one command
+    """
+    driver = RecordingDriver({"elements": None, "texts": ["You have done a double click"]})
+
+    texts = ActionBatch(driver, synthetic=True, timeout=5) \
+        .double_click(ButtonsLocators.DOUBLE_CLICK_BUTTON) \
+        .context_click(ButtonsLocators.RIGHT_CLICK_BUTTON) \
+        .click(ButtonsLocators.DOUBLE_CLICK_BUTTON) \
+        .expect_text(ButtonsLocators.DOUBLE_CLICK_MESSAGE) \
+        .perform()
+
+    assert texts == ["You have done a double click"]
+    assert len(driver.calls) == 1
+    targets, steps, expected, timeout, synthetic = driver.calls[0]
+    assert targets == [list(ButtonsLocators.DOUBLE_CLICK_BUTTON), list(ButtonsLocators.RIGHT_CLICK_BUTTON)]
+    assert steps == [["double_click", 0, None], ["context_click", 1, None], ["click", 0, None]]
+    assert expected == [list(ButtonsLocators.DOUBLE_CLICK_MESSAGE)]
+    assert (timeout, synthetic) == (5, True)
+
+
+@pytest.mark.unit
+def test_batch_timeout_raises_timeout_exception():
+    """
+    Test Case: Verify a batch whose elements never appear fails like an explicit wait
+    """
+    driver = RecordingDriver({"error": True})
+
+    with pytest.raises(TimeoutException):
+        ActionBatch(driver, synthetic=True, timeout=1).click(ButtonsLocators.DYNAMIC_CLICK_BUTTON).perform()
@@ -0,0 +1,79 @@
+"""
+Artifact Store Unit Tests - Deduplication, compression, log archiving and retention (no browser needed)
+"""
+import os  # Inspect stored files
+import time  # Age index entries
+import pytest  # Import pytest
+from utils.artifact_store import ArtifactStore
+
+
+@pytest.mark.unit
+def test_identical_content_is_stored_once(tmp_path):
+    """
+    Test Case: Verify the same screenshot stored twice takes one object and two index entries
+    """
+    store = ArtifactStore(str(tmp_path))
+
+    first = store.put(b"\x89PNG same pixels", "screenshot", test="tests/test_a.py::test_a")
+    second = store.put(b"\x89PNG same pixels", "screenshot", test="tests/test_b.py::test_b")
+
+    assert first == second
+    assert len(os.listdir(os.path.dirname(first))) == 1
+    assert [entry["new"] for entry in store.entries()] == [True, False]
+
+
+@pytest.mark.unit
+def test_text_artifacts_are_compressed_and_readable(tmp_path):
+    """
+    Test Case: Verify DOM snapshots are gzip-compressed on disk and read back unchanged
+    """
+    store = ArtifactStore(str(tmp_path))
+    page_source = "<html><body>" + "<div class='row'>cell</div>" * 1000 + "</body></html>"
+
+    path = store.put(page_source, "dom")
+    digest = os.path.basename(path).split(".")[0]
+
+    assert path.endswith(".html.gz")
+    assert os.path.getsize(path) < len(page_source) / 10
+    assert store.read(digest[:12]).decode() == page_source
+
+
+@pytest.mark.unit
+def test_archive_logs_keeps_the_open_log(tmp_path):
+    """
+    Test Case: Verify finished logs move into the store while the current log stays in place
+    """
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    (logs / "test_execution_1.log").write_text("old run\n" * 100)
+    (logs / "test_execution_2.log").write_text("current run\n")
+    (logs / "browser_daemon.log").write_text("daemon\n")
+    store = ArtifactStore(str(tmp_path / "store"))
+
+    archived = store.archive_logs(str(logs), keep=[str(logs / "test_execution_2.log")])
+
+    assert archived == 1
+    assert sorted(os.listdir(logs)) == ["browser_daemon.log", "test_execution_2.log"]
+    assert store.entries()[0]["kind"] == "log"
+
+
+@pytest.mark.unit
+def test_retention_removes_old_then_least_recently_used(tmp_path, monkeypatch):
+    """
+    Test Case: Verify retention deletes expired objects, then the least recently referenced ones over the size limit
+    """
+    store = ArtifactStore(str(tmp_path))
+    now = time.time()
+    clock = iter([now - 30 * 86400, now - 3, now - 2, now - 1])
+    monkeypatch.setattr(time, "time", lambda: next(clock, now))
+    expired = store.put(b"a" * 100, "screenshot")
+    older = store.put(b"b" * 100, "screenshot")
+    newer = store.put(b"c" * 100, "screenshot")
+    store.put(b"b" * 100, "screenshot")  # Referenced again: now the most recent
+
+    removed = store.enforce_retention(max_bytes=150, max_age_days=14)
+
+    assert removed == 2
+    assert not os.path.exists(expired) and not os.path.exists(newer)
+    assert os.path.exists(older)
+    assert {entry["hash"] for entry in store.entries()} == {os.path.basename(older).split(".")[0]}
@@ -0,0 +1,121 @@
+"""
+Async Page Object Tests - Several pages driven concurrently from one event loop
+"""
+import asyncio  # Event loop
+import pytest  # Import pytest
+from config.config import Config
+from pages.async_base_page import AsyncBasePage
+from pages.async_buttons_page import AsyncButtonsPage  # Async Page Objects
+from pages.async_text_box_page import AsyncTextBoxPage
+from utils.cdp_connection import AsyncBrowser  # DevTools connection
+from utils.test_data import TestData  # Import Test Data
+
+
+async def run_buttons(browser):
+    """Double click flow on its own tab"""
+    buttons_page = await browser.new_page(AsyncButtonsPage)
+    await buttons_page.navigate_to_buttons()
+    await buttons_page.double_click_button()
+    return await buttons_page.get_double_click_message()
+
+
+async def run_text_box(browser):
+    """Text box submission flow on its own tab"""
+    text_box_page = await browser.new_page(AsyncTextBoxPage)
+    test_data = TestData.TEXT_BOX_DATA
+    await text_box_page.navigate_to_text_box()
+    await text_box_page.fill_form(
+        test_data["full_name"],
+        test_data["email"],
+        test_data["current_address"],
+        test_data["permanent_address"]
+    )
+    return await text_box_page.get_output_text()
+
+
+@pytest.mark.elements  # Mark as 'elements' suite
+def test_async_pages_run_concurrently(driver):
+    """
+    Test Case: Verify async page objects drive several tabs concurrently
+
+    Steps:
+    1. Connect to the driver's browser over DevTools
+    2. Run the buttons and text box flows concurrently on one event loop
+    3. Verify both flows produced the expected output
+    """
+    async def scenario():
+        browser = await AsyncBrowser.from_driver(driver)
+        try:
+            return await asyncio.gather(run_buttons(browser), run_text_box(browser))
+        finally:
+            await browser.close()
+
+    # Act: Run both flows concurrently
+    double_click_message, output_text = asyncio.run(scenario())
+
+    # Assert: Verify both results
+    assert "double" in double_click_message.lower(), "Message should contain 'double'"
+    assert TestData.TEXT_BOX_DATA["full_name"] in output_text, "Full name should be in output"
+    print(f"Async flows completed: {double_click_message!r}")
+
+
+class FakeConnection:
+    """DevTools connection answering the commands an AsyncBasePage sends, with scripted results"""
+
+    def __init__(self, results):
+        self.results = results
+        self.sent = []
+        self.listeners = {}
+
+    async def send(self, method, params=None, session_id=None):
+        self.sent.append((method, params or {}))
+        result = self.results.get(method, {})
+        return result.pop(0) if isinstance(result, list) else result
+
+    def on(self, method, callback, session_id=None):
+        self.listeners[method] = callback
+
+
+@pytest.mark.unit
+def test_open_waits_for_the_load_of_its_own_navigation(monkeypatch):
+    """
+    Test Case: Verify re-opening a URL waits for the new document's load event, not the loaded old one
+    """
+    monkeypatch.setattr(Config, "PAGE_LOAD_TIMEOUT", 5)
+    connection = FakeConnection({"Page.navigate": {"frameId": "F", "loaderId": "new"}})
+    page = AsyncBasePage(connection, "page-1")
+
+    async def scenario():
+        opening = asyncio.ensure_future(page.open("https://demoqa.com/buttons"))
+        await asyncio.sleep(0.05)
+        connection.listeners["Page.lifecycleEvent"]({"name": "load", "frameId": "F", "loaderId": "old"})
+        connection.listeners["Page.lifecycleEvent"]({"name": "DOMContentLoaded", "frameId": "F", "loaderId": "new"})
+        await asyncio.sleep(0.05)
+        assert not opening.done()
+        connection.listeners["Page.lifecycleEvent"]({"name": "load", "frameId": "F", "loaderId": "new"})
+        await opening
+
+    asyncio.run(scenario())
+    assert [method for method, _ in connection.sent] == ["Page.setLifecycleEventsEnabled", "Page.navigate"]
+    assert not page._loads
+
+
+@pytest.mark.unit
+def test_polled_elements_are_released():
+    """
+    Test Case: Verify elements located while polling for clickability are released, hit or miss
+    """
+    hidden, shown = {"result": {"value": False}}, {"result": {"value": True}}
+    connection = FakeConnection({
+        "Runtime.evaluate": [{"result": {"type": "object", "subtype": "null"}},
+                             {"result": {"objectId": "e1"}}, {"result": {"objectId": "e2"}}],
+        "Runtime.callFunctionOn": [hidden, shown, {"result": {"value": {"x": 5, "y": 5}}}],
+    })
+    page = AsyncBasePage(connection, "page-1")
+    page.POLL_INTERVAL = 0
+
+    assert asyncio.run(page._element_center(("id", "doubleClickBtn"))) == {"x": 5, "y": 5}
+    assert {params.get("objectGroup") for method, params in connection.sent if method == "Runtime.evaluate"} == {
+        AsyncBasePage.OBJECT_GROUP}
+    assert [params["objectId"] for method, params in connection.sent if method == "Runtime.releaseObject"] == [
+        "e1", "e2"]
@@ -0,0 +1,148 @@
+"""
+Browser Events Unit Tests - Buffering console and network errors from DevTools events (no browser needed)
+"""
+import asyncio  # Fake DevTools endpoint
+import json  # Stored events are JSON
+import threading  # The endpoint runs beside the collector's loop
+import time  # Wait for the endpoint to listen
+import pytest  # Import pytest
+from config.config import Config
+from pages.base_page import BasePage
+from utils.browser_events import BrowserEvents
+
+
+def console_event(level, *values):
+    return {"type": level, "args": [{"type": "string", "value": value} for value in values],
+            "stackTrace": {"callFrames": [{"url": "https://demoqa.com/app.js"}]}}
+
+
+@pytest.mark.unit
+def test_buffer_keeps_the_latest_events_at_the_configured_levels(monkeypatch):
+    """
+    Test Case: Verify console messages below the configured levels are skipped and the buffer stays bounded
+    """
+    monkeypatch.setattr(Config, "CONSOLE_LEVELS", ("error", "warning"))
+    events = BrowserEvents(capacity=3)
+
+    events.on_console(console_event("log", "rendered"))
+    events.on_console(console_event("warning", "deprecated API"))
+    for number in range(3):
+        events.on_console(console_event("error", "failed", number))
+    events.on_exception({"exceptionDetails": {"text": "Uncaught", "url": "https://demoqa.com/app.js",
+                                              "exception": {"description": "TypeError: x is undefined\n    at f"}}})
+
+    assert [event["text"] for event in events.get()] == ["failed 1", "failed 2", "TypeError: x is undefined"]
+    assert events.dropped == 2
+    assert events.get(kind="exception")[0]["url"] == "https://demoqa.com/app.js"
+
+
+@pytest.mark.unit
+def test_failed_requests_are_named_by_their_url(monkeypatch):
+    """
+    Test Case: Verify error responses and failed loads are kept with their URL, successes and cancels are not
+    """
+    monkeypatch.setattr(Config, "NETWORK_ERROR_STATUS", 400)
+    events = BrowserEvents()
+    for request_id, url in enumerate(["https://demoqa.com/", "https://demoqa.com/api/books", "https://ads.example/ad.js"]):
+        events.on_request({"requestId": str(request_id), "request": {"method": "GET", "url": url}})
+
+    events.on_response({"requestId": "0", "type": "Document", "response": {"url": "https://demoqa.com/", "status": 200}})
+    events.on_response({"requestId": "1", "type": "XHR", "response": {
+        "url": "https://demoqa.com/api/books", "status": 502, "statusText": "Bad Gateway"}})
+    events.on_loading_failed({"requestId": "2", "type": "Script", "errorText": "net::ERR_BLOCKED_BY_CLIENT"})
+    events.on_loading_failed({"requestId": "3", "errorText": "net::ERR_ABORTED", "canceled": True})
+
+    network = events.get(kind="network")
+    assert [(event["text"], event["url"]) for event in network] == [
+        ("GET 502 Bad Gateway (XHR)", "https://demoqa.com/api/books"),
+        ("GET failed: net::ERR_BLOCKED_BY_CLIENT (Script)", "https://ads.example/ad.js"),
+    ]
+    assert not events._requests
+
+
+@pytest.mark.unit
+def test_page_objects_assert_on_errors_and_failures_dump_them(monkeypatch, tmp_path):
+    """
+    Test Case: Verify BasePage reports buffered errors minus ignored noise and a failed test stores them
+    """
+    monkeypatch.setattr(Config, "ARTIFACT_STORE", False)
+    monkeypatch.setattr(Config, "TRACE_PATH", str(tmp_path))
+    driver = type("FakeDriver", (), {})()
+    events = BrowserEvents()
+    monkeypatch.setitem(BrowserEvents._collectors, driver, events)
+    page = BasePage(driver)
+
+    page.assert_no_browser_errors()
+    events.add("console", "warning", "deprecated API")
+    events.add("network", "error", "GET failed: net::ERR_BLOCKED_BY_CLIENT (Script)", "https://ads.example/ad.js")
+    page.assert_no_browser_errors(ignore=[r"ads\.example"])
+    events.add("console", "error", "Uncaught TypeError")
+    with pytest.raises(AssertionError, match=r"\[console\] Uncaught TypeError"):
+        page.assert_no_browser_errors(ignore=[r"ads\.example"])
+
+    with open(events.dump("tests/test_x.py::test_x"), encoding="utf-8") as events_file:
+        stored = json.load(events_file)
+    assert [event["text"] for event in stored["events"]][1:] == [
+        "GET failed: net::ERR_BLOCKED_BY_CLIENT (Script)", "Uncaught TypeError"]
+    events.clear()
+    assert page.browser_errors() == [] and events.dump("tests/test_x.py::test_x") is None
+
+
+def _serve_fake_devtools(ready, received):
+    """Browser endpoint with one open page whose Runtime.enable answers late and replays a console error"""
+    import websockets  # Imported here: only this test needs a server
+
+    async def handle(websocket, *args):
+        async for raw in websocket:
+            message = json.loads(raw)
+            received.append((message["method"], message.get("sessionId")))
+            if message["method"] == "Target.setAutoAttach":
+                # Existing targets are reported before the command's response, not paused
+                for target_type, target_id in (("page", "T1"), ("service_worker", "W1")):
+                    await websocket.send(json.dumps({"method": "Target.attachedToTarget", "params": {
+                        "sessionId": f"{target_id}-session", "waitingForDebugger": False,
+                        "targetInfo": {"type": target_type, "targetId": target_id}}}))
+            if message["method"] == "Runtime.enable" and message["sessionId"] == "T1-session":
+                await asyncio.sleep(0.2)
+                await websocket.send(json.dumps({"method": "Runtime.consoleAPICalled", "sessionId": "T1-session",
+                                                 "params": console_event("error", "before the test")}))
+            await websocket.send(json.dumps({"id": message["id"], "result": {}}))
+            if message["method"] == "Runtime.enable" and message["sessionId"] == "T1-session":
+                # The page opens a popup, paused before its first request until the collector resumes it
+                await websocket.send(json.dumps({"method": "Target.attachedToTarget", "params": {
+                    "sessionId": "P1-session", "waitingForDebugger": True,
+                    "targetInfo": {"type": "page", "targetId": "P1"}}}))
+
+    async def main():
+        async with websockets.serve(handle, "127.0.0.1", 0) as server:
+            ready.append(server.sockets[0].getsockname()[1])
+            await asyncio.Future()
+
+    asyncio.new_event_loop().run_until_complete(main())
+
+
+@pytest.mark.unit
+def test_start_returns_once_open_pages_are_subscribed():
+    """
+    Test Case: Verify start() waits for the open pages' domains to be enabled, so clear() drops the replayed
+    events, and popups are resumed only once subscribed
+    """
+    ready, received = [], []
+    threading.Thread(target=_serve_fake_devtools, args=(ready, received), daemon=True).start()
+    while not ready:
+        time.sleep(0.01)
+    driver = type("FakeDriver", (), {"session_id": "s1", "capabilities": {"se:cdp": f"ws://127.0.0.1:{ready[0]}"}})()
+
+    events = BrowserEvents.start(driver)
+    try:
+        assert [event["text"] for event in events.get()] == ["before the test"]
+        assert BrowserEvents.start(driver) is events
+        deadline = time.monotonic() + 5
+        while ("Runtime.runIfWaitingForDebugger", "P1-session") not in received and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [method for method, session in received if session == "P1-session"] == [
+            "Runtime.enable", "Log.enable", "Network.enable", "Runtime.runIfWaitingForDebugger"]
+        assert sorted(events._attaching) == ["P1", "T1"]
+        assert not any(session == "W1-session" for method, session in received)
+    finally:
+        events.stop()
@@ -30,3 +30,21 @@ def test_double_click_button(driver):
     message = buttons_page.get_double_click_message()
     assert "double" in message.lower(), "Message should contain 'double'"
     print(f"Double click successful. Message: {message}")
+
+
+@pytest.mark.elements
+def test_right_click_button_batched(driver):
+    """
+    Test Case: Verify right click and its message in a single action batch
+    
+    Steps:
+    1. Navigate to buttons page
+    2. Right click the button and wait for the message in one batch
+    3. Verify the message text
+    """
+    buttons_page = ButtonsPage(driver)
+    buttons_page.navigate_to_buttons()
+    
+    message = buttons_page.right_click_and_get_message()
+    
+    assert "right click" in message.lower(), "Message should mention the right click"
@@ -0,0 +1,71 @@
+"""
+Circuit Breaker Unit Tests - Failing fast while the application is down (no browser needed)
+"""
+import threading  # Background HTTP server
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import pytest  # Import pytest
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class _HealthyHandler(BaseHTTPRequestHandler):
+    def do_HEAD(self):
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def healthy_url():
+    """URL of a local server that answers every probe."""
+    server = HTTPServer(("127.0.0.1", 0), _HealthyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.mark.unit
+def test_breaker_opens_after_consecutive_failures():
+    """
+    Test Case: Verify the breaker trips after the threshold and then rejects calls immediately
+    """
+    breaker = CircuitBreaker(url="http://127.0.0.1:9", threshold=2, cooldown=60)
+
+    breaker.record_failure("timeout")
+    breaker.check()  # One failure: still closed
+    breaker.record_failure("timeout")
+
+    with pytest.raises(CircuitOpenError, match="2 consecutive page loads failed"):
+        breaker.check()
+    assert breaker.rejected == 1
+
+
+@pytest.mark.unit
+def test_half_open_probe_closes_breaker_when_application_recovers(healthy_url):
+    """
+    Test Case: Verify a successful probe after the cooldown resumes normal operation
+    """
+    breaker = CircuitBreaker(url=healthy_url, threshold=1, cooldown=0.01)
+    breaker.record_failure("connection refused")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    breaker.opened_at -= 1  # Cooldown elapsed
+    breaker.check()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+@pytest.mark.unit
+def test_failed_preflight_opens_breaker():
+    """
+    Test Case: Verify an unreachable application is detected before any browser starts
+    """
+    breaker = CircuitBreaker(url="http://127.0.0.1:9", cooldown=60)
+
+    breaker.preflight()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert "preflight check failed" in breaker.reason
@@ -0,0 +1,132 @@
+"""
+Command Recorder Unit Tests - Recording actions, storing traces and replaying them (no browser needed)
+"""
+import pytest  # Import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from config.config import Config
+from utils.command_recorder import CommandRecorder, Replayer
+
+NAME_INPUT = (By.ID, "userName")
+OUTPUT = (By.ID, "output")
+
+
+class FakeWidget:
+    """Widget driver whose steps are recorded with its input locator"""
+
+    RECORDED_STATE = ("input_locator",)
+
+    def __init__(self):
+        self.input_locator = NAME_INPUT
+
+    @CommandRecorder.recorded
+    def fill(self, value):
+        self.check()  # Nested call: part of the fill step
+        return value
+
+    @CommandRecorder.recorded
+    def check(self):
+        raise TimeoutException("Element not found")
+
+
+class FakeElement:
+    def __init__(self, log, locator):
+        self.log, self.locator, self.text = log, locator, "Name:John"
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def clear(self):
+        self.log.append(("clear", self.locator))
+
+    def click(self):
+        self.log.append(("click", self.locator))
+
+    def send_keys(self, text):
+        self.log.append(("send_keys", self.locator, text))
+
+
+class FakeDriver:
+    """Stand-in WebDriver on which the output element never appears"""
+
+    def __init__(self):
+        self.log = []
+
+    def get(self, url):
+        self.log.append(("get", url))
+
+    def find_element(self, by, value):
+        if (by, value) == OUTPUT:
+            raise NoSuchElementException(value)
+        return FakeElement(self.log, (by, value))
+
+    def execute_script(self, script, *args):
+        pass
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    monkeypatch.setattr(Config, "RECORD_COMMANDS", True)
+    CommandRecorder.start()
+    yield
+    CommandRecorder.steps = None
+
+
+@pytest.mark.unit
+def test_outermost_calls_are_recorded_with_state_and_errors(recording):
+    """
+    Test Case: Verify a step records its widget state and arguments once, including the error it raised
+    """
+    with pytest.raises(TimeoutException):
+        FakeWidget().fill("John")
+
+    trace = CommandRecorder.trace("tests/test_x.py::test_x")
+
+    assert [step["action"] for step in trace["steps"]] == ["FakeWidget.fill"]
+    assert trace["steps"][0]["args"] == [list(NAME_INPUT), "John"]
+    assert trace["steps"][0]["error"] == "TimeoutException: Element not found"
+    assert trace["failed_step"] == 0
+
+
+@pytest.mark.unit
+def test_trace_round_trips_through_artifact_store(recording, monkeypatch, tmp_path):
+    """
+    Test Case: Verify a failed test's trace is stored compressed and loads back by path or hash prefix
+    """
+    monkeypatch.setattr(Config, "ARTIFACT_STORE", True)
+    monkeypatch.setattr(Config, "ARTIFACT_STORE_PATH", str(tmp_path))
+    CommandRecorder.steps.append({"action": "navigate", "args": ["https://demoqa.com/text-box"], "ms": 900})
+
+    path = CommandRecorder.save("tests/test_x.py::test_x")
+    digest = path.rsplit("/", 1)[1].split(".")[0]
+
+    assert path.endswith(".json.gz")
+    assert CommandRecorder.load(path)["steps"] == CommandRecorder.load(digest[:10])["steps"]
+    assert CommandRecorder.load(path)["test"] == "tests/test_x.py::test_x"
+
+
+@pytest.mark.unit
+def test_replay_runs_steps_and_stops_at_failed_step():
+    """
+    Test Case: Verify the replay types and clicks without pacing and stops where the test failed
+    """
+    trace = {"failed_step": 3, "steps": [
+        {"action": "navigate", "args": ["https://demoqa.com/text-box"]},
+        {"action": "send_keys", "args": [list(NAME_INPUT), "John"]},
+        {"action": "click", "args": [["css selector", "button#submit"]]},
+        {"action": "get_text", "args": [list(OUTPUT)], "error": "TimeoutException: Message:"},
+        {"action": "click", "args": [list(NAME_INPUT)]},
+    ]}
+    driver = FakeDriver()
+    lines = []
+
+    stopped = Replayer(driver, timeout=0.1).replay(trace, report=lines.append)
+
+    assert stopped == 3
+    assert driver.log == [("get", "https://demoqa.com/text-box"), ("clear", NAME_INPUT), ("send_keys", NAME_INPUT, "John"),
+                          ("click", ("css selector", "button#submit"))]
+    assert "reproduced" in lines[-1]
+    assert Replayer(FakeDriver(), timeout=0.1).replay(trace, stop_before=True, report=lines.append) == 3
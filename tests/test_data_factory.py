@@ -0,0 +1,51 @@
+"""
+Data Factory Unit Tests - Synthetic data uniqueness and formats (no browser needed)
+"""
+import re  # Format checks
+import pytest  # Import pytest
+from utils.data_factory import DataFactory
+from utils.test_data import TestData
+
+
+@pytest.mark.unit
+def test_generated_records_are_unique_at_scale():
+    """
+    Test Case: Verify emails and mobiles never repeat across a large batch
+    """
+    forms = list(DataFactory(seed=3).practice_forms(100_000))
+
+    assert len({form["email"] for form in forms}) == len(forms)
+    assert len({form["mobile"] for form in forms}) == len(forms)
+    assert all(len(form["mobile"]) == 10 and form["mobile"].isdigit() for form in forms[:1000])
+
+
+@pytest.mark.unit
+def test_records_match_test_data_shape():
+    """
+    Test Case: Verify generated records can replace the static TestData dicts
+    """
+    factory = DataFactory(seed=1)
+
+    assert factory.web_table_record_at(5).keys() == TestData.WEB_TABLE_RECORD.keys()
+    assert factory.practice_form_at(5).keys() == TestData.PRACTICE_FORM_DATA.keys()
+    assert factory.text_box_at(5).keys() == TestData.TEXT_BOX_DATA.keys()
+    assert re.fullmatch(r"\d{2} [A-Z][a-z]{2} \d{4}", factory.practice_form_at(5)["date_of_birth"])
+    # Pure per-index methods agree with the streaming generators
+    assert factory.web_table_record_at(42) == list(factory.web_table_records(3, start=41))[1]
+
+
+@pytest.mark.unit
+def test_next_values_do_not_collide_across_workers():
+    """
+    Test Case: Verify parallel workers draw unique emails and mobiles without coordinating
+    """
+    first, second = DataFactory(worker=0), DataFactory(worker=1)
+
+    emails = {first.next_email() for _ in range(1000)} | {second.next_email() for _ in range(1000)}
+    mobiles = {first.next_mobile() for _ in range(1000)} | {second.next_mobile() for _ in range(1000)}
+
+    assert len(emails) == 2000
+    assert len(mobiles) == 2000
+    record = first.make_unique(TestData.WEB_TABLE_RECORD)
+    assert record["email"] != TestData.WEB_TABLE_RECORD["email"]
+    assert record["first_name"] == TestData.WEB_TABLE_RECORD["first_name"]
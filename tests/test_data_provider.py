@@ -0,0 +1,75 @@
+"""
+Data Provider Unit Tests - Streaming datasets and sharding (no browser needed)
+"""
+import json  # Writing JSONL fixtures
+import pytest  # Import pytest
+from utils.data_provider import CsvSource, DataProvider, JsonlSource, SyntheticSource
+
+
+@pytest.mark.unit
+def test_csv_source_loads_records_by_index(tmp_path):
+    """
+    Test Case: Verify CSV records are indexed once and loaded individually
+    """
+    path = tmp_path / "records.csv"
+    path.write_text('first_name,email\nJane,jane@example.com\n\n"Smith, Jr",jr@example.com\n')
+
+    source = CsvSource(str(path))
+
+    assert len(source) == 2, "Blank lines should be skipped"
+    assert source.load(1) == {"first_name": "Smith, Jr", "email": "jr@example.com"}
+    assert source.load(0)["first_name"] == "Jane"
+
+
+@pytest.mark.unit
+def test_csv_quoted_fields_may_span_lines(tmp_path):
+    """
+    Test Case: Verify a quoted field with line breaks and escaped quotes stays one record
+    """
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(b'name,address\r\nJane,"12 Main St\r\nApt ""B""\r\n"\r\nJohn,1 Side St\r\n')
+
+    source = CsvSource(str(path))
+
+    assert len(source) == 2
+    assert source.load(0) == {"name": "Jane", "address": '12 Main St\r\nApt "B"\r\n'}
+    assert source.load(1) == {"name": "John", "address": "1 Side St"}
+
+
+@pytest.mark.unit
+def test_jsonl_source_loads_records_by_index(tmp_path):
+    """
+    Test Case: Verify JSONL records are loaded individually
+    """
+    path = tmp_path / "records.jsonl"
+    path.write_text("\n".join(json.dumps({"n": n}) for n in range(100)) + "\n")
+
+    source = JsonlSource(str(path))
+
+    assert len(source) == 100
+    assert source.load(42) == {"n": 42}
+
+
+@pytest.mark.unit
+def test_synthetic_records_are_deterministic():
+    """
+    Test Case: Verify the same seed produces the same records and emails are unique
+    """
+    first = SyntheticSource("practice_form", 1000, seed=7)
+    second = SyntheticSource("practice_form", 1000, seed=7)
+
+    assert first.load(500) == second.load(500)
+    assert len({first.load(i)["email"] for i in range(1000)}) == 1000
+    assert len(first.load(3)["mobile"]) == 10
+
+
+@pytest.mark.unit
+def test_shards_cover_dataset_exactly_once():
+    """
+    Test Case: Verify shards are disjoint, cover every record and respect the limit
+    """
+    shards = [list(DataProvider.shard_indices(10, shard, 3)) for shard in range(3)]
+
+    assert sorted(sum(shards, [])) == list(range(10))
+    assert DataProvider.parse_shard("2/3") == (1, 3)
+    assert list(DataProvider.shard_indices(10, 1, 3, limit=2)) == [1, 4]
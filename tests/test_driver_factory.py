@@ -0,0 +1,76 @@
+"""
+Driver Factory Unit Tests - Browser options of the launch profiles (no browser needed)
+"""
+import pytest  # Import pytest
+from config.config import Config
+from utils.driver_factory import DriverFactory
+
+
+@pytest.mark.unit
+def test_default_profile_keeps_legacy_arguments(monkeypatch):
+    """
+    Test Case: Verify the default launch profile passes only the original Chrome switches
+    """
+    monkeypatch.setattr(Config, "LAUNCH_PROFILE", "default")
+    monkeypatch.setattr(Config, "HEADLESS", True)
+
+    options = DriverFactory.get_options("chrome")
+
+    assert options.arguments == ["--headless", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]
+
+
+@pytest.mark.unit
+def test_performance_profile_sizes_window_and_keeps_cache(monkeypatch, tmp_path):
+    """
+    Test Case: Verify the performance profile uses new headless mode, a fixed viewport and a per-worker disk cache
+    """
+    monkeypatch.setattr(Config, "LAUNCH_PROFILE", "performance")
+    monkeypatch.setattr(Config, "HEADLESS", True)
+    monkeypatch.setattr(Config, "WINDOW_SIZE", "maximize")
+    monkeypatch.setattr(Config, "GRID_URL", None)
+    monkeypatch.setattr(Config, "BROWSER_CACHE_PATH", str(tmp_path))
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+
+    chrome = DriverFactory.get_options("chrome").arguments
+    firefox = DriverFactory.get_options("firefox")
+
+    assert "--headless=new" in chrome and "--headless" not in chrome
+    assert set(DriverFactory.PERFORMANCE_CHROMIUM_ARGS) <= set(chrome)
+    assert "--window-size=1920,1080" in chrome
+    assert f"--disk-cache-dir={tmp_path / 'gw1'}" in chrome
+    assert firefox.arguments == ["--headless", "--width=1920", "--height=1080"]
+    assert firefox.preferences["browser.cache.disk.parent_directory"] == str(tmp_path / "gw1")
+
+
+class FakeDriver:
+    """Stand-in driver recording window commands"""
+
+    def __init__(self, browser_name):
+        self.caps = {"browserName": browser_name}
+        self.window_commands = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def maximize_window(self):
+        self.window_commands.append("maximize")
+
+    def set_window_size(self, width, height):
+        self.window_commands.append((width, height))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("browser_name", ["chrome", "firefox", "msedge"])
+def test_performance_profile_sends_no_window_command(monkeypatch, browser_name):
+    """
+    Test Case: Verify no browser is maximized or resized after launch under the performance profile
+    """
+    monkeypatch.setattr(Config, "WINDOW_SIZE", "maximize")
+    monkeypatch.setattr(Config, "LAUNCH_PROFILE", "performance")
+    assert DriverFactory._configure(FakeDriver(browser_name)).window_commands == []
+
+    monkeypatch.setattr(Config, "LAUNCH_PROFILE", "default")
+    assert DriverFactory._configure(FakeDriver(browser_name)).window_commands == ["maximize"]
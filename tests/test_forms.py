@@ -3,6 +3,7 @@ Practice Form Tests - Forms Section
 """
 import pytest  # Import pytest
 from pages.forms_page import FormsPage  # Import Page Object
+from locators.forms_locators import FormsLocators
 from utils.test_data import TestData  # Import Test Data
 
 
@@ -39,3 +40,55 @@ def test_practice_form_submission(driver):
     # Assert: Verify the result
     assert forms_page.is_confirmation_displayed(), "Confirmation modal should be displayed after form submission"
     print(f"Practice form submitted successfully for {test_data['first_name']} {test_data['last_name']}")
+
+
+@pytest.mark.regression  # Data-driven variant, part of the full regression suite
+@pytest.mark.dataset("synthetic:practice_form")  # Seeded generated rows, size set by --dataset-size
+def test_practice_form_submission_from_dataset(driver, data_record):
+    """
+    Test Case: Verify practice form submission with generated data
+    
+    Steps:
+    1. Navigate to practice form page
+    2. Fill the form with the generated record
+    3. Verify confirmation modal is displayed
+    """
+    # Arrange: Initialize Page Object
+    forms_page = FormsPage(driver)
+    
+    # Act: Fill and submit the form with the record
+    forms_page.navigate_to_forms()
+    forms_page.fill_practice_form(
+        data_record["first_name"],
+        data_record["last_name"],
+        data_record["email"],
+        data_record["gender"],
+        data_record["mobile"],
+        data_record["date_of_birth"],
+        data_record["subjects"],
+        data_record["hobbies"],
+        data_record["current_address"]
+    )
+    
+    # Assert: Verify the result
+    assert forms_page.is_confirmation_displayed(), "Confirmation modal should be displayed after form submission"
+
+
+@pytest.mark.forms
+def test_date_picker_and_subjects_commit_values(driver):
+    """
+    Test Case: Verify the date picker and subjects auto-complete commit the requested values
+    
+    Steps:
+    1. Navigate to practice form page
+    2. Pick a date of birth and two subjects
+    3. Verify the input shows the date and both subjects were added
+    """
+    forms_page = FormsPage(driver)
+    forms_page.navigate_to_forms()
+    
+    forms_page.enter_date_of_birth("05 Mar 1990")
+    forms_page.enter_subjects(["Maths", "Physics"])
+    
+    assert forms_page.find_element(FormsLocators.DATE_OF_BIRTH_INPUT).get_attribute("value") == "05 Mar 1990"
+    assert forms_page.subjects_autocomplete.selected_values() == ["Maths", "Physics"]
@@ -0,0 +1,233 @@
+"""
+Impact Index Unit Tests - Dependency index and change-based test selection on a small git project (no browser needed)
+"""
+import shutil  # Skip when git is not installed
+import subprocess  # Commit the sample project
+from types import SimpleNamespace  # Stand-ins for collected items
+import pytest  # Import pytest
+from utils.impact_index import ImpactIndex
+
+SAMPLE_FILES = {
+    "locators/form_locators.py": (
+        "class FormLocators:\n"
+        "    NAME_INPUT = ('id', 'name')\n"
+        "    SUBMIT_BUTTON = ('id', 'submit')\n"
+        "    UNUSED = ('id', 'unused')\n"
+    ),
+    "pages/base_page.py": (
+        "class BasePage:\n"
+        "    def __init__(self, driver):\n"
+        "        self.driver = driver\n"
+        "\n"
+        "    def click(self, locator):\n"
+        "        self.driver.find_element(*locator).click()\n"
+    ),
+    "pages/form_page.py": (
+        "from pages.base_page import BasePage\n"
+        "from locators.form_locators import FormLocators\n"
+        "\n"
+        "\n"
+        "class FormPage(BasePage):\n"
+        "    def submit(self):\n"
+        "        self.click(FormLocators.SUBMIT_BUTTON)\n"
+        "\n"
+        "    def name(self):\n"
+        "        return self.driver.find_element(*FormLocators.NAME_INPUT).text\n"
+    ),
+    "tests/test_form.py": (
+        "from pages.form_page import FormPage\n"
+        "\n"
+        "\n"
+        "def test_submit(driver):\n"
+        "    page = FormPage(driver)\n"
+        "    page.submit()\n"
+        "\n"
+        "\n"
+        "def test_name(driver):\n"
+        "    page = FormPage(driver)\n"
+        "    assert page.name()\n"
+    ),
+    "tests/test_other.py": (
+        "def test_unrelated():\n"
+        "    assert True\n"
+    ),
+}
+
+
+def _git(root, *args):
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Committed sample project with a page object, its locators and two test modules"""
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+    for relpath, source in SAMPLE_FILES.items():
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "sample")
+    return tmp_path
+
+
+def _items():
+    return [SimpleNamespace(nodeid=nodeid) for nodeid in (
+        "tests/test_form.py::test_submit", "tests/test_form.py::test_name", "tests/test_other.py::test_unrelated",
+    )]
+
+
+def _select(project):
+    index = ImpactIndex(str(project), str(project / "index.json"))
+    index.update()
+    selected, _, run_all = index.select(_items())
+    return [item.nodeid.split("::")[1] for item in selected], run_all
+
+
+def _edit(project, relpath, old, new):
+    path = project / relpath
+    path.write_text(path.read_text().replace(old, new))
+
+
+@pytest.mark.unit
+def test_dependencies_follow_page_methods_to_locators(project):
+    """
+    Test Case: Verify a test depends on the page methods it calls, their base class methods and locators
+    """
+    index = ImpactIndex(str(project), str(project / "index.json"))
+    index.update()
+
+    dependencies = index.dependencies("tests/test_form.py::test_submit")
+
+    assert "pages/form_page.py::FormPage.submit" in dependencies
+    assert "pages/base_page.py::BasePage.click" in dependencies
+    assert "locators/form_locators.py::FormLocators.SUBMIT_BUTTON" in dependencies
+    assert "locators/form_locators.py::FormLocators.NAME_INPUT" not in dependencies
+
+
+@pytest.mark.unit
+def test_locator_change_selects_only_tests_using_it(project):
+    """
+    Test Case: Verify changing one locator selects only the test that uses it
+    """
+    _edit(project, "locators/form_locators.py", "'submit')", "'submit-button')")
+
+    selected, run_all = _select(project)
+
+    assert run_all is None
+    assert selected == ["test_submit"]
+
+
+@pytest.mark.unit
+def test_base_page_change_selects_tests_of_subclasses(project):
+    """
+    Test Case: Verify a change in an inherited page method selects the tests reaching it
+    """
+    _edit(project, "pages/base_page.py", ".click()", ".click()  # Plain click")
+
+    selected, run_all = _select(project)
+
+    assert run_all is None
+    assert selected == ["test_submit"]
+
+
+@pytest.mark.unit
+def test_unused_and_comment_changes_select_nothing(project):
+    """
+    Test Case: Verify an unused locator and comment-only edits deselect every test
+    """
+    _edit(project, "locators/form_locators.py", "'unused')", "'still-unused')")
+    _edit(project, "pages/form_page.py", "class FormPage", "# Form page\nclass FormPage")
+
+    selected, run_all = _select(project)
+
+    assert run_all is None
+    assert selected == []
+
+
+@pytest.mark.unit
+def test_unknown_impact_runs_everything(project):
+    """
+    Test Case: Verify a change outside any class or function falls back to the whole suite
+    """
+    _edit(project, "pages/form_page.py", "from pages.base_page import BasePage\n",
+          "from pages.base_page import BasePage\nTIMEOUT = 5\n")
+
+    selected, run_all = _select(project)
+
+    assert run_all is not None
+    assert len(selected) == 3
+
+
+@pytest.mark.unit
+def test_index_only_reparses_changed_files(project):
+    """
+    Test Case: Verify the cached index is reused and only modified files are parsed again
+    """
+    index = ImpactIndex(str(project), str(project / "index.json"))
+    assert index.update() == len(SAMPLE_FILES)
+    index.save()
+    _edit(project, "tests/test_other.py", "True", "1")
+
+    assert ImpactIndex(str(project), str(project / "index.json")).update() == 1
+
+
+@pytest.mark.unit
+def test_traced_calls_map_to_indexed_functions(project):
+    """
+    Test Case: Verify traced code objects are named by the index, for decorated methods and nested functions
+    """
+    import importlib.util  # Load the sample module from the temporary project
+    from utils.impact_index import ImpactTracer
+    (project / "utils").mkdir()
+    (project / "utils" / "helpers.py").write_text(
+        "import functools\n"
+        "\n"
+        "\n"
+        "class Helper:\n"
+        "    @staticmethod\n"
+        "    @functools.lru_cache(maxsize=None)\n"
+        "    def double(value):\n"
+        "        return value * 2\n"
+        "\n"
+        "    def apply(self, values):\n"
+        "        def add_one(value):\n"
+        "            return value + 1\n"
+        "        return [add_one(self.double(value)) for value in values]\n"
+    )
+    index = ImpactIndex(str(project), str(project / "index.json"))
+    index.update()
+    spec = importlib.util.spec_from_file_location("helpers", project / "utils" / "helpers.py")
+    helpers = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(helpers)
+    tracer = ImpactTracer(str(project), index)
+
+    tracer.start()
+    helpers.Helper().apply([1, 2])
+    called = tracer.stop()
+
+    assert called == ["utils/helpers.py::Helper.apply", "utils/helpers.py::Helper.double"]
+
+
+@pytest.mark.unit
+def test_worker_traces_reach_the_controller_index(project, monkeypatch):
+    """
+    Test Case: Verify calls traced on an xdist worker are sent through workeroutput and saved by the controller
+    """
+    from utils.impact_index import ImpactSelection
+    monkeypatch.setattr("config.config.Config.IMPACT_INDEX_FILE", "index.json")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw0")
+    worker = ImpactSelection(str(project), trace=True)
+    worker.traced_here = {"tests/test_form.py::test_submit": ["pages/form_page.py::FormPage.submit"]}
+    worker_config = SimpleNamespace(workeroutput={})
+    worker.pytest_sessionfinish(SimpleNamespace(config=worker_config))
+    monkeypatch.delenv("PYTEST_XDIST_WORKER")
+    controller = ImpactSelection(str(project), trace=True)
+
+    controller.pytest_testnodedown(SimpleNamespace(workeroutput=worker_config.workeroutput), None)
+    controller.pytest_sessionfinish(SimpleNamespace(config=SimpleNamespace()))
+
+    saved = ImpactIndex(str(project), str(project / "index.json")).traced
+    assert saved == {"tests/test_form.py::test_submit": ["pages/form_page.py::FormPage.submit"]}
@@ -0,0 +1,68 @@
+"""
+Locator Registry Unit Tests - Loading, XPath to CSS rewriting and slow pattern detection (no browser needed)
+"""
+import pytest  # Import pytest
+from selenium.webdriver.common.by import By
+from config.config import Config
+from locators.buttons_locators import ButtonsLocators
+from locators.web_tables_locators import WebTablesLocators
+from utils.locator_registry import LocatorRegistry
+
+
+@pytest.mark.unit
+def test_registry_loads_every_locator_class():
+    """
+    Test Case: Verify locators of all locator modules are registered by class and name
+    """
+    registry = LocatorRegistry.all()
+
+    assert registry["ButtonsLocators.DYNAMIC_CLICK_BUTTON"] == ButtonsLocators.DYNAMIC_CLICK_BUTTON
+    assert registry["WebTablesLocators.RECORD_CELL"] == WebTablesLocators.RECORD_CELL
+    assert all(LocatorRegistry.is_locator(locator) for locator in registry.values())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("xpath, css", [
+    ("//input[@id='userName']", "input#userName"),
+    ("//div[@class='rt-tbody']//div[@class='rt-td']", "div[class='rt-tbody'] div[class='rt-td']"),
+    ("//form/div[2]/input[@type='text' and @required]", "form > div:nth-of-type(2) > input[type='text'][required]"),
+    ("//*[contains(@class, 'modal') and starts-with(@id, 'close')]", "[class*='modal'][id^='close']"),
+    ("//button[text()='Click Me']", None),
+    ("(//button)[1]", None),
+    ("//div[@class='x'][2]", None),
+    ("//div[@class='a' or @class='b']", None),
+])
+def test_xpath_to_css(xpath, css):
+    """
+    Test Case: Verify XPath with a CSS equivalent is rewritten, and text or positional XPath is not
+    """
+    expected = (By.CSS_SELECTOR, css) if css else None
+
+    assert LocatorRegistry.to_css((By.XPATH, xpath)) == expected
+
+
+@pytest.mark.unit
+def test_preferred_follows_config(monkeypatch):
+    """
+    Test Case: Verify lookups use the CSS form only while PREFER_CSS_LOCATORS is on
+    """
+    locator = (By.XPATH, "//span[@title='Edit']")
+    monkeypatch.setattr(Config, "PREFER_CSS_LOCATORS", True)
+    assert LocatorRegistry.preferred(locator) == (By.CSS_SELECTOR, "span[title='Edit']")
+    assert LocatorRegistry.preferred(ButtonsLocators.DYNAMIC_CLICK_BUTTON) == ButtonsLocators.DYNAMIC_CLICK_BUTTON
+
+    monkeypatch.setattr(Config, "PREFER_CSS_LOCATORS", False)
+    assert LocatorRegistry.preferred(locator) == locator
+
+
+@pytest.mark.unit
+def test_analyze_flags_slow_patterns():
+    """
+    Test Case: Verify text matching, whole-document scans and deep descendant chains are reported
+    """
+    assert any("text" in warning for warning in LocatorRegistry.analyze(ButtonsLocators.DYNAMIC_CLICK_BUTTON))
+    assert any("//*" in warning for warning in LocatorRegistry.analyze((By.XPATH, "//*[@id='x']")))
+    assert LocatorRegistry.analyze((By.CSS_SELECTOR, "body div section ul li a"))
+    assert LocatorRegistry.analyze((By.CSS_SELECTOR, ".modal > *"))
+    assert LocatorRegistry.analyze((By.ID, "userName")) == []
+    assert LocatorRegistry.analyze((By.CSS_SELECTOR, "span[title='Edit']")) == []
@@ -0,0 +1,57 @@
+"""
+Metrics Unit Tests - OpenMetrics exposition (no browser needed)
+"""
+import urllib.request  # Scraping the live endpoint
+import pytest  # Import pytest
+from config.config import Config
+from utils.metrics import Counter, Histogram, Metrics
+
+
+@pytest.mark.unit
+def test_histogram_buckets_are_cumulative():
+    """
+    Test Case: Verify histogram series follow the OpenMetrics bucket/count/sum layout
+    """
+    histogram = Histogram("demo_seconds", "Demo", (0.1, 1))
+    for value in (0.05, 0.5, 0.7, 3):
+        histogram.observe(value, action="click")
+
+    lines = histogram.lines()
+
+    assert 'demo_seconds_bucket{action="click",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{action="click",le="1"} 3' in lines
+    assert 'demo_seconds_bucket{action="click",le="+Inf"} 4' in lines
+    assert 'demo_seconds_count{action="click"} 4' in lines
+    assert 'demo_seconds_sum{action="click"} 4.25' in lines
+
+
+@pytest.mark.unit
+def test_counter_escapes_label_values():
+    """
+    Test Case: Verify label values with quotes are escaped
+    """
+    counter = Counter("demo", "Demo")
+    counter.inc(2, url='https://demoqa.com/"x"')
+
+    assert counter.lines() == ['demo_total{url="https://demoqa.com/\\"x\\""} 2']
+
+
+@pytest.mark.unit
+def test_live_endpoint_serves_exposition(monkeypatch):
+    """
+    Test Case: Verify the local endpoint serves the registry in OpenMetrics format
+    """
+    monkeypatch.setattr(Config, "METRICS_ENABLED", True)
+    monkeypatch.setattr(Metrics, "tests", Counter("selenium_tests", "Finished tests by outcome"))
+    Metrics.record(Metrics.tests, 1, outcome="passed")
+    port = Metrics.serve(0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        Metrics.stop()
+
+    assert content_type.startswith("application/openmetrics-text")
+    assert 'selenium_tests_total{outcome="passed"}' in body
+    assert body.endswith("# EOF\n")
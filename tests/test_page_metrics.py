@@ -0,0 +1,28 @@
+"""
+Page Metrics Unit Tests - Performance budget checks (no browser needed)
+"""
+import pytest  # Import pytest
+from config.config import Config
+from utils.page_metrics import PageMetrics
+
+
+@pytest.mark.unit
+def test_budget_reports_only_exceeded_metrics():
+    """
+    Test Case: Verify metrics over budget are reported and missing metrics are ignored
+    """
+    metrics = {"load": 9500.0, "first_contentful_paint": 1200.0}
+    budget = {"load": 8000, "first_contentful_paint": 3000, "largest_contentful_paint": 4000}
+
+    violations = PageMetrics.check_budget(metrics, budget)
+
+    assert violations == ["load = 9500.0 exceeds budget 8000"]
+
+
+@pytest.mark.unit
+def test_every_page_url_has_a_budget():
+    """
+    Test Case: Verify budgets are configured for the page URLs the page objects navigate to
+    """
+    for url in (Config.LOGIN_URL, Config.TEXT_BOX_URL, Config.BUTTONS_URL, Config.WEB_TABLES_URL, Config.FORMS_URL):
+        assert "load" in Config.PERFORMANCE_BUDGETS[url]
@@ -0,0 +1,40 @@
+"""
+Page Reuse Unit Tests - Grouping tests by page object (no browser needed)
+"""
+from types import SimpleNamespace  # Stand-in for collected items
+import pytest  # Import pytest
+from pages.buttons_page import ButtonsPage
+from pages.text_box_page import TextBoxPage
+from utils.page_reuse import PageReuse
+
+
+def _text_box_test(driver):
+    TextBoxPage(driver).navigate_to_text_box()
+
+
+def _buttons_test(driver):
+    ButtonsPage(driver).navigate_to_buttons()
+
+
+def _no_page_test():
+    assert True
+
+
+@pytest.mark.unit
+def test_tests_are_grouped_by_page_object_in_first_seen_order():
+    """
+    Test Case: Verify tests on the same page run back to back without changing order inside a group
+    """
+    items = [
+        SimpleNamespace(name="text_box_1", function=_text_box_test),
+        SimpleNamespace(name="buttons_1", function=_buttons_test),
+        SimpleNamespace(name="unit_1", function=_no_page_test),
+        SimpleNamespace(name="text_box_2", function=_text_box_test),
+        SimpleNamespace(name="buttons_2", function=_buttons_test),
+    ]
+
+    ordered = [item.name for item in PageReuse.reorder(items)]
+
+    assert ordered == ["text_box_1", "text_box_2", "buttons_1", "buttons_2", "unit_1"]
+    assert PageReuse.page_key(items[0]) == "pages.text_box_page.TextBoxPage"
+    assert PageReuse.page_key(items[2]) is None
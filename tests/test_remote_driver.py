@@ -0,0 +1,95 @@
+"""
+Remote Backend Unit Tests - Grid capacity parsing and command timing (no browser needed)
+"""
+import pytest  # Import pytest
+from utils.command_timer import CommandTimer  # Command round trip timing
+from utils.remote_driver import RemoteSessionPool  # Grid session pool
+
+
+# Trimmed GET /status response of a grid with one busy and two idle Chrome slots
+GRID_STATUS = {
+    "value": {
+        "ready": True,
+        "nodes": [
+            {"availability": "UP", "slots": [
+                {"session": {"sessionId": "abc"}, "stereotype": {"browserName": "chrome"}},
+                {"session": None, "stereotype": {"browserName": "chrome"}},
+                {"session": None, "stereotype": {"browserName": "firefox"}},
+            ]},
+            {"availability": "UP", "slots": [
+                {"session": None, "stereotype": {"browserName": "chrome"}},
+            ]},
+            {"availability": "DRAINING", "slots": [
+                {"session": None, "stereotype": {"browserName": "chrome"}},
+            ]},
+        ]
+    }
+}
+
+
+@pytest.mark.unit
+def test_count_free_slots_per_browser():
+    """
+    Test Case: Verify free grid slots are counted per browser and only on available nodes
+    """
+    assert RemoteSessionPool.count_free_slots(GRID_STATUS, "chrome") == 2
+    assert RemoteSessionPool.count_free_slots(GRID_STATUS, "firefox") == 1
+    assert RemoteSessionPool.count_free_slots(GRID_STATUS, "edge") == 0
+
+
+@pytest.mark.unit
+def test_command_timer_records_each_command():
+    """
+    Test Case: Verify the command timer wraps an executor once and aggregates per command
+    """
+    class FakeExecutor:
+        def execute(self, command, params):
+            return {"value": command}
+
+    executor = FakeExecutor()
+    timer = CommandTimer()
+    timer.instrument(executor)
+    timer.instrument(executor)  # Second call must not double count
+
+    executor.execute("findElement", {})
+    executor.execute("findElement", {})
+    executor.execute("get", {})
+
+    assert timer.stats["findElement"].count == 2
+    assert timer.stats["get"].count == 1
+    assert timer.summary_lines()[0].startswith("command")
+
+
+class FakeSession:
+    """Stand-in pooled session counting how often it was ended"""
+
+    def __init__(self):
+        self.session_id = "abc"
+        self.recycle_reason = None
+        self.ended = 0
+
+    def end_session(self):
+        self.ended += 1
+
+
+@pytest.mark.unit
+def test_release_ends_a_recycled_session_once(monkeypatch):
+    """
+    Test Case: Verify a second quit() of a recycled session neither ends it again nor frees its slot twice
+    """
+    from config.config import Config
+    from utils.driver_factory import DriverFactory
+    monkeypatch.setattr(Config, "GRID_URL", "http://grid.example:4444")
+    monkeypatch.setattr(Config, "GRID_MAX_SESSIONS", 1)
+    monkeypatch.setattr(DriverFactory, "reset_state", staticmethod(lambda driver: None))
+    pool = RemoteSessionPool("chrome")
+    session = FakeSession()
+    pool._idle.append(session)
+
+    assert pool.acquire() is session
+    session.recycle_reason = "served 51 tests (limit 50)"
+    pool.release(session)
+    pool.release(session)  # BoundedSemaphore raises ValueError on an extra release
+
+    assert session.ended == 1 and pool._idle == []
+    assert pool._slots.acquire(blocking=False)
@@ -0,0 +1,167 @@
+"""
+Resource Monitor Unit Tests - Browser resource samples, recycle thresholds and recycling (no browser needed)
+"""
+import os  # The test process stands in for the browser process tree
+import types  # Fake driver service
+import pytest  # Import pytest
+from selenium.webdriver.remote.command import Command
+from config.config import Config
+from utils.resource_monitor import ResourceMonitor
+
+
+class FakeChromeDriver:
+    """Stand-in local Chrome driver whose service process is the test process"""
+
+    def __init__(self, heap_mb=40):
+        self.session_id = "session-1"
+        self.caps = {"browserName": "chrome", "pageLoadStrategy": "normal"}
+        self.service = types.SimpleNamespace(process=types.SimpleNamespace(pid=os.getpid()))
+        self.heap_mb = heap_mb
+        self.commands = []
+        self.new_sessions = []
+
+    def execute(self, command, params=None):
+        self.commands.append(params["cmd"] if command == "executeCdpCommand" else command)
+        if params and params.get("cmd") == "Performance.getMetrics":
+            return {"value": {"metrics": [
+                {"name": "JSHeapUsedSize", "value": self.heap_mb * 1024 * 1024},
+                {"name": "JSHeapTotalSize", "value": 2 * self.heap_mb * 1024 * 1024},
+                {"name": "Nodes", "value": 1200},
+                {"name": "Documents", "value": 3},
+            ]}}
+        return {"value": {}}
+
+    def start_session(self, capabilities):
+        self.new_sessions.append(capabilities)
+        self.session_id = f"session-{len(self.new_sessions) + 1}"
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def maximize_window(self):
+        pass
+
+
+class FakePooledDriver(FakeChromeDriver):
+    """Stand-in pooled grid session: its pool ends the session when recycle_reason is set"""
+
+    recycle_reason = None
+
+
+@pytest.mark.unit
+def test_sample_reports_process_and_heap_figures():
+    """
+    Test Case: Verify a sample has process memory and CPU plus JS heap and DOM counts, enabling DevTools once
+    """
+    monitor = ResourceMonitor(FakeChromeDriver())
+
+    monitor.begin_test()
+    sum(range(200000))  # Some CPU time to measure
+    first = monitor.sample()
+    second = monitor.sample()
+
+    assert first["rss_mb"] > 0 and first["cpu_percent"] >= 0
+    assert (first["js_heap_mb"], first["js_heap_total_mb"], first["dom_nodes"], first["documents"]) == (40, 80, 1200, 3)
+    assert (first["tests"], second["tests"]) == (1, 2)
+    assert monitor.driver.commands.count("Performance.enable") == 1
+
+
+@pytest.mark.unit
+def test_recycle_reason_checks_thresholds(monkeypatch):
+    """
+    Test Case: Verify the first crossed threshold is reported and disabled thresholds are ignored
+    """
+    monkeypatch.setattr(Config, "RECYCLE_RSS_MB", 1500)
+    monkeypatch.setattr(Config, "RECYCLE_JS_HEAP_MB", 256)
+    monkeypatch.setattr(Config, "RECYCLE_DOM_NODES", None)
+    monkeypatch.setattr(Config, "RECYCLE_AFTER_TESTS", 50)
+
+    assert ResourceMonitor.recycle_reason({"rss_mb": 900, "js_heap_mb": 120, "dom_nodes": 10 ** 6, "tests": 3}) is None
+    assert ResourceMonitor.recycle_reason({"rss_mb": 900, "js_heap_mb": 300.5, "tests": 3}) == "JS heap 300.5 MB > 256 MB"
+    assert ResourceMonitor.recycle_reason({"tests": 51}) == "served 51 tests (limit 50)"
+
+
+@pytest.mark.unit
+def test_recycle_restarts_local_session_in_place_and_flags_pooled_sessions(monkeypatch):
+    """
+    Test Case: Verify a local driver gets a new browser session on the same object and a pooled one is flagged
+    """
+    monkeypatch.setattr(Config, "WINDOW_SIZE", "maximize")
+    local = FakeChromeDriver()
+    monitor = ResourceMonitor(local)
+    monitor.sample()
+
+    monitor.recycle("JS heap 300 MB > 256 MB")
+
+    assert Command.QUIT in local.commands
+    assert local.new_sessions[0]["browserName"] == "chrome"
+    assert local.session_id == "session-2" and monitor.tests == 0
+
+    pooled = FakePooledDriver()
+    ResourceMonitor(pooled).recycle("served 51 tests (limit 50)")
+    assert pooled.recycle_reason == "served 51 tests (limit 50)"
+    assert not pooled.new_sessions
+
+
+def _attached_driver(session_id="daemon-session"):
+    from selenium import webdriver
+    from utils.browser_daemon import AttachedDriver
+    # No request is sent: start_session() adopts the given session
+    return AttachedDriver("http://127.0.0.1:9", session_id, {"browserName": "chrome"}, webdriver.ChromeOptions())
+
+
+@pytest.mark.unit
+def test_daemon_attachments_share_one_monitor(monkeypatch):
+    """
+    Test Case: Verify tests attached to the daemon's session count towards one monitor, so RECYCLE_AFTER_TESTS applies
+    """
+    monkeypatch.setattr(ResourceMonitor, "_session_monitors", {})
+    monkeypatch.setattr(ResourceMonitor, "_performance_metrics", lambda self: {})
+    first, second = _attached_driver(), _attached_driver()
+
+    ResourceMonitor.for_driver(first).sample()
+    sample = ResourceMonitor.for_driver(second).sample()
+
+    assert sample["tests"] == 2
+    assert ResourceMonitor.for_driver(second).driver is second
+
+
+@pytest.mark.unit
+def test_daemon_restart_waits_for_other_workers(monkeypatch, tmp_path):
+    """
+    Test Case: Verify a recycled daemon driver only restarts the daemon once no other process is attached
+    """
+    from utils.browser_daemon import AttachedDriver, BrowserDaemon
+    monkeypatch.setattr(Config, "DAEMON_STATE_FILE", str(tmp_path / "daemon.json"))
+    monkeypatch.setattr(AttachedDriver, "reset_state", lambda self: None)
+    restarts = []
+    monkeypatch.setattr(BrowserDaemon, "restart", staticmethod(lambda: restarts.append(1)))
+    BrowserDaemon._write_state({"pid": os.getpid(), "session_id": "daemon-session"})
+    open(BrowserDaemon._lease_path(os.getppid()), "w").close()  # Another worker is mid-test
+    driver = _attached_driver()
+    driver.recycle_reason = "served 51 tests (limit 50)"
+
+    driver.quit()
+    assert not restarts and BrowserDaemon.read_state()["restart_reason"] == "served 51 tests (limit 50)"
+
+    os.remove(BrowserDaemon._lease_path(os.getppid()))  # The other worker detaches
+    _attached_driver().quit()
+    assert restarts == [1]
+
+
+@pytest.mark.unit
+def test_daemon_launched_with_other_settings_is_not_attached(monkeypatch, tmp_path):
+    """
+    Test Case: Verify a run does not attach to a daemon whose browser was launched with other settings
+    """
+    from utils.browser_daemon import BrowserDaemon
+    monkeypatch.setattr(Config, "DAEMON_STATE_FILE", str(tmp_path / "daemon.json"))
+    monkeypatch.setattr(Config, "HEADLESS", False)
+    settings = dict(BrowserDaemon.launch_settings(), HEADLESS=True)
+    BrowserDaemon._write_state({"pid": os.getpid(), "browser": "chrome", "settings": settings})
+
+    assert BrowserDaemon.attach("chrome") is None
+    assert not os.path.exists(BrowserDaemon._lease_path(os.getpid()))
@@ -0,0 +1,83 @@
+"""
+Session Cache Unit Tests - Storing, expiring and invalidating cached logins (no browser needed)
+"""
+import os  # File permission checks
+import time  # Expiry timestamps
+import pytest  # Import pytest
+from config.config import Config
+from utils.session_cache import SessionCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the session cache at a temporary directory."""
+    monkeypatch.setattr(Config, "SESSION_CACHE_PATH", str(tmp_path))
+    monkeypatch.setattr(SessionCache, "_memory", {})
+    return tmp_path
+
+
+def _state(expires):
+    return {
+        "origin": "https://demoqa.com",
+        "cookies": [{"name": "token", "value": "abc", "domain": "demoqa.com", "path": "/"}],
+        "local_storage": {},
+        "session_storage": {},
+        "expires": expires,
+    }
+
+
+@pytest.mark.unit
+def test_saved_session_is_loaded_per_credential_set(cache_dir):
+    """
+    Test Case: Verify a session is stored privately and only returned for the same credentials
+    """
+    SessionCache.save("user", "secret", _state(time.time() + 60))
+
+    SessionCache._memory.clear()  # Force a read from disk, as a new worker would
+    assert SessionCache.load("user", "secret")["cookies"][0]["value"] == "abc"
+    assert SessionCache.load("user", "changed") is None
+    (path,) = cache_dir.iterdir()
+    assert os.stat(path).st_mode & 0o077 == 0, "Cached tokens must be readable by the owner only"
+
+
+@pytest.mark.unit
+def test_expired_and_invalidated_sessions_are_dropped(cache_dir):
+    """
+    Test Case: Verify expired sessions are deleted and invalidate() forgets a session
+    """
+    SessionCache.save("expired", "secret", _state(time.time() - 1))
+    SessionCache.save("rejected", "secret", _state(time.time() + 60))
+
+    assert SessionCache.load("expired", "secret") is None
+    SessionCache.invalidate("rejected", "secret")
+    assert SessionCache.load("rejected", "secret") is None
+    assert list(cache_dir.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_reinjected_and_rejected_sessions_stop_seeding_storage():
+    """
+    Test Case: Verify the storage seeding script of a previous injection is removed before re-injection and on rejection
+    """
+    class FakeChromeDriver:
+        caps = {"browserName": "chrome"}
+
+        def __init__(self):
+            self.commands = []
+
+        def execute(self, command, params):
+            self.commands.append((params["cmd"], params["params"].get("identifier")))
+            return {"value": {"identifier": str(len(self.commands))}}
+
+    driver = FakeChromeDriver()
+    SessionCache.inject(driver, _state(time.time() + 60))
+    SessionCache.inject(driver, _state(time.time() + 60))
+    SessionCache.remove_injected(driver)
+    SessionCache.remove_injected(driver)
+
+    assert driver.commands == [
+        ("Network.setCookies", None), ("Page.addScriptToEvaluateOnNewDocument", None),
+        ("Page.removeScriptToEvaluateOnNewDocument", "2"),
+        ("Network.setCookies", None), ("Page.addScriptToEvaluateOnNewDocument", None),
+        ("Page.removeScriptToEvaluateOnNewDocument", "5"),
+    ]
@@ -0,0 +1,76 @@
+"""
+Settings Unit Tests - Profile, environment and command line layering, per-worker values and switching (no browser needed)
+"""
+import pytest  # Import pytest
+from config.config import Config
+from config.settings import Settings
+
+
+@pytest.mark.unit
+def test_layers_override_in_order():
+    """
+    Test Case: Verify the command line beats the environment, which beats the profile, which beats Config
+    """
+    settings = Settings.resolve("ci", {"TEST_RETRIES": "3"}, environ={"QA_HEADLESS": "false", "QA_TEST_RETRIES": "2"})
+
+    assert settings.TEST_RETRIES == 3
+    assert settings.HEADLESS is False
+    assert settings.WINDOW_SIZE == (1920, 1080)
+    assert settings.EXPLICIT_WAIT == 15
+    assert settings.sources == {"HEADLESS": "environment", "WINDOW_SIZE": "profile ci", "USE_BROWSER_DAEMON": "profile ci",
+                                "TEST_RETRIES": "command line", "SESSION_CACHE_PATH": "profile ci (all workers)"}
+    assert Settings.resolve("ci", {"TEST_RETRIES": "3"}, environ={"QA_HEADLESS": "false", "QA_TEST_RETRIES": "2"}) is settings
+
+
+@pytest.mark.unit
+def test_worker_values_and_derived_urls():
+    """
+    Test Case: Verify each xdist worker gets its own base URL and every page URL follows it
+    """
+    settings = Settings.resolve("local", environ={}, worker="gw2")
+
+    assert settings.BASE_URL == "http://localhost:3002"
+    assert settings.LOGIN_URL == "http://localhost:3002/login"
+    assert "http://localhost:3002/webtables" in settings.PERFORMANCE_BUDGETS
+    explicit = Settings.resolve(overrides={"BASE_URL": "http://127.0.0.1:8080/", "LOGIN_URL": "https://sso.example/login"},
+                                environ={})
+    assert explicit.FORMS_URL == "http://127.0.0.1:8080/automation-practice-form"
+    assert explicit.LOGIN_URL == "https://sso.example/login"
+    braces = Settings.resolve(overrides={"SESSION_CACHE_PATH": "cache/{worker}-{}", "BROWSER": "p{a}ss"},
+                              environ={}, worker="gw1")
+    assert (braces.SESSION_CACHE_PATH, braces.BROWSER) == ("cache/gw1-{}", "p{a}ss")
+
+
+@pytest.mark.unit
+def test_invalid_settings_are_rejected():
+    """
+    Test Case: Verify unknown names and values of the wrong type fail resolution
+    """
+    with pytest.raises(ValueError, match="Unknown setting"):
+        Settings.resolve(overrides={"EXPLICT_WAIT": "5"}, environ={})
+    with pytest.raises(ValueError, match="SESSION_CACHE_PATH from command line"):
+        Settings.resolve(overrides={"SESSION_CACHE_PATH": "cache/{worker:d}"}, environ={})
+    with pytest.raises(ValueError, match="number"):
+        Settings.resolve(environ={"QA_EXPLICIT_WAIT": "soon"})
+    with pytest.raises(ValueError, match="not found"):
+        Settings.resolve("missing", environ={})
+
+
+@pytest.mark.unit
+def test_snapshot_is_immutable_and_switches_config_in_place():
+    """
+    Test Case: Verify a snapshot cannot be changed and activating one updates Config without re-importing
+    """
+    previous = Settings.current()
+    settings = Settings.resolve(overrides={"BROWSER": "firefox", "HEADLESS": "true"}, environ={})
+    with pytest.raises(AttributeError):
+        settings.BROWSER = "edge"
+
+    try:
+        Settings.activate(settings)
+        assert (Config.BROWSER, Config.HEADLESS) == ("firefox", True)
+        Config.PERFORMANCE_BUDGETS.clear()  # Changing Config does not reach the snapshot
+        assert settings.PERFORMANCE_BUDGETS
+    finally:
+        Settings.activate(previous)
+    assert Config.PERFORMANCE_BUDGETS == previous.PERFORMANCE_BUDGETS
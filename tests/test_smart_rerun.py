@@ -0,0 +1,119 @@
+"""
+Smart Rerun Unit Tests - Test history, flakiness rates and last-failed-first ordering (no browser needed)
+"""
+from types import SimpleNamespace  # Stand-ins for collected items
+import pytest  # Import pytest
+from utils.test_history import TestHistory
+
+
+@pytest.mark.unit
+def test_history_tracks_failures_and_flaky_passes(tmp_path):
+    """
+    Test Case: Verify failures and passes-after-retry are counted and survive a reload
+    """
+    path = str(tmp_path / "history.json")
+    history = TestHistory(path)
+    history.record("tests/test_a.py::test_a", "passed", attempts=2)
+    history.record("tests/test_a.py::test_a", "passed")
+    history.record("tests/test_b.py::test_b", "failed", attempts=3)
+    history.save()
+
+    reloaded = TestHistory(path)
+
+    assert reloaded.flaky_rate("tests/test_a.py::test_a") == 0.5
+    assert reloaded.tests["tests/test_b.py::test_b"]["failures"] == 1
+    assert reloaded.flaky_rate("tests/test_unknown.py::test_c") == 0.0
+
+
+@pytest.mark.unit
+def test_last_failed_tests_run_first_then_flakiest(tmp_path):
+    """
+    Test Case: Verify ordering puts last session's failures first, then flaky tests, keeping order otherwise
+    """
+    history = TestHistory(str(tmp_path / "history.json"))
+    history.record("stable_1", "passed")
+    history.record("flaky", "passed", attempts=2)
+    history.record("failed", "failed")
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in ("stable_1", "new", "flaky", "failed")]
+
+    ordered = [item.nodeid for item in history.failed_first(items)]
+
+    assert ordered == ["failed", "flaky", "stable_1", "new"]
+
+
+@pytest.mark.unit
+def test_failing_body_is_retried_in_place(pytester, monkeypatch):
+    """
+    Test Case: Verify a failing test body is retried without re-running its fixtures and counted as flaky
+    """
+    from config.config import Config
+    monkeypatch.setattr(Config, "RETRY_BACKOFF", 0)
+    pytester.makeconftest("""
+        from utils.smart_rerun import SmartRerun
+
+        def pytest_configure(config):
+            config.pluginmanager.register(SmartRerun(retries=2), "smart_rerun")
+    """)
+    pytester.makepyfile("""
+        import pytest
+
+        setups, attempts = [], []
+
+        @pytest.fixture
+        def resource():
+            setups.append(1)
+            return "resource"
+
+        def test_flaky(resource):
+            attempts.append(1)
+            assert len(attempts) == 3, "fails on the first two attempts"
+            assert len(setups) == 1
+
+        def test_broken():
+            assert False
+    """)
+
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider")
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*flaky tests (passed after retry)*", "*test_flaky: 3 attempts*"])
+    history = TestHistory(str(pytester.path / ".test_history.json"))
+    assert history.tests["test_failing_body_is_retried_in_place.py::test_broken"]["last_attempts"] == 3
+
+
+@pytest.mark.unit
+def test_history_is_only_written_when_used(pytester):
+    """
+    Test Case: Verify a session without retries or last-failed-first ordering leaves no history file
+    """
+    pytester.makeconftest("""
+        from utils.smart_rerun import SmartRerun
+
+        def pytest_configure(config):
+            config.pluginmanager.register(SmartRerun(retries=0), "smart_rerun")
+    """)
+    pytester.makepyfile("def test_broken():\n    assert False\n")
+
+    pytester.runpytest_inprocess("-p", "no:cacheprovider").assert_outcomes(failed=1)
+
+    assert not (pytester.path / ".test_history.json").exists()
+
+
+@pytest.mark.unit
+def test_last_failed_first_keeps_page_groups(tmp_path):
+    """
+    Test Case: Verify last-failed-first ordering followed by --reuse-pages grouping keeps pages together,
+    starting with the page of the failed test
+    """
+    from utils.page_reuse import PageReuse
+    from tests.test_page_reuse import _buttons_test, _text_box_test
+    history = TestHistory(str(tmp_path / "history.json"))
+    history.record("buttons_2", "failed")
+    items = [SimpleNamespace(nodeid=nodeid, function=function) for nodeid, function in (
+        ("text_box_1", _text_box_test), ("buttons_1", _buttons_test),
+        ("text_box_2", _text_box_test), ("buttons_2", _buttons_test),
+    )]
+
+    ordered = [item.nodeid for item in PageReuse.reorder(history.failed_first(items))]
+
+    assert ordered == ["buttons_2", "buttons_1", "text_box_1", "text_box_2"]
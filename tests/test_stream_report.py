@@ -0,0 +1,60 @@
+"""
+Streaming Report Unit Tests - Incremental JSONL results and shard merging (no browser needed)
+"""
+import json  # Reading the written records
+from types import SimpleNamespace  # Stand-ins for pytest reports and session
+import pytest  # Import pytest
+from utils.stream_report import StreamReport
+
+
+def _report(when, outcome, user_properties=()):
+    return SimpleNamespace(
+        nodeid="tests/test_demo.py::test_demo", when=when, outcome=outcome, duration=0.5,
+        failed=outcome == "failed", skipped=outcome == "skipped", longrepr="AssertionError: boom" if outcome == "failed" else None,
+        user_properties=list(user_properties),
+    )
+
+
+def _session():
+    return SimpleNamespace(config=SimpleNamespace(invocation_params=SimpleNamespace(args=("tests",))))
+
+
+@pytest.mark.unit
+def test_each_test_is_written_when_it_finishes(tmp_path):
+    """
+    Test Case: Verify a test's record is on disk right after its teardown, with artifacts as paths
+    """
+    report = StreamReport(str(tmp_path / "stream"))
+    report.pytest_sessionstart(_session())
+    report.pytest_runtest_logreport(_report("setup", "passed"))
+    report.pytest_runtest_logreport(_report("call", "failed", [("artifact", str(tmp_path / "shot.png"))]))
+    report.pytest_runtest_logreport(_report("teardown", "passed"))
+
+    # Read before the session finishes: the record is already there
+    lines = (tmp_path / "stream" / "results.jsonl").read_text().splitlines()
+    record = json.loads(lines[-1])
+    assert record["outcome"] == "failed"
+    assert record["duration"] == 1.5
+    assert record["artifacts"] == [{"path": str(tmp_path / "shot.png"), "href": "../shot.png"}]
+    assert (tmp_path / "stream" / "index.html").exists()
+
+    report.pytest_sessionfinish(_session(), 1)
+    summary = json.loads((tmp_path / "stream" / "results.jsonl").read_text().splitlines()[-1])
+    assert summary == {**summary, "type": "summary", "counts": {"failed": 1}}
+
+
+@pytest.mark.unit
+def test_shards_are_merged_by_concatenation(tmp_path):
+    """
+    Test Case: Verify result files of several jobs merge into one file with every record
+    """
+    first, second = tmp_path / "job1.jsonl", tmp_path / "job2.jsonl"
+    first.write_text('{"type": "test", "nodeid": "a"}\n')
+    second.write_text('{"type": "test", "nodeid": "b"}\n')
+
+    StreamReport.merge([str(first), str(second)], str(tmp_path / "merged" / "results.jsonl"))
+
+    merged = (tmp_path / "merged" / "results.jsonl").read_text().splitlines()
+    assert [json.loads(line)["nodeid"] for line in merged] == ["a", "b"]
+    with pytest.raises(ValueError):
+        StreamReport.merge([str(first)], str(first))
@@ -0,0 +1,26 @@
+"""
+Multi-tab Execution Tests - Independent flows sharing a single driver
+"""
+import pytest  # Import pytest
+from tests.flows import buttons_flow, text_box_flow  # Flows mirroring the page tests
+from utils.tab_scheduler import TabScheduler  # Multi-tab scheduler
+
+
+@pytest.mark.elements  # Mark as 'elements' suite
+def test_flows_interleaved_across_tabs(driver):
+    """
+    Test Case: Verify independent page-object flows can share one driver through tabs
+
+    Steps:
+    1. Open two tabs in the same driver
+    2. Run the buttons and text box flows concurrently, one per tab
+    3. Verify both flows passed and the extra tab is closed afterwards
+    """
+    # Arrange & Act: Run both flows in their own tab
+    with TabScheduler(driver, tabs=2) as scheduler:
+        results = scheduler.run([buttons_flow, text_box_flow])
+
+    # Assert: Both flows passed and only the original tab remains
+    assert all(result.passed for result in results), f"All flows should pass: {results}"
+    assert len(driver.window_handles) == 1, "Extra tabs should be closed after the run"
+    print(f"Tab flows completed: {results}")
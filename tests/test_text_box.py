@@ -36,3 +36,36 @@ def test_text_box_form_submission(driver):
     assert test_data["full_name"] in output_text, "Full name should be in output"
     assert test_data["email"] in output_text, "Email should be in output"
     print(f"Text box form submitted successfully. Output: {output_text}")
+
+
+@pytest.mark.elements
+def test_text_box_reset_clears_submitted_state(driver, monkeypatch):
+    """
+    Test Case: Verify the in-page reset used by --reuse-pages leaves no state for the next test
+    
+    Steps:
+    1. Submit the form
+    2. Reset the page in place
+    3. Verify the fields are empty and the output is hidden
+    4. Submit new data and verify only it is shown
+    """
+    from config.config import Config
+    from locators.text_box_locators import TextBoxLocators
+    monkeypatch.setattr(Config, "REUSE_PAGES", True)
+    text_box_page = TextBoxPage(driver)
+    test_data = TestData.TEXT_BOX_DATA
+    text_box_page.navigate_to_text_box()
+    text_box_page.fill_form(test_data["full_name"], test_data["email"],
+                            test_data["current_address"], test_data["permanent_address"])
+    
+    text_box_page.reset_page()
+    
+    for locator in (TextBoxLocators.FULL_NAME_INPUT, TextBoxLocators.EMAIL_INPUT,
+                    TextBoxLocators.CURRENT_ADDRESS_INPUT, TextBoxLocators.PERMANENT_ADDRESS_INPUT):
+        assert text_box_page.find_element(locator).get_attribute("value") == "", f"{locator} should be empty"
+    assert not text_box_page.is_output_displayed(), "Output should be hidden after the reset"
+    # The component state was cleared too: a new submission shows only the new values
+    text_box_page.enter_full_name("Jane Roe")
+    text_box_page.click_submit()
+    output_text = text_box_page.get_output_text()
+    assert "Jane Roe" in output_text and test_data["email"] not in output_text
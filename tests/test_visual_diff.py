@@ -0,0 +1,142 @@
+"""
+Visual Diff Unit Tests - Region thresholds, ignore masks, perceptual hashes and baselines on synthetic images (no browser needed)
+"""
+from io import BytesIO  # Encode synthetic screenshots
+import pytest  # Import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from config.config import Config  # noqa: E402 - after the optional dependency check
+from utils.visual_diff import VisualDiff  # noqa: E402
+
+
+def _page(height=120, width=200):
+    """Synthetic screenshot: a dark header bar above a grid of coloured blocks"""
+    blocks = np.random.default_rng(7).integers(0, 256, (height // 10 + 1, width // 10 + 1, 3), dtype=np.uint8)
+    image = np.repeat(np.repeat(blocks, 10, axis=0), 10, axis=1)[:height, :width].copy()
+    image[:20] = (30, 30, 30)
+    return image
+
+
+def _png(image):
+    buffer = BytesIO()
+    Image.fromarray(image).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.unit
+def test_identical_screenshots_short_circuit():
+    """
+    Test Case: Verify identical screenshots pass without a pixel diff
+    """
+    result, changed = VisualDiff.compare(_png(_page()), _page())
+
+    assert result.passed and result.reason == "identical"
+    assert changed is None
+
+
+@pytest.mark.unit
+def test_noise_below_tolerance_is_ignored():
+    """
+    Test Case: Verify small channel differences (anti-aliasing) are not counted as changes
+    """
+    actual = _page()
+    actual[50:60, 50:60] ^= 4
+
+    result, changed = VisualDiff.compare(_page(), actual)
+
+    assert result.passed
+    assert not changed.any()
+
+
+@pytest.mark.unit
+def test_region_thresholds_are_checked_separately():
+    """
+    Test Case: Verify a change fails only the region whose threshold it exceeds
+    """
+    actual = _page()
+    actual[5:15, 10:60] = (255, 255, 255)  # New text in the header
+    regions = [
+        {"name": "header", "box": (0, 0, 200, 20), "threshold": 0.01},
+        {"name": "content", "box": (0, 20, 200, 100), "threshold": 0.0},
+    ]
+
+    result, _ = VisualDiff.compare(_page(), actual, regions=regions)
+
+    assert not result.passed
+    assert result.regions["header"]["changed"] == pytest.approx(500 / 4000)
+    assert result.regions["content"]["changed"] == 0.0
+
+
+@pytest.mark.unit
+def test_ignore_boxes_mask_dynamic_content():
+    """
+    Test Case: Verify changes inside an ignore box (e.g. an ad slot) don't fail the check
+    """
+    actual = _page()
+    actual[40:100, 120:190] = (0, 255, 0)
+
+    failed, _ = VisualDiff.compare(_page(), actual, regions=[{"name": "page", "threshold": 0.0}])
+    masked, _ = VisualDiff.compare(_page(), actual, regions=[{"name": "page", "threshold": 0.0}],
+                                   ignore=[(120, 40, 70, 60)])
+
+    assert not failed.passed
+    assert masked.passed
+
+
+@pytest.mark.unit
+def test_size_change_fails():
+    """
+    Test Case: Verify screenshots of different sizes fail with a clear reason
+    """
+    result, _ = VisualDiff.compare(_page(), _page(height=100))
+
+    assert not result.passed
+    assert "size changed" in result.reason
+
+
+@pytest.mark.unit
+def test_perceptual_hash_tolerates_small_changes():
+    """
+    Test Case: Verify the perceptual hash barely moves for a small change and moves a lot for a different page
+    """
+    baseline = VisualDiff.phash(_page())
+    small_change = _page()
+    small_change[60:64, 100:104] = (255, 255, 255)
+
+    assert VisualDiff.hash_distance(baseline, VisualDiff.phash(small_change)) <= 2
+    assert VisualDiff.hash_distance(baseline, VisualDiff.phash(np.rot90(_page(200, 120)).copy())) > 10
+
+
+@pytest.mark.unit
+def test_check_saves_baseline_then_writes_diff(tmp_path, monkeypatch):
+    """
+    Test Case: Verify the first check saves the baseline and a failing check leaves a diff image
+    """
+    monkeypatch.setattr(Config, "VISUAL_BASELINE_PATH", str(tmp_path / "baselines"))
+    monkeypatch.setattr(Config, "VISUAL_DIFF_PATH", str(tmp_path / "diffs"))
+    changed = _page()
+    changed[30:90, 30:90] = (255, 255, 255)
+
+    first = VisualDiff.check("home", _png(_page()))
+    second = VisualDiff.check("home", _png(changed))
+
+    assert first.passed and first.reason == "baseline saved"
+    assert not second.passed
+    assert (tmp_path / "diffs" / "home_diff.png").exists()
+    assert (tmp_path / "diffs" / "home_actual.png").exists()
+
+
+@pytest.mark.unit
+def test_batch_keeps_input_order():
+    """
+    Test Case: Verify batch comparison returns one result per pair in input order
+    """
+    changed = _page()
+    changed[:, :100] = 0
+    pairs = [(_page(), _page()), (_page(), changed), (_page(), _page())]
+
+    results = VisualDiff.compare_batch(pairs, workers=3)
+
+    assert [result.passed for result in results] == [True, False, True]
@@ -3,6 +3,7 @@ Web Tables Page Tests - Elements Section
 """
 import pytest  # Import pytest
 from pages.web_tables_page import WebTablesPage  # Import Page Object
+from utils.data_factory import DataFactory  # Unique values for records created by tests
 from utils.test_data import TestData  # Import Test Data
 
 
@@ -19,7 +20,8 @@ def test_add_new_record(driver):
     """
     # Arrange: Initialize Page Object and Test Data
     web_tables_page = WebTablesPage(driver)
-    test_data = TestData.WEB_TABLE_RECORD
+    # Unique email per run/worker so repeated and parallel runs never add the same record twice
+    test_data = DataFactory.shared().make_unique(TestData.WEB_TABLE_RECORD)
     
     # Act: Perform actions
     web_tables_page.navigate_to_web_tables()
@@ -45,3 +47,33 @@ def test_add_new_record(driver):
     final_count = web_tables_page.get_table_rows_count()
     assert final_count > initial_count, "Table row count should increase after adding record"
     print(f"Record added successfully: {test_data['first_name']} {test_data['last_name']}")
+
+
+@pytest.mark.regression  # Data-driven variant, part of the full regression suite
+@pytest.mark.dataset("data/web_table_records.csv")  # One test per CSV row, streamed from disk
+def test_add_record_from_dataset(driver, data_record):
+    """
+    Test Case: Verify adding records from an external dataset to web table
+    
+    Steps:
+    1. Navigate to web tables page
+    2. Add the record provided by the dataset
+    3. Verify the record's email is visible in the table
+    """
+    # Arrange: Initialize Page Object
+    web_tables_page = WebTablesPage(driver)
+    
+    # Act: Add the dataset record
+    web_tables_page.navigate_to_web_tables()
+    web_tables_page.add_record(
+        data_record["first_name"],
+        data_record["last_name"],
+        data_record["email"],
+        data_record["age"],
+        data_record["salary"],
+        data_record["department"]
+    )
+    
+    # Assert: Verify the record is in the table
+    assert web_tables_page.is_record_added(data_record["email"]), \
+        f"Record with email {data_record['email']} should be added to table"
@@ -0,0 +1,188 @@
+"""
+Action batches - several pointer/keyboard actions on several elements, and the results they should
+produce, sent to the browser together instead of one wait/find/perform/get_text round trip each.
+
+    texts = page.batch() \\
+        .double_click(ButtonsLocators.DOUBLE_CLICK_BUTTON) \\
+        .context_click(ButtonsLocators.RIGHT_CLICK_BUTTON) \\
+        .expect_text(ButtonsLocators.DOUBLE_CLICK_MESSAGE) \\
+        .expect_text(ButtonsLocators.RIGHT_CLICK_MESSAGE) \\
+        .perform()
+
+With Config.SYNTHETIC_ACTIONS the actions are dispatched as DOM events by one async script that also
+waits for the expected elements: a single WebDriver command. Otherwise elements are resolved by one
+script, the actions go out as one W3C Actions command, and expectations cost a third command.
+"""
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from config.config import Config
+from utils.command_recorder import CommandRecorder
+
+# Resolves locators (waiting for them to be visible and enabled, like BasePage.click), optionally dispatches the actions as DOM events, then waits
+# for the expected elements to be visible and returns their text
+BATCH_JS = """
+const [targets, steps, expected, timeout, synthetic] = arguments;
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + timeout * 1000;
+
+function find([by, value]) {
+  switch (by) {
+    case 'id': return document.getElementById(value);
+    case 'css selector': return document.querySelector(value);
+    case 'xpath': return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    case 'name': return document.getElementsByName(value)[0] || null;
+    case 'class name': return document.getElementsByClassName(value)[0] || null;
+    case 'tag name': return document.getElementsByTagName(value)[0] || null;
+    case 'link text': return Array.from(document.links).find(a => a.innerText.trim() === value) || null;
+    case 'partial link text': return Array.from(document.links).find(a => a.innerText.includes(value)) || null;
+  }
+  return null;
+}
+const visible = el => el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+const interactable = el => visible(el) && !el.disabled;
+
+function pointer(el, type, button, detail) {
+  const rect = el.getBoundingClientRect();
+  const init = {bubbles: true, cancelable: true, composed: true, view: window, button, detail,
+                buttons: type.endsWith('down') ? (button === 2 ? 2 : 1) : 0,
+                clientX: rect.left + rect.width / 2, clientY: rect.top + rect.height / 2};
+  const EventType = type.startsWith('pointer') ? PointerEvent : MouseEvent;
+  el.dispatchEvent(new EventType(type, type.startsWith('pointer') ? {...init, pointerType: 'mouse', isPrimary: true} : init));
+}
+function press(el, button, detail) {
+  pointer(el, 'pointerdown', button, detail); pointer(el, 'mousedown', button, detail);
+  if (button === 0 && el.focus) el.focus();
+  pointer(el, 'pointerup', button, detail); pointer(el, 'mouseup', button, detail);
+}
+function type(el, text, clear) {
+  el.focus();
+  // Native value setter: frameworks such as React ignore assignments to el.value
+  const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+  setter.call(el, (clear ? '' : el.value) + text);
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+const ACTIONS = {
+  click: el => { press(el, 0, 1); pointer(el, 'click', 0, 1); },
+  double_click: el => {
+    press(el, 0, 1); pointer(el, 'click', 0, 1);
+    press(el, 0, 2); pointer(el, 'click', 0, 2); pointer(el, 'dblclick', 0, 2);
+  },
+  context_click: el => { press(el, 2, 1); pointer(el, 'contextmenu', 2, 1); },
+  hover: el => ['pointerover', 'mouseover', 'pointermove', 'mousemove'].forEach(t => pointer(el, t, 0, 0)),
+  send_keys: (el, [text, clear]) => type(el, text, clear),
+};
+
+function poll(ready, next) {
+  const result = ready();
+  if (result) return next(result);
+  if (Date.now() > deadline) return done({error: true});
+  setTimeout(() => poll(ready, next), 50);
+}
+poll(() => { const els = targets.map(find); return els.every(interactable) && els; }, elements => {
+  if (synthetic) {
+    for (const [action, index, argument] of steps) {
+      elements[index].scrollIntoView({block: 'center'});
+      ACTIONS[action](elements[index], argument);
+    }
+  }
+  poll(() => { const els = expected.map(find); return els.every(visible) && els; },
+       els => done({elements: synthetic ? null : elements, texts: els.map(el => el.innerText.trim())}));
+});
+"""
+
+
+class ActionBatch:
+    """Builder for a batch of actions and expected results; see the module docstring"""
+
+    # Attributes recorded with perform(), so a replay can rebuild the batch
+    RECORDED_STATE = ("_targets", "_steps", "_expected", "synthetic", "timeout")
+
+    def __init__(self, driver, synthetic=None, timeout=None):
+        """
+        Args:
+            driver: WebDriver instance
+            synthetic (bool): Dispatch DOM events instead of native input (defaults to Config.SYNTHETIC_ACTIONS)
+            timeout (int): Seconds to wait for elements and expected results (defaults to Config.EXPLICIT_WAIT)
+        """
+        self.driver = driver
+        self.synthetic = Config.SYNTHETIC_ACTIONS if synthetic is None else synthetic
+        self.timeout = timeout or Config.EXPLICIT_WAIT
+        self._targets = []   # Unique locators the actions need
+        self._steps = []     # [action, target index, argument]
+        self._expected = []  # Locators whose text perform() returns
+
+    def _add(self, action, locator, argument=None):
+        locator = list(locator)
+        if locator not in self._targets:
+            self._targets.append(locator)
+        self._steps.append([action, self._targets.index(locator), argument])
+        return self
+
+    def click(self, locator):
+        return self._add("click", locator)
+
+    def double_click(self, locator):
+        return self._add("double_click", locator)
+
+    def context_click(self, locator):
+        return self._add("context_click", locator)
+
+    def hover(self, locator):
+        return self._add("hover", locator)
+
+    def send_keys(self, locator, text, clear_first=True):
+        return self._add("send_keys", locator, [text, clear_first])
+
+    def expect_text(self, locator):
+        """
+        Wait for an element to be visible after the actions and return its text from perform().
+
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+        """
+        self._expected.append(list(locator))
+        return self
+
+    @CommandRecorder.recorded
+    def perform(self):
+        """
+        Run the batch.
+
+        Returns:
+            list: Text of each expect_text() element, in order
+
+        Raises:
+            TimeoutException: A target was not visible and enabled, or an expected element not visible,
+                within the timeout
+        """
+        if self.synthetic:
+            return self._run(self._targets, self._steps, self._expected)["texts"]
+        elements = self._run(self._targets, [], [])["elements"]
+        chain = ActionChains(self.driver)
+        for action, index, argument in self._steps:
+            element = elements[index]
+            if action == "click":
+                chain.click(element)
+            elif action == "double_click":
+                chain.double_click(element)
+            elif action == "context_click":
+                chain.context_click(element)
+            elif action == "hover":
+                chain.move_to_element(element)
+            else:
+                text, clear_first = argument
+                chain.click(element)
+                if clear_first:
+                    chain.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).send_keys(Keys.DELETE)
+                chain.send_keys(text)
+        chain.perform()
+        return self._run([], [], self._expected)["texts"] if self._expected else []
+
+    def _run(self, targets, steps, expected):
+        result = self.driver.execute_async_script(BATCH_JS, targets, steps, expected, self.timeout, self.synthetic)
+        if result.get("error"):
+            raise TimeoutException(f"Action batch timed out after {self.timeout}s waiting for "
+                                   f"{targets or expected}")
+        return result
@@ -0,0 +1,239 @@
+"""
+Artifact store - content-addressed storage for screenshots, DOM snapshots and logs.
+
+Every artifact is stored once under the SHA-256 of its content (objects/ab/abcd....png); storing the
+same screenshot again only adds an index entry. Text artifacts are gzip-compressed. The index is an
+append-only JSONL file, so parallel workers add entries without locking, and reports reference
+artifacts by hash. Retention (Config.ARTIFACT_MAX_AGE_DAYS / ARTIFACT_MAX_BYTES) removes the objects
+referenced least recently.
+
+    python -m utils.artifact_store ls                 # list stored artifacts
+    python -m utils.artifact_store get <hash> -o out.html
+    python -m utils.artifact_store gc                 # apply the retention policy now
+"""
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import time
+from config.config import Config
+
+# File extension and whether the content is compressed, per artifact kind
+KINDS = {
+    "screenshot": (".png", False),  # PNG is already compressed
+    "dom": (".html.gz", True),
+    "log": (".log.gz", True),
+    "json": (".json.gz", True),
+}
+
+# Index entries (tests that produced it) kept per object when the index is compacted
+REFERENCES_KEPT = 10
+
+
+class ArtifactStore:
+    """Deduplicating, size- and age-bounded artifact storage"""
+
+    def __init__(self, root=None):
+        """
+        Args:
+            root (str): Store directory (defaults to Config.ARTIFACT_STORE_PATH)
+        """
+        self.root = root or Config.ARTIFACT_STORE_PATH
+        self.index_path = os.path.join(self.root, "index.jsonl")
+
+    def path(self, digest, kind):
+        """
+        Args:
+            digest (str): Content hash
+            kind (str): Artifact kind (key of KINDS)
+
+        Returns:
+            str: Object file path
+        """
+        return os.path.join(self.root, "objects", digest[:2], digest + KINDS[kind][0])
+
+    def put(self, data, kind, name=None, test=None):
+        """
+        Store an artifact, unless identical content is already stored.
+
+        Args:
+            data (bytes or str): Artifact content
+            kind (str): Artifact kind (key of KINDS)
+            name (str): Human readable name, e.g. the test or screenshot name
+            test (str): Node id of the test that produced it
+
+        Returns:
+            str: Object file path (named by content hash)
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest, kind)
+        stored = not os.path.exists(path)
+        if stored:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # mtime=0: the same content always compresses to the same bytes
+            content = gzip.compress(data, compresslevel=6, mtime=0) if KINDS[kind][1] else data
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as object_file:
+                object_file.write(content)
+            os.replace(temp_path, path)  # Concurrent writers store identical bytes
+        self._append({"hash": digest, "kind": kind, "name": name, "test": test, "time": time.time(),
+                      "size": os.path.getsize(path), "new": stored})
+        return path
+
+    def put_file(self, source, kind, name=None, test=None, remove=False):
+        """
+        Store the content of a file.
+
+        Args:
+            source (str): File to store
+            kind (str): Artifact kind (key of KINDS)
+            name (str): Human readable name (defaults to the file name)
+            test (str): Node id of the test that produced it
+            remove (bool): Delete the source file once stored
+
+        Returns:
+            str: Object file path
+        """
+        with open(source, "rb") as source_file:
+            path = self.put(source_file.read(), kind, name or os.path.basename(source), test)
+        if remove:
+            os.remove(source)
+        return path
+
+    def read(self, digest):
+        """
+        Args:
+            digest (str): Content hash (a unique prefix is enough)
+
+        Returns:
+            bytes: Original artifact content
+        """
+        matches = glob.glob(os.path.join(self.root, "objects", digest[:2], digest + "*"))
+        matches = [match for match in matches if not match.endswith(".tmp")]
+        if len(matches) != 1:
+            raise KeyError(f"{'No' if not matches else 'More than one'} artifact matches {digest}")
+        with open(matches[0], "rb") as object_file:
+            data = object_file.read()
+        return gzip.decompress(data) if matches[0].endswith(".gz") else data
+
+    def entries(self):
+        """
+        Returns:
+            list: Index entries, oldest first
+        """
+        try:
+            with open(self.index_path, encoding="utf-8") as index_file:
+                lines = index_file.readlines()
+        except FileNotFoundError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # Line cut short by a crashed writer
+        return entries
+
+    def _append(self, entry):
+        os.makedirs(self.root, exist_ok=True)
+        # One write() of a short line in append mode: parallel workers don't interleave entries
+        with open(self.index_path, "a", encoding="utf-8") as index_file:
+            index_file.write(json.dumps(entry) + "\n")
+
+    def archive_logs(self, directory=None, keep=(), pattern="test_execution_*.log"):
+        """
+        Move finished log files into the store, compressed.
+
+        Args:
+            directory (str): Log directory (defaults to Config.LOG_PATH)
+            keep (iterable): Log files still being written
+            pattern (str): Files to archive; the browser daemon's log stays in place
+
+        Returns:
+            int: Number of log files archived
+        """
+        keep = {os.path.abspath(path) for path in keep}
+        archived = 0
+        for log_path in glob.glob(os.path.join(directory or Config.LOG_PATH, pattern)):
+            if os.path.abspath(log_path) not in keep:
+                self.put_file(log_path, "log", remove=True)
+                archived += 1
+        return archived
+
+    def enforce_retention(self, max_bytes=None, max_age_days=None):
+        """
+        Delete objects not referenced for max_age_days, then the least recently referenced ones until
+        the store fits in max_bytes, and compact the index to the newest references of the remaining objects.
+
+        Args:
+            max_bytes (int): Size limit of the stored objects (defaults to Config.ARTIFACT_MAX_BYTES)
+            max_age_days (float): Age limit (defaults to Config.ARTIFACT_MAX_AGE_DAYS)
+
+        Returns:
+            int: Number of objects deleted
+        """
+        max_bytes = Config.ARTIFACT_MAX_BYTES if max_bytes is None else max_bytes
+        max_age_days = Config.ARTIFACT_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        entries = self.entries()
+        last_used = {}
+        for entry in entries:
+            last_used[(entry["hash"], entry["kind"])] = entry
+        cutoff = time.time() - max_age_days * 86400
+        total = sum(entry["size"] for entry in last_used.values())
+        removed = set()
+        for key, entry in sorted(last_used.items(), key=lambda item: item[1]["time"]):
+            if entry["time"] >= cutoff and total <= max_bytes:
+                break
+            try:
+                os.remove(self.path(*key))
+            except FileNotFoundError:
+                pass
+            total -= entry["size"]
+            removed.add(key)
+        # Keep the newest references of each remaining object so the index stays small too
+        references = {}
+        kept = []
+        for entry in reversed(entries):
+            key = (entry["hash"], entry["kind"])
+            references[key] = references.get(key, 0) + 1
+            if key not in removed and references[key] <= REFERENCES_KEPT:
+                kept.append(entry)
+        if len(kept) < len(entries):
+            kept.reverse()
+            temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as index_file:
+                index_file.writelines(json.dumps(entry) + "\n" for entry in kept)
+            os.replace(temp_path, self.index_path)
+        return len(removed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Artifact store tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("ls", help="List stored artifacts")
+    get_parser = subparsers.add_parser("get", help="Write an artifact's original content to a file")
+    get_parser.add_argument("hash")
+    get_parser.add_argument("-o", "--output", required=True)
+    subparsers.add_parser("gc", help="Apply the retention policy")
+    args = parser.parse_args()
+
+    store = ArtifactStore()
+    if args.command == "ls":
+        for entry in store.entries():
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["time"]))
+            print(f"{entry['hash'][:12]}  {stamp}  {entry['kind']:<10} {entry['size']:>10,}  "
+                  f"{entry.get('test') or entry.get('name') or ''}")
+    elif args.command == "get":
+        with open(args.output, "wb") as output_file:
+            output_file.write(store.read(args.hash))
+        print(f"Wrote {args.output}")
+    else:
+        print(f"Removed {store.enforce_retention()} artifacts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+"""
+Persistent browser daemon - keeps one configured browser session alive between pytest runs.
+
+Usage:
+    python -m utils.browser_daemon start    # launch the daemon in the background
+    python -m utils.browser_daemon status
+    python -m utils.browser_daemon stop
+
+Then run tests attached to it:
+    pytest tests/test_buttons.py --browser-daemon
+"""
+import argparse
+import contextlib
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utils.logger import Logger
+
+
+class AttachedDriver(webdriver.Remote):
+    """
+    Remote driver bound to the daemon's existing session instead of creating a new one.
+    quit() only resets the browser state; the daemon owns the session.
+    """
+
+    # Set by ResourceMonitor.recycle(): quit() restarts the daemon with a fresh browser, or asks the last
+    # process attached to it (xdist workers) to do so
+    recycle_reason = None
+    
+    # Every test attaches a new driver object to the same session; ResourceMonitor keys on the session
+    SHARED_SESSION = True
+
+    def __init__(self, command_executor, session_id, capabilities, options):
+        """
+        Args:
+            command_executor (str): URL of the daemon's driver service
+            session_id (str): Existing WebDriver session id
+            capabilities (dict): Capabilities returned when the session was created
+            options: Options instance matching the browser (selects the right remote connection)
+        """
+        self._attach_session = (session_id, capabilities)
+        super().__init__(command_executor=command_executor, options=options)
+
+    def start_session(self, capabilities):
+        """Reuse the daemon's session instead of sending a new session command."""
+        self.session_id, self.caps = self._attach_session
+
+    def reset_state(self):
+        """Close extra tabs, drop cookies and site storage and park the browser on a blank page."""
+        from utils.driver_factory import DriverFactory  # Imported here: the factory attaches through this module
+        DriverFactory.reset_state(self)
+
+    def quit(self):
+        """
+        Detach from the daemon session, leaving the browser running for the next test. A requested
+        restart happens once no other process is attached, so no worker loses its browser mid-test.
+        """
+        with BrowserDaemon.locked():
+            BrowserDaemon.release_lease()
+            state = BrowserDaemon.read_state() or {}
+            reason = self.recycle_reason or state.get("restart_reason")
+            if reason and not BrowserDaemon.other_leases():
+                Logger.get_logger("BrowserDaemon").info(f"Restarting the browser daemon: {reason}")
+                BrowserDaemon.restart()
+                return
+            if self.recycle_reason and state:
+                # Other workers still use the browser: the last one to detach restarts it
+                state["restart_reason"] = self.recycle_reason
+                BrowserDaemon._write_state(state)
+        try:
+            self.reset_state()
+        except WebDriverException:
+            # A broken session is detected on the next attach
+            pass
+
+
+class BrowserDaemon:
+    """Starts, stops and attaches to the background browser session"""
+
+    # Seconds between keep-alive checks inside the daemon process
+    CHECK_INTERVAL = 5
+    # Seconds restart() allows the old daemon to exit, and again the new browser to start
+    RESTART_TIMEOUT = 120
+    # Settings the daemon's browser is launched with; a run resolving other values does not attach to it
+    LAUNCH_SETTINGS = ("BROWSER", "HEADLESS", "LAUNCH_PROFILE", "WINDOW_SIZE")
+
+    @staticmethod
+    def read_state():
+        """
+        Returns:
+            dict: Published daemon state, or None if no daemon is running
+        """
+        try:
+            with open(Config.DAEMON_STATE_FILE) as state_file:
+                return json.load(state_file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_state(state):
+        # Write atomically so a concurrent attach never reads a half-written file
+        temp_path = f"{Config.DAEMON_STATE_FILE}.tmp"
+        with open(temp_path, "w") as state_file:
+            json.dump(state, state_file)
+        os.replace(temp_path, Config.DAEMON_STATE_FILE)
+
+    @staticmethod
+    def _alive(pid):
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    @contextlib.contextmanager
+    def locked(timeout=None):
+        """
+        Hold the daemon lock (a lock file) while attaching, detaching or restarting, so parallel workers
+        see a consistent state file and leases.
+
+        Args:
+            timeout (int): Seconds to wait for the lock; defaults to longer than a restart by another
+                process can take (twice RESTART_TIMEOUT)
+        """
+        path = f"{Config.DAEMON_STATE_FILE}.lock"
+        timeout = timeout or 2 * BrowserDaemon.RESTART_TIMEOUT + 60
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                lock = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    with open(path) as lock_file:
+                        holder = int(lock_file.read() or 0)
+                except (OSError, ValueError):
+                    holder = 0
+                if holder and not BrowserDaemon._alive(holder):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(path)  # Left behind by a killed process
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Browser daemon lock {path} held for {timeout}s")
+                time.sleep(0.05)
+        os.write(lock, str(os.getpid()).encode())
+        os.close(lock)
+        try:
+            yield
+        finally:
+            os.remove(path)
+
+    @staticmethod
+    def _lease_path(pid):
+        return f"{Config.DAEMON_STATE_FILE}.{pid}.lease"
+
+    @staticmethod
+    def take_lease():
+        """Record that this process is attached to the daemon session (call with the lock held)."""
+        open(BrowserDaemon._lease_path(os.getpid()), "w").close()
+
+    @staticmethod
+    def release_lease():
+        """Record that this process detached from the daemon session (call with the lock held)."""
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(BrowserDaemon._lease_path(os.getpid()))
+
+    @staticmethod
+    def other_leases():
+        """
+        Returns:
+            list: Pids of other live processes attached to the daemon session
+        """
+        directory = os.path.dirname(os.path.abspath(Config.DAEMON_STATE_FILE))
+        prefix, suffix = os.path.basename(Config.DAEMON_STATE_FILE) + ".", ".lease"
+        pids = []
+        for name in os.listdir(directory):
+            pid = name[len(prefix):-len(suffix)]
+            if name.startswith(prefix) and name.endswith(suffix) and pid.isdigit():
+                if int(pid) != os.getpid() and BrowserDaemon._alive(int(pid)):
+                    pids.append(int(pid))
+        return pids
+
+    @staticmethod
+    def is_running():
+        """
+        Returns:
+            bool: True if the daemon process recorded in the state file is alive
+        """
+        state = BrowserDaemon.read_state()
+        return bool(state) and BrowserDaemon._alive(state["pid"])
+
+    @staticmethod
+    def start(timeout=None, profile=None, assignments=()):
+        """
+        Launch the daemon in a detached background process and wait until its session is ready.
+
+        Args:
+            timeout (int): Seconds to wait for the browser to start (defaults to RESTART_TIMEOUT)
+            profile (str): Settings profile the daemon resolves (defaults to QA_PROFILE)
+            assignments (iterable): "NAME=VALUE" setting overrides, like pytest's --set
+
+        Returns:
+            dict: Published daemon state
+        """
+        if BrowserDaemon.is_running():
+            return BrowserDaemon.read_state()
+        if os.path.exists(Config.DAEMON_STATE_FILE):
+            os.remove(Config.DAEMON_STATE_FILE)
+
+        command = [sys.executable, "-m", "utils.browser_daemon", "serve"]
+        if profile:
+            command += ["--profile", profile]
+        for assignment in assignments:
+            command += ["--set", assignment]
+        os.makedirs(Config.LOG_PATH, exist_ok=True)
+        with open(os.path.join(Config.LOG_PATH, "browser_daemon.log"), "a") as log_file:
+            subprocess.Popen(
+                command,
+                stdout=log_file, stderr=log_file, stdin=subprocess.DEVNULL,
+                start_new_session=True  # Survive the terminal/pytest process that started it
+            )
+        timeout = timeout or BrowserDaemon.RESTART_TIMEOUT
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            state = BrowserDaemon.read_state()
+            if state:
+                return state
+            time.sleep(0.2)
+        raise TimeoutError(f"Browser daemon did not start within {timeout}s")
+
+    @staticmethod
+    def stop():
+        """Stop the daemon; it quits its browser on the way out."""
+        state = BrowserDaemon.read_state()
+        if state and BrowserDaemon.is_running():
+            os.kill(state["pid"], signal.SIGTERM)
+        elif os.path.exists(Config.DAEMON_STATE_FILE):
+            os.remove(Config.DAEMON_STATE_FILE)
+
+    @staticmethod
+    def restart(timeout=None):
+        """
+        Stop the daemon, wait for it to quit its browser and start it with a fresh one, launched with
+        the settings of the current process.
+
+        Args:
+            timeout (int): Seconds to wait for the old daemon to exit, and again for the new browser to
+                start (defaults to RESTART_TIMEOUT)
+
+        Returns:
+            dict: Published state of the new daemon
+        """
+        timeout = timeout or BrowserDaemon.RESTART_TIMEOUT
+        BrowserDaemon.stop()
+        deadline = time.monotonic() + timeout
+        while BrowserDaemon.is_running() and time.monotonic() < deadline:
+            time.sleep(0.2)
+        assignments = [f"{name}={json.dumps(value) if isinstance(value, (list, tuple)) else value}"
+                       for name, value in BrowserDaemon.launch_settings().items()]
+        return BrowserDaemon.start(timeout, assignments=assignments)
+
+    @staticmethod
+    def launch_settings():
+        """
+        Returns:
+            dict: Active values of LAUNCH_SETTINGS, as stored in the state file
+        """
+        return json.loads(json.dumps({name: getattr(Config, name) for name in BrowserDaemon.LAUNCH_SETTINGS}))
+
+    @staticmethod
+    def serve(profile=None, overrides=None):
+        """
+        Daemon main loop. Launches the configured browser, publishes its session and keeps it
+        alive until stopped, idle for Config.DAEMON_IDLE_TIMEOUT or the browser goes away.
+
+        Args:
+            profile (str): Settings profile (defaults to QA_PROFILE)
+            overrides (dict): Setting values by name, layered over the profile and QA_* environment
+        """
+        from config.settings import Settings  # Imported here: only the daemon process resolves settings
+        from utils.driver_factory import DriverFactory  # Imported here: the factory attaches through this module
+
+        Settings.activate(Settings.resolve(profile, overrides))
+        logger = Logger.get_logger("BrowserDaemon")
+        driver = DriverFactory.get_driver(use_daemon=False)
+        stopping = []
+        signal.signal(signal.SIGTERM, lambda signum, frame: stopping.append(signum))
+
+        BrowserDaemon._write_state({
+            "pid": os.getpid(),
+            "browser": Config.BROWSER.lower(),
+            "settings": BrowserDaemon.launch_settings(),
+            "executor_url": driver.service.service_url,
+            "session_id": driver.session_id,
+            "capabilities": driver.capabilities,
+            "last_used": time.time(),
+        })
+        logger.info(f"Browser daemon ready: session {driver.session_id} at {driver.service.service_url}")
+        try:
+            while not stopping:
+                time.sleep(BrowserDaemon.CHECK_INTERVAL)
+                state = BrowserDaemon.read_state() or {}
+                if time.time() - state.get("last_used", 0) > Config.DAEMON_IDLE_TIMEOUT:
+                    logger.info("Browser daemon idle timeout reached")
+                    break
+                try:
+                    driver.current_window_handle  # Cheap liveness probe
+                except WebDriverException:
+                    logger.error("Browser daemon lost its browser session")
+                    break
+        finally:
+            if os.path.exists(Config.DAEMON_STATE_FILE):
+                os.remove(Config.DAEMON_STATE_FILE)
+            driver.quit()
+            logger.info("Browser daemon stopped")
+
+    @staticmethod
+    def attach(browser=None):
+        """
+        Attach to the daemon's browser and reset its state. While a restart is pending, waits for the
+        attached processes to detach and the last one to restart the daemon.
+
+        Args:
+            browser (str): Required browser name; a daemon running another browser is not used
+
+        Returns:
+            AttachedDriver: Driver bound to the daemon's session, or None if no usable daemon is running
+        """
+        while True:
+            with BrowserDaemon.locked():
+                state = BrowserDaemon.read_state()
+                if state and state.get("restart_reason") and BrowserDaemon.other_leases():
+                    pass  # Draining: attach once the restart is done
+                elif state and state.get("restart_reason"):
+                    Logger.get_logger("BrowserDaemon").info(f"Restarting the browser daemon: {state['restart_reason']}")
+                    BrowserDaemon.restart()
+                else:
+                    return BrowserDaemon._attach(browser)
+            time.sleep(0.2)
+
+    @staticmethod
+    def _attach(browser):
+        state = BrowserDaemon.read_state()
+        if not state or not BrowserDaemon.is_running():
+            return None
+        if browser and state["browser"] != browser.lower():
+            return None
+        settings = BrowserDaemon.launch_settings()
+        mismatched = sorted(name for name, value in state.get("settings", {}).items() if settings.get(name) != value)
+        if mismatched:
+            Logger.get_logger("BrowserDaemon").warning(
+                f"Browser daemon launched with other settings ({', '.join(mismatched)}), not attaching")
+            return None
+
+        options = {
+            "chrome": webdriver.ChromeOptions,
+            "firefox": webdriver.FirefoxOptions,
+            "edge": webdriver.EdgeOptions,
+        }[state["browser"]]()
+        driver = AttachedDriver(state["executor_url"], state["session_id"], state["capabilities"], options)
+        try:
+            driver.reset_state()
+        except WebDriverException:
+            return None
+
+        state["last_used"] = time.time()
+        BrowserDaemon._write_state(state)
+        BrowserDaemon.take_lease()
+        return driver
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent browser daemon for local test runs")
+    parser.add_argument("command", choices=["start", "stop", "status", "serve"])
+    parser.add_argument("--profile", help="Settings profile in config/profiles (default: $QA_PROFILE)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="Override a setting")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        state = BrowserDaemon.start(profile=args.profile, assignments=args.set)
+        print(f"Browser daemon running (pid {state['pid']}, session {state['session_id']})")
+    elif args.command == "stop":
+        BrowserDaemon.stop()
+        print("Browser daemon stopped")
+    elif args.command == "status":
+        state = BrowserDaemon.read_state()
+        if state and BrowserDaemon.is_running():
+            print(f"Running: pid {state['pid']}, {state['browser']} session {state['session_id']}")
+        else:
+            print("Not running")
+    else:
+        from config.settings import parse_assignments  # Imported here: only the daemon process resolves settings
+        BrowserDaemon.serve(args.profile, parse_assignments(args.set))
+
+
+if __name__ == "__main__":
+    main()
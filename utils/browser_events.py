@@ -0,0 +1,264 @@
+"""
+Browser event capture - console messages, uncaught JavaScript errors and failed network requests of a
+driver's browser, kept in a bounded ring buffer.
+
+The collector subscribes to DevTools events over its own CDPConnection, served by an event loop in a
+background thread: the browser pushes events as they happen, no command is sent while a test runs
+and nothing is polled. Page objects read the buffer with BasePage.browser_errors(); the conftest dumps
+it as an artifact only when a test fails, so a passing test costs a buffer append per event.
+Chromium based browsers only (Chrome, Edge), local, attached to the daemon or on a grid ("se:cdp").
+"""
+import asyncio
+import collections
+import json
+import os
+import re
+import threading
+import time
+import weakref
+from config.config import Config
+from utils.logger import Logger
+
+# Remembered requests, to name the URL of a failed one (loadingFailed only carries the request id)
+MAX_TRACKED_REQUESTS = 500
+
+
+def _remote_object_text(remote_object):
+    if "value" in remote_object:
+        return str(remote_object["value"])
+    return remote_object.get("description") or remote_object.get("type", "")
+
+
+class BrowserEvents:
+    """Ring buffer of one driver's console / network errors; get instances with BrowserEvents.for_driver()"""
+
+    _collectors = weakref.WeakKeyDictionary()  # Driver -> collector, dropped with the driver
+
+    def __init__(self, capacity=None):
+        """
+        Args:
+            capacity (int): Events kept; the oldest are dropped first (defaults to Config.BROWSER_EVENT_BUFFER)
+        """
+        self.events = collections.deque(maxlen=capacity or Config.BROWSER_EVENT_BUFFER)
+        self.dropped = 0  # Events pushed out of the full buffer since the last clear()
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.session_id = None  # Browser session the collector is subscribed to
+        self._lock = threading.Lock()
+        self._requests = collections.OrderedDict()  # requestId -> (method, url)
+        self._loop = None
+        self._connection = None
+        self._attaching = {}  # targetId -> task enabling the attached page's domains
+
+    @staticmethod
+    def for_driver(driver):
+        """
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            BrowserEvents: The driver's collector, or None when none was started for it
+        """
+        return BrowserEvents._collectors.get(driver)
+
+    @staticmethod
+    def start(driver, timeout=10):
+        """
+        Start collecting the events of a driver's browser (no-op for browsers without DevTools).
+
+        Args:
+            driver: WebDriver instance
+            timeout (int): Seconds allowed to connect and subscribe
+
+        Returns:
+            BrowserEvents: The running collector, or None when the browser has no DevTools endpoint
+        """
+        collector = BrowserEvents._collectors.get(driver)
+        if collector is not None:
+            if collector.session_id == driver.session_id:
+                return collector
+            collector.stop()  # Browser recycled in place (ResourceMonitor): subscribe to the new one
+        ws_url = BrowserEvents._ws_url(driver)
+        if ws_url is None:
+            return None
+        collector = BrowserEvents()
+        collector.session_id = driver.session_id
+        collector._loop = asyncio.new_event_loop()
+        threading.Thread(target=collector._loop.run_forever, name="browser-events", daemon=True).start()
+        try:
+            asyncio.run_coroutine_threadsafe(collector._subscribe(ws_url), collector._loop).result(timeout)
+        except Exception as error:
+            collector.logger.warning(f"Browser event capture unavailable: {error}")
+            collector.stop()
+            return None
+        BrowserEvents._collectors[driver] = collector
+        return collector
+
+    @staticmethod
+    def _ws_url(driver):
+        capabilities = driver.capabilities
+        if capabilities.get("se:cdp"):
+            return capabilities["se:cdp"]  # Grid: DevTools proxied by the hub
+        for key in ("goog:chromeOptions", "ms:edgeOptions"):
+            debugger_address = capabilities.get(key, {}).get("debuggerAddress")
+            if debugger_address:
+                from utils.cdp_connection import AsyncBrowser  # Imported here: pulls in websockets
+                return AsyncBrowser.get_ws_url(debugger_address)
+        return None
+
+    async def _subscribe(self, ws_url):
+        from utils.cdp_connection import CDPConnection  # Imported here: pulls in websockets
+        self._connection = await CDPConnection(ws_url).connect()
+        handlers = {
+            "Runtime.consoleAPICalled": self.on_console,
+            "Runtime.exceptionThrown": self.on_exception,
+            "Log.entryAdded": self.on_log,
+            "Network.requestWillBeSent": self.on_request,
+            "Network.responseReceived": self.on_response,
+            "Network.loadingFailed": self.on_loading_failed,
+            "Target.attachedToTarget": self._on_attached,
+            "Target.detachedFromTarget": lambda params: self._attaching.pop(params.get("targetId"), None),
+        }
+        for method, handler in handlers.items():
+            self._connection.on(method, handler)
+        # Attaches to the open pages, and to every page opened later (popups, window.open) paused before
+        # its first request, so no load event is missed; each page is subscribed and resumed in _attach()
+        await self._connection.send("Target.setAutoAttach",
+                                    {"autoAttach": True, "waitForDebuggerOnStart": True, "flatten": True})
+        # The pages open now have their domains enabled before start() returns, so the fixture's clear()
+        # and the test's first navigation come after the events Runtime.enable replays
+        await asyncio.gather(*self._attaching.values())
+
+    def _on_attached(self, params):
+        target_id, session_id = params["targetInfo"]["targetId"], params["sessionId"]
+        if params["targetInfo"]["type"] == "page":
+            self._attaching[target_id] = asyncio.ensure_future(
+                self._attach(target_id, session_id, params.get("waitingForDebugger")))
+        elif params.get("waitingForDebugger"):
+            # Workers are auto-attached and paused too; let them run unobserved
+            asyncio.ensure_future(self._resume(target_id, session_id))
+
+    async def _attach(self, target_id, session_id, waiting):
+        try:
+            for method in ("Runtime.enable", "Log.enable", "Network.enable"):
+                await self._connection.send(method, session_id=session_id)
+        except Exception as error:
+            self.logger.debug(f"Could not subscribe to target {target_id}: {error}")  # Closed in the meantime
+        if waiting:
+            await self._resume(target_id, session_id)
+
+    async def _resume(self, target_id, session_id):
+        try:
+            await self._connection.send("Runtime.runIfWaitingForDebugger", session_id=session_id)
+        except Exception as error:
+            self.logger.debug(f"Could not resume target {target_id}: {error}")
+
+    def stop(self):
+        """Close the DevTools connection and stop the event loop thread."""
+        if self._loop is None:
+            return
+        if self._connection is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._connection.close(), self._loop).result(5)
+            except Exception:
+                pass  # The browser is already gone
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
+
+    def add(self, kind, level, text, url=None):
+        """
+        Append an event to the ring buffer.
+
+        Args:
+            kind (str): "console", "exception", "log" or "network"
+            level (str): "error", "warning", ...
+            text (str): Message
+            url (str): Page or request URL the event belongs to
+        """
+        event = {"time": time.time(), "kind": kind, "level": level, "text": text}
+        if url:
+            event["url"] = url
+        with self._lock:
+            if len(self.events) == self.events.maxlen:
+                self.dropped += 1
+            self.events.append(event)
+
+    def on_console(self, params):
+        level = {"warning": "warning", "assert": "error"}.get(params["type"], params["type"])
+        if level in Config.CONSOLE_LEVELS:
+            frames = params.get("stackTrace", {}).get("callFrames", [])
+            self.add("console", level, " ".join(_remote_object_text(arg) for arg in params.get("args", [])),
+                     frames[0]["url"] if frames else None)
+
+    def on_exception(self, params):
+        details = params["exceptionDetails"]
+        description = details.get("exception", {}).get("description") or details.get("text", "")
+        self.add("exception", "error", description.splitlines()[0] if description else "", details.get("url"))
+
+    def on_log(self, params):
+        entry = params["entry"]
+        if entry["level"] in Config.CONSOLE_LEVELS:
+            self.add("log", entry["level"], entry["text"], entry.get("url"))
+
+    def on_request(self, params):
+        self._requests[params["requestId"]] = (params["request"]["method"], params["request"]["url"])
+        if len(self._requests) > MAX_TRACKED_REQUESTS:
+            self._requests.popitem(last=False)
+
+    def on_response(self, params):
+        response = params["response"]
+        method, _ = self._requests.pop(params["requestId"], ("GET", None))
+        if response["status"] >= Config.NETWORK_ERROR_STATUS:
+            self.add("network", "error", f"{method} {response['status']} {response.get('statusText', '')}".strip()
+                     + f" ({params.get('type', 'Other')})", response["url"])
+
+    def on_loading_failed(self, params):
+        method, url = self._requests.pop(params["requestId"], ("GET", None))
+        if not params.get("canceled"):
+            self.add("network", "error", f"{method} failed: {params['errorText']} ({params.get('type', 'Other')})", url)
+
+    def get(self, kind=None, level=None, ignore=()):
+        """
+        Args:
+            kind (str): Only this kind of event ("console", "exception", "log", "network")
+            level (str): Only this level ("error", "warning")
+            ignore (iterable): Regular expressions; events whose text or URL matches one are left out
+
+        Returns:
+            list: Buffered events, oldest first
+        """
+        with self._lock:
+            events = list(self.events)
+        patterns = [re.compile(pattern) for pattern in ignore]
+        return [event for event in events
+                if (kind is None or event["kind"] == kind) and (level is None or event["level"] == level)
+                and not any(p.search(event["text"]) or p.search(event.get("url", "")) for p in patterns)]
+
+    def clear(self):
+        """Empty the buffer (at the start of each test)."""
+        with self._lock:
+            self.events.clear()
+            self.dropped = 0
+
+    def dump(self, test):
+        """
+        Store the buffered events of a failed test: in the artifact store when Config.ARTIFACT_STORE, else
+        next to the traces in Config.TRACE_PATH.
+
+        Args:
+            test (str): Node id of the failed test
+
+        Returns:
+            str: Path of the stored events, or None when there were none
+        """
+        events = self.get()
+        if not events:
+            return None
+        data = json.dumps({"test": test, "dropped": self.dropped, "events": events}, separators=(",", ":"))
+        if Config.ARTIFACT_STORE:
+            from utils.artifact_store import ArtifactStore  # Imported here: only needed for failed tests
+            return ArtifactStore().put(data, "json", f"browser events {test}", test)
+        os.makedirs(Config.TRACE_PATH, exist_ok=True)
+        path = os.path.join(Config.TRACE_PATH, re.sub(r"[^\w.-]+", "_", test) + ".browser_events.json")
+        with open(path, "w", encoding="utf-8") as events_file:
+            events_file.write(data)
+        return path
@@ -0,0 +1,196 @@
+"""
+Asyncio connection to the browser's DevTools protocol (Chromium based browsers: Chrome, Edge).
+A single WebSocket carries the commands of many pages, each one addressed by its session id.
+"""
+import asyncio
+import json
+import urllib.request
+import websockets
+from utils.logger import Logger
+
+
+class CDPError(Exception):
+    """Raised when the browser answers a DevTools command with an error"""
+
+    def __init__(self, method, error):
+        self.method = method
+        self.code = error.get("code")
+        super().__init__(f"{method} failed: {error.get('message')} ({self.code})")
+
+
+class CDPConnection:
+    """Asyncio client for a DevTools WebSocket endpoint"""
+
+    def __init__(self, ws_url):
+        """
+        Args:
+            ws_url (str): Browser-level WebSocket URL (webSocketDebuggerUrl)
+        """
+        self.ws_url = ws_url
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._ws = None
+        self._reader = None
+        self._next_id = 0
+        self._pending = {}
+        self._listeners = {}
+
+    async def connect(self):
+        """Open the WebSocket and start dispatching incoming messages."""
+        self._ws = await websockets.connect(self.ws_url, max_size=None)
+        self._reader = asyncio.ensure_future(self._read_loop())
+        self.logger.debug(f"Connected to DevTools endpoint: {self.ws_url}")
+        return self
+
+    async def close(self):
+        """Close the WebSocket. Pending commands fail with ConnectionError."""
+        if self._ws is not None:
+            await self._ws.close()
+            await self._reader
+            self._ws = None
+
+    async def send(self, method, params=None, session_id=None):
+        """
+        Send a command and wait for its result.
+
+        Args:
+            method (str): Protocol method, e.g. "Runtime.evaluate"
+            params (dict): Command parameters
+            session_id (str): Target session the command is addressed to (None for the browser)
+
+        Returns:
+            dict: The "result" member of the response
+        """
+        self._next_id += 1
+        message = {"id": self._next_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = (method, future)
+        await self._ws.send(json.dumps(message))
+        return await future
+
+    def on(self, method, callback, session_id=None):
+        """
+        Register a callback for a protocol event. Events are pushed by the browser, no polling.
+
+        Args:
+            method (str): Event name, e.g. "Runtime.consoleAPICalled"
+            callback (callable): Called with the event params dict
+            session_id (str): Only receive events from this session (None for all sessions)
+        """
+        self._listeners.setdefault(method, []).append((session_id, callback))
+
+    async def _read_loop(self):
+        """Resolve pending commands and dispatch events until the socket closes."""
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                if "id" in message:
+                    method, future = self._pending.pop(message["id"], (None, None))
+                    if future is None or future.done():
+                        continue
+                    if "error" in message:
+                        future.set_exception(CDPError(method, message["error"]))
+                    else:
+                        future.set_result(message.get("result", {}))
+                else:
+                    for session_id, callback in self._listeners.get(message.get("method"), []):
+                        if session_id is None or session_id == message.get("sessionId"):
+                            callback(message.get("params", {}))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for method, future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"DevTools connection closed during {method}"))
+            self._pending.clear()
+
+
+class AsyncBrowser:
+    """Opens page sessions on a running browser over one shared CDPConnection"""
+
+    def __init__(self, connection):
+        """
+        Args:
+            connection (CDPConnection): Connected DevTools client
+        """
+        self.connection = connection
+        self._targets = []
+
+    @staticmethod
+    def get_ws_url(debugger_address):
+        """
+        Resolve the browser WebSocket URL from a debugger address.
+
+        Args:
+            debugger_address (str): host:port of the remote debugging endpoint
+
+        Returns:
+            str: webSocketDebuggerUrl of the browser
+        """
+        with urllib.request.urlopen(f"http://{debugger_address}/json/version", timeout=10) as response:
+            return json.loads(response.read())["webSocketDebuggerUrl"]
+
+    @classmethod
+    async def connect(cls, debugger_address):
+        """
+        Connect to a browser started with remote debugging enabled.
+
+        Args:
+            debugger_address (str): host:port of the remote debugging endpoint
+
+        Returns:
+            AsyncBrowser: Connected browser
+        """
+        loop = asyncio.get_running_loop()
+        ws_url = await loop.run_in_executor(None, cls.get_ws_url, debugger_address)
+        return cls(await CDPConnection(ws_url).connect())
+
+    @classmethod
+    async def from_driver(cls, driver):
+        """
+        Connect to the browser behind a Selenium Chrome or Edge driver.
+
+        Args:
+            driver: Chromium based WebDriver created by DriverFactory
+
+        Returns:
+            AsyncBrowser: Connected browser
+        """
+        capabilities = driver.capabilities
+        for key in ("goog:chromeOptions", "ms:edgeOptions"):
+            debugger_address = capabilities.get(key, {}).get("debuggerAddress")
+            if debugger_address:
+                return await cls.connect(debugger_address)
+        raise ValueError(f"Browser does not expose a DevTools endpoint: {capabilities.get('browserName')}")
+
+    async def new_page(self, page_class, url="about:blank"):
+        """
+        Open a new tab and return a page object attached to it.
+
+        Args:
+            page_class (type): AsyncBasePage subclass to instantiate
+            url (str): Initial URL of the tab
+
+        Returns:
+            AsyncBasePage: Page object bound to the new tab's session
+        """
+        target = await self.connection.send("Target.createTarget", {"url": url})
+        attached = await self.connection.send(
+            "Target.attachToTarget", {"targetId": target["targetId"], "flatten": True}
+        )
+        session_id = attached["sessionId"]
+        await self.connection.send("Page.enable", session_id=session_id)
+        await self.connection.send("Runtime.enable", session_id=session_id)
+        self._targets.append(target["targetId"])
+        return page_class(self.connection, session_id)
+
+    async def close(self):
+        """Close the tabs opened by this browser object and the connection."""
+        for target_id in self._targets:
+            try:
+                await self.connection.send("Target.closeTarget", {"targetId": target_id})
+            except CDPError:
+                continue
+        self._targets.clear()
+        await self.connection.close()
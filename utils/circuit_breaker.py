@@ -0,0 +1,150 @@
+"""
+Circuit breaker for the application under test.
+
+When BASE_URL is down every test would otherwise wait out PAGE_LOAD_TIMEOUT on its own. The breaker
+counts consecutive failed page loads; after Config.CIRCUIT_BREAKER_THRESHOLD of them it opens and
+tests fail immediately with the recorded reason. After Config.CIRCUIT_BREAKER_COOLDOWN seconds it is
+half-open: a cheap HTTP probe decides whether tests resume or the breaker stays open.
+"""
+import threading
+import time
+import urllib.error
+import urllib.request
+from config.config import Config
+from utils.logger import Logger
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of navigating while the application under test is considered unreachable"""
+
+
+class CircuitBreaker:
+    """Tracks the health of the application under test for the whole process"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    _shared = None
+
+    def __init__(self, url=None, threshold=None, cooldown=None):
+        """
+        Args:
+            url (str): URL probed by the preflight check and half-open probes (defaults to Config.BASE_URL)
+            threshold (int): Consecutive failures that open the breaker
+            cooldown (float): Seconds the breaker stays open before probing again
+        """
+        self.url = url or Config.BASE_URL
+        self.threshold = threshold or Config.CIRCUIT_BREAKER_THRESHOLD
+        self.cooldown = cooldown or Config.CIRCUIT_BREAKER_COOLDOWN
+        self.state = self.CLOSED
+        self.failures = 0
+        self.reason = None
+        self.opened_at = None
+        self.rejected = 0  # Calls refused while open, reported at the end of the run
+        self.preflight_done = False
+        self._lock = threading.Lock()
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    @staticmethod
+    def shared():
+        """
+        Returns:
+            CircuitBreaker: Process-wide breaker for Config.BASE_URL
+        """
+        if CircuitBreaker._shared is None:
+            CircuitBreaker._shared = CircuitBreaker()
+        return CircuitBreaker._shared
+
+    def probe(self):
+        """
+        Check that the application answers over plain HTTP, without involving a browser.
+
+        Returns:
+            str: None if the application is reachable, otherwise the failure reason
+        """
+        request = urllib.request.Request(self.url, method="HEAD")
+        try:
+            with urllib.request.urlopen(request, timeout=Config.PREFLIGHT_TIMEOUT) as response:
+                status = response.status
+        except urllib.error.HTTPError as error:
+            status = error.code
+        except (urllib.error.URLError, OSError) as error:
+            return f"{self.url} unreachable: {getattr(error, 'reason', error)}"
+        if status >= 500:
+            return f"{self.url} answered HTTP {status}"
+        return None
+
+    def preflight(self):
+        """
+        Probe the application once per process before the first browser starts.
+        An unreachable application opens the breaker straight away.
+        """
+        with self._lock:
+            if self.preflight_done:
+                return
+            self.preflight_done = True
+        reason = self.probe()
+        if reason:
+            self._open(f"preflight check failed - {reason}")
+        else:
+            self.logger.info(f"Preflight check passed for {self.url}")
+
+    def check(self):
+        """
+        Raise if calls to the application should not be attempted right now.
+        Once the cooldown has passed, one caller probes the application and closes the breaker on success.
+
+        Raises:
+            CircuitOpenError: While the breaker is open
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                # Half-open: this caller probes, concurrent callers keep failing fast meanwhile
+                self.state = self.HALF_OPEN
+                probing = True
+            else:
+                probing = False
+            if not probing:
+                self.rejected += 1
+                raise CircuitOpenError(self._message())
+        reason = self.probe()
+        if reason:
+            self._open(reason)
+            with self._lock:
+                self.rejected += 1
+            raise CircuitOpenError(self._message())
+        self.logger.info(f"{self.url} reachable again, closing circuit breaker")
+        self.record_success()
+
+    def record_success(self):
+        """Reset the failure count after a successful page load."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.reason = None
+
+    def record_failure(self, reason):
+        """
+        Count a failed page load; opens the breaker after Config.CIRCUIT_BREAKER_THRESHOLD in a row.
+
+        Args:
+            reason (str): Why the page could not be loaded
+        """
+        with self._lock:
+            self.failures += 1
+            trip = self.failures >= self.threshold
+        if trip:
+            self._open(f"{self.failures} consecutive page loads failed - last: {reason}")
+
+    def _open(self, reason):
+        with self._lock:
+            self.state = self.OPEN
+            self.reason = reason
+            self.opened_at = time.monotonic()
+        self.logger.error(f"Circuit breaker open for {self.cooldown}s: {reason}")
+
+    def _message(self):
+        return f"Application under test unavailable, not attempted (circuit breaker open): {self.reason}"
@@ -0,0 +1,276 @@
+"""
+Command recorder and replayer - fast reproduction of failed flows.
+
+While a test runs, the BasePage actions it performs (navigate, click, send_keys, get_text, ...), action
+batches and widget steps are recorded with their resolved locators and values. When the test fails,
+the trace is stored next to its screenshot and can be replayed on a fresh driver:
+
+    python -m utils.command_recorder artifacts/objects/3f/3fa2...json.gz
+    python -m utils.command_recorder 3fa2c1           # hash prefix of a trace in the artifact store
+    python -m utils.command_recorder TRACE --stop-before
+
+The replay runs at full speed: explicit waits only, none of BasePage's pacing sleeps. It stops at the
+step that failed during the test (or at the first step that fails during the replay) and keeps the
+browser open for inspection.
+"""
+import argparse
+import functools
+import gzip
+import json
+import os
+import re
+import sys
+import threading
+import time
+from config.config import Config
+from utils.locator_registry import LocatorRegistry
+
+
+def _jsonable(value):
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+class CommandRecorder:
+    """Process-wide trace of the current test's actions"""
+
+    _lock = threading.Lock()
+    _local = threading.local()  # Nesting depth per thread: only the outermost action is recorded
+    steps = None  # Steps of the current test; None while not recording
+
+    @staticmethod
+    def start():
+        """Start a new trace (called before each test's setup)."""
+        with CommandRecorder._lock:
+            CommandRecorder.steps = [] if Config.RECORD_COMMANDS else None
+
+    @staticmethod
+    def recorded(method):
+        """
+        Decorator recording a call as one step. BasePage methods are recorded under their name, methods of
+        other classes as "Class.method" after the values of the instance's RECORDED_STATE attributes.
+        Calls made while another recorded call runs (find_element inside click) are not recorded.
+        """
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            depth = getattr(CommandRecorder._local, "depth", 0)
+            if CommandRecorder.steps is None or depth:
+                return method(self, *args, **kwargs)
+            from pages.base_page import BasePage  # Imported here: BasePage imports this module
+            if isinstance(self, BasePage):
+                action, state = method.__name__, []
+            else:
+                action = f"{type(self).__name__}.{method.__name__}"
+                state = [getattr(self, name) for name in getattr(self, "RECORDED_STATE", ())]
+            # Locators as BasePage resolves them, so the replay finds exactly what the test looked for
+            values = [LocatorRegistry.preferred(value) if LocatorRegistry.is_locator(value) else value
+                      for value in state + list(args)]
+            step = {"action": action, "args": _jsonable(values)}
+            if kwargs:
+                step["kwargs"] = _jsonable(kwargs)
+            with CommandRecorder._lock:
+                if CommandRecorder.steps is not None:
+                    CommandRecorder.steps.append(step)
+            CommandRecorder._local.depth = depth + 1
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as error:
+                message = (getattr(error, "msg", None) or str(error)).strip().splitlines()
+                step["error"] = f"{type(error).__name__}: {message[0] if message else ''}"
+                raise
+            finally:
+                step["ms"] = round((time.perf_counter() - start) * 1000)
+                CommandRecorder._local.depth = depth
+        return wrapper
+
+    @staticmethod
+    def trace(test=None):
+        """
+        Args:
+            test (str): Node id of the test
+
+        Returns:
+            dict: The current trace; failed_step is the index of the first step that raised (None when the
+                test failed outside a recorded step, e.g. in an assertion)
+        """
+        with CommandRecorder._lock:
+            steps = list(CommandRecorder.steps or [])
+        failed = next((index for index, step in enumerate(steps) if "error" in step), None)
+        return {"test": test, "base_url": Config.BASE_URL, "recorded": time.time(),
+                "failed_step": failed, "steps": steps}
+
+    @staticmethod
+    def save(test):
+        """
+        Store the current trace: in the artifact store when Config.ARTIFACT_STORE, else in Config.TRACE_PATH.
+
+        Args:
+            test (str): Node id of the failed test
+
+        Returns:
+            str: Path of the stored trace, or None when nothing was recorded
+        """
+        trace = CommandRecorder.trace(test)
+        if not trace["steps"]:
+            return None
+        data = json.dumps(trace, separators=(",", ":"))
+        if Config.ARTIFACT_STORE:
+            from utils.artifact_store import ArtifactStore  # Imported here: only needed for failed tests
+            return ArtifactStore().put(data, "json", f"trace {test}", test)
+        os.makedirs(Config.TRACE_PATH, exist_ok=True)
+        path = os.path.join(Config.TRACE_PATH, re.sub(r"[^\w.-]+", "_", test) + ".json")
+        with open(path, "w", encoding="utf-8") as trace_file:
+            trace_file.write(data)
+        return path
+
+    @staticmethod
+    def load(source):
+        """
+        Args:
+            source (str): Trace file (.json or .json.gz) or hash prefix of a trace in the artifact store
+
+        Returns:
+            dict: Trace
+        """
+        if os.path.isfile(source):
+            with open(source, "rb") as trace_file:
+                data = trace_file.read()
+            if source.endswith(".gz"):
+                data = gzip.decompress(data)
+        else:
+            from utils.artifact_store import ArtifactStore  # Imported here: only needed for hash prefixes
+            data = ArtifactStore().read(source)
+        return json.loads(data)
+
+
+class Replayer:
+    """Re-executes a trace on a driver with explicit waits and no pacing sleeps"""
+
+    def __init__(self, driver, timeout=None):
+        """
+        Args:
+            driver: WebDriver instance to replay on
+            timeout (int): Seconds to wait for each element (defaults to Config.EXPLICIT_WAIT)
+        """
+        from pages.base_page import BasePage  # Imported here: BasePage imports the recorder module
+        from selenium.webdriver.support.ui import WebDriverWait
+        self.driver = driver
+        self.page = BasePage(driver)  # For the widget drivers; they use only its waits and lookups
+        self.wait = WebDriverWait(driver, timeout or Config.EXPLICIT_WAIT)
+
+    def run_step(self, step):
+        """
+        Execute one step.
+
+        Args:
+            step (dict): Recorded step
+
+        Returns:
+            Step result (text for get_text, bool for is_displayed, ...)
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        action, args, kwargs = step["action"], step["args"], step.get("kwargs", {})
+        if action == "navigate":
+            return self.driver.get(args[0])
+        if action == "click":
+            element = self.wait.until(EC.element_to_be_clickable(tuple(args[0])))
+            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+            return element.click()
+        if action == "send_keys":
+            element = self.wait.until(EC.presence_of_element_located(tuple(args[0])))
+            if kwargs.get("clear_first", args[2] if len(args) > 2 else True):
+                element.clear()
+            return element.send_keys(args[1])
+        if action == "is_displayed":
+            try:
+                return self.wait.until(EC.presence_of_element_located(tuple(args[0]))).is_displayed()
+            except TimeoutException:
+                return False  # BasePage.is_displayed reports a missing element as not displayed
+        if action in ("find_element", "wait_for_element", "get_text", "scroll_to_element"):
+            element = self.wait.until(EC.presence_of_element_located(tuple(args[0])))
+            if action == "scroll_to_element":
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+            return element.text if action == "get_text" else None
+        if action == "find_elements":
+            return len(self.driver.find_elements(*args[0]))
+        if action == "ActionBatch.perform":
+            from utils.action_batch import ActionBatch  # Imported here: only batch steps need it
+            targets, steps, expected, synthetic, timeout = args
+            batch = ActionBatch(self.driver, synthetic, timeout)
+            batch._targets, batch._steps, batch._expected = targets, steps, expected
+            return batch.perform()
+        if action == "DatePicker.set_date":
+            from pages.widgets import DatePicker  # Imported here: only widget steps need them
+            return DatePicker(self.page, tuple(args[0])).set_date(args[1])
+        if action == "Autocomplete.select":
+            from pages.widgets import Autocomplete
+            return Autocomplete(self.page, tuple(args[0]), args[1]).select(args[2])
+        raise ValueError(f"Cannot replay step {action}")
+
+    def replay(self, trace, stop_before=False, report=print):
+        """
+        Replay a trace up to its failed step.
+
+        Args:
+            trace (dict): Trace from CommandRecorder.load()
+            stop_before (bool): Stop before the failed step instead of executing it
+            report (callable): Receives one progress line per step
+
+        Returns:
+            int: Index of the step the replay stopped at (len(steps) when all ran)
+        """
+        steps = trace["steps"]
+        failed = trace.get("failed_step")
+        last = len(steps) if failed is None else failed + 1
+        for index, step in enumerate(steps[:last]):
+            label = f"{index:>3} {step['action']} {json.dumps(step['args'])[:100]}"
+            if index == failed and stop_before:
+                report(f"  stopped before {label}\n      failed in the test with {step['error']}")
+                return index
+            start = time.perf_counter()
+            try:
+                result = self.run_step(step)
+            except Exception as error:
+                report(f"  FAIL {label}: {type(error).__name__}: {str(error).strip()[:200]}")
+                if index == failed:
+                    report(f"      reproduced; the test failed with {step['error']}")
+                return index
+            elapsed = (time.perf_counter() - start) * 1000
+            result = "" if result is None else f" -> {result!r}"
+            report(f"  ok   {label}{result} ({elapsed:.0f} ms, {step.get('ms', 0)} ms in the test)")
+            if index == failed:
+                report(f"      did not reproduce: the test failed here with {step['error']}")
+        return last
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded test trace on a fresh browser")
+    parser.add_argument("trace", help="Trace file or artifact hash prefix")
+    parser.add_argument("--stop-before", action="store_true", help="Stop before executing the failed step")
+    parser.add_argument("--close", action="store_true", help="Close the browser when the replay stops")
+    args = parser.parse_args()
+
+    trace = CommandRecorder.load(args.trace)
+    print(f"Replaying {len(trace['steps'])} steps of {trace['test']}")
+    from utils.driver_factory import DriverFactory  # Imported here: only the replay needs a browser
+    driver = DriverFactory.get_driver(use_daemon=False)
+    start = time.perf_counter()
+    try:
+        stopped = Replayer(driver).replay(trace, args.stop_before)
+        recorded = sum(step.get("ms", 0) for step in trace["steps"][:stopped]) / 1000
+        print(f"Stopped at step {stopped} after {time.perf_counter() - start:.1f}s ({recorded:.1f}s in the test)")
+        if not args.close and sys.stdin.isatty():
+            input("Browser kept open for inspection - press Enter to close it ")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
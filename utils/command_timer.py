@@ -0,0 +1,100 @@
+"""
+WebDriver command timing - measures the round trip of every command sent to a driver or grid
+"""
+import threading
+import time
+
+
+class CommandStats:
+    """Aggregated latency of one WebDriver command"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration):
+        """
+        Args:
+            duration (float): Round trip time in seconds
+        """
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    @property
+    def mean(self):
+        """float: Mean round trip time in seconds"""
+        return self.total / self.count if self.count else 0.0
+
+
+class CommandTimer:
+    """
+    Wraps a command executor (RemoteConnection) and records the round trip time per command.
+    Local and remote drivers both send every command through their executor, so the same numbers
+    can be compared to see the network overhead of a grid.
+    """
+
+    _shared = None
+
+    def __init__(self):
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def shared():
+        """
+        Returns:
+            CommandTimer: Process-wide timer used by DriverFactory when Config.COMMAND_TIMING is on
+        """
+        if CommandTimer._shared is None:
+            CommandTimer._shared = CommandTimer()
+        return CommandTimer._shared
+
+    def instrument(self, executor):
+        """
+        Time every command sent through an executor. Instrumenting the same executor twice is a no-op.
+
+        Args:
+            executor: RemoteConnection of a driver (driver.command_executor)
+        """
+        if getattr(executor, "_command_timer", None) is not None:
+            return
+        original_execute = executor.execute
+
+        def timed_execute(command, params):
+            start = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                self.record(command, time.perf_counter() - start)
+
+        executor.execute = timed_execute
+        executor._command_timer = self
+
+    def record(self, command, duration):
+        """
+        Args:
+            command (str): WebDriver command name, e.g. "findElement"
+            duration (float): Round trip time in seconds
+        """
+        with self._lock:
+            self.stats.setdefault(command, CommandStats()).add(duration)
+
+    def reset(self):
+        """Drop all recorded timings."""
+        with self._lock:
+            self.stats = {}
+
+    def summary_lines(self):
+        """
+        Returns:
+            list: Report lines, slowest total time first
+        """
+        lines = [f"{'command':<28}{'count':>8}{'mean ms':>10}{'max ms':>10}{'total s':>10}"]
+        for command, stats in sorted(self.stats.items(), key=lambda item: -item[1].total):
+            lines.append(
+                f"{command:<28}{stats.count:>8}{stats.mean * 1000:>10.1f}"
+                f"{stats.max * 1000:>10.1f}{stats.total:>10.2f}"
+            )
+        return lines
@@ -0,0 +1,321 @@
+"""
+High-throughput synthetic test data factory.
+
+Values are picked from pools precomputed once per seed (names, addresses, every valid date in
+"15 Jan 1995" format) with plain index arithmetic, so no random number is drawn per record.
+Uniqueness comes from the record index rather than from checking a set of used values:
+    - emails embed the index (plus the worker and run tokens for next_* values)
+    - mobiles map the index through a permutation of the 10-digit range, so two indexes never collide
+"""
+import calendar
+import itertools
+import os
+import threading
+import time
+from datetime import date, timedelta
+
+
+# Small primes used as strides: picking pool[(index * stride + offset) % len(pool)] walks each pool
+# in a different order, so neighbouring records do not share every field
+_STRIDES = (7, 11, 13, 17, 19, 23, 29, 31)
+
+# 10-digit mobiles: 1_000_000_000 .. 9_999_999_999. Multiplying by a number coprime with the size of
+# that range is a bijection modulo the range, hence collision free for up to MOBILE_SPACE indexes
+MOBILE_BASE = 1_000_000_000
+MOBILE_SPACE = 9_000_000_000
+MOBILE_MULTIPLIER = 7_919  # Prime, coprime with 9_000_000_000 = 2^9 * 3^2 * 5^9
+
+# Indexes handed out by next_* methods are split into one block per parallel worker
+WORKER_BLOCK = 100_000_000
+
+
+def _to_base36(number):
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    token = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        token = digits[remainder] + token
+        if number == 0:
+            return token
+
+
+class DataPools:
+    """Precomputed value pools shared by every factory with the same seed"""
+
+    FIRST_NAMES = ["James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+                   "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+                   "Thomas", "Sarah", "Charles", "Karen", "Omar", "Priya", "Wei", "Ana"]
+    LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+                  "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas",
+                  "Taylor", "Moore", "Jackson", "Martin", "Haddad", "Patel", "Chen", "Costa"]
+    DEPARTMENTS = ["QA", "Engineering", "Finance", "Legal", "Compliance", "Insurance", "Sales"]
+    STREETS = ["Main Street", "Oak Avenue", "Pine Road", "Maple Lane", "Cedar Court", "Elm Drive",
+               "Park Boulevard", "Lake View"]
+    CITIES = ["New York, NY 10001", "Los Angeles, CA 90001", "Chicago, IL 60601", "Austin, TX 73301",
+              "Seattle, WA 98101", "Boston, MA 02108"]
+    SUBJECTS = ["Maths", "Physics", "Chemistry", "English", "Computer Science", "Economics"]
+    HOBBIES = ["Sports", "Reading", "Music"]
+    GENDERS = ["Male", "Female", "Other"]
+
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, seed):
+        """
+        Build the pools. Use DataPools.get(seed) to share them.
+
+        Args:
+            seed (int): Rotates every pool so different seeds produce different data
+        """
+        self.seed = seed
+        names = list(itertools.product(self.FIRST_NAMES, self.LAST_NAMES))
+        self.first_names = self._rotate([first for first, _ in names], seed)
+        self.last_names = self._rotate([last for _, last in names], seed)
+        self.full_names = [f"{first} {last}" for first, last in zip(self.first_names, self.last_names)]
+        self.email_locals = [f"{first.lower()}.{last.lower()}" for first, last in zip(self.first_names, self.last_names)]
+        self.addresses = self._rotate([
+            f"{number} {street}, {city}"
+            for number in range(1, 200, 7) for street in self.STREETS for city in self.CITIES
+        ], seed)
+        # Every valid date of birth between 1960 and 2005, already in "15 Jan 1995" format
+        first_day = date(1960, 1, 1)
+        days = (date(2005, 12, 31) - first_day).days + 1
+        self.dates = self._rotate([
+            f"{day.day:02d} {calendar.month_abbr[day.month]} {day.year}"
+            for day in (first_day + timedelta(days=offset) for offset in range(days))
+        ], seed)
+        self.ages = self._rotate([str(age) for age in range(18, 66)], seed)
+        self.salaries = self._rotate([str(salary) for salary in range(30000, 200001, 1000)], seed)
+        self.departments = self._rotate(self.DEPARTMENTS, seed)
+        self.subjects = self._rotate(self.SUBJECTS, seed)
+        self.hobbies = self._rotate(self.HOBBIES, seed)
+        self.genders = self._rotate(self.GENDERS, seed)
+
+    @staticmethod
+    def _rotate(pool, seed):
+        shift = (seed * 2654435761) % len(pool)  # Knuth's multiplicative hash spreads nearby seeds apart
+        return pool[shift:] + pool[:shift]
+
+    @staticmethod
+    def get(seed=0):
+        """
+        Args:
+            seed (int): Pool seed
+
+        Returns:
+            DataPools: Memoized pools for the seed
+        """
+        with DataPools._cache_lock:
+            if seed not in DataPools._cache:
+                DataPools._cache[seed] = DataPools(seed)
+            return DataPools._cache[seed]
+
+
+class DataFactory:
+    """
+    Generates users, web table records and practice form payloads.
+
+    *_at(index) methods are pure: the same seed and index always give the same record, which makes
+    them suitable for reproducible datasets. next_* methods hand out fresh indexes and tag emails
+    with a worker and run token, so values stay unique across repeated and parallel runs.
+    """
+
+    _shared = None
+
+    def __init__(self, seed=0, worker=None):
+        """
+        Args:
+            seed (int): Pool seed
+            worker (int): Parallel worker number (defaults to the pytest-xdist worker, or 0)
+        """
+        self.pools = DataPools.get(seed)
+        if worker is None:
+            worker = int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:] or 0)
+        self.worker = worker
+        # Run token: distinguishes emails of this run from the ones created by earlier runs
+        self.run_token = _to_base36(int(time.time() * 1000) % 36 ** 6) + _to_base36(worker)
+        self._counter = itertools.count(worker * WORKER_BLOCK)
+        self._counter_lock = threading.Lock()
+
+    @staticmethod
+    def shared():
+        """
+        Returns:
+            DataFactory: Process-wide factory for next_* values
+        """
+        if DataFactory._shared is None:
+            DataFactory._shared = DataFactory()
+        return DataFactory._shared
+
+    def next_index(self):
+        """
+        Returns:
+            int: A record index never returned before by this factory
+        """
+        with self._counter_lock:
+            return next(self._counter)
+
+    @staticmethod
+    def mobile_at(index):
+        """
+        Args:
+            index (int): Record index, below 9_000_000_000
+
+        Returns:
+            str: 10-digit mobile number, unique per index
+        """
+        return str(MOBILE_BASE + (index * MOBILE_MULTIPLIER) % MOBILE_SPACE)
+
+    def email_at(self, index, token=""):
+        """
+        Args:
+            index (int): Record index
+            token (str): Optional extra token (worker/run) embedded in the address
+
+        Returns:
+            str: Email address, unique per (index, token)
+        """
+        pools = self.pools
+        return f"{pools.email_locals[index % len(pools.email_locals)]}.{token}{index:x}@example.com"
+
+    def web_table_record_at(self, index):
+        """
+        Args:
+            index (int): Record index
+
+        Returns:
+            dict: Record with the keys of TestData.WEB_TABLE_RECORD
+        """
+        return next(self.web_table_records(1, start=index))
+
+    def practice_form_at(self, index):
+        """
+        Args:
+            index (int): Record index
+
+        Returns:
+            dict: Payload with the keys of TestData.PRACTICE_FORM_DATA
+        """
+        return next(self.practice_forms(1, start=index))
+
+    def text_box_at(self, index):
+        """
+        Args:
+            index (int): Record index
+
+        Returns:
+            dict: Payload with the keys of TestData.TEXT_BOX_DATA
+        """
+        pools = self.pools
+        addresses = pools.addresses
+        return {
+            "full_name": pools.full_names[index % len(pools.full_names)],
+            "email": self.email_at(index),
+            "current_address": addresses[(index * 7) % len(addresses)],
+            "permanent_address": addresses[(index * 11 + 1) % len(addresses)],
+        }
+
+    def user_at(self, index):
+        """
+        Args:
+            index (int): Record index
+
+        Returns:
+            dict: Credentials with the keys of TestData.VALID_USER
+        """
+        pools = self.pools
+        return {
+            "username": f"{pools.email_locals[index % len(pools.email_locals)].replace('.', '_')}_{_to_base36(index)}",
+            "password": f"Pw@{_to_base36(index * 2654435761 % 36 ** 8)}",
+        }
+
+    def web_table_records(self, count, start=0):
+        """
+        Stream web table records for indexes start .. start + count - 1.
+        The hot loop only does index arithmetic and list lookups.
+
+        Args:
+            count (int): Number of records
+            start (int): First record index
+
+        Yields:
+            dict: Record with the keys of TestData.WEB_TABLE_RECORD
+        """
+        pools = self.pools
+        first_names, last_names, email_locals = pools.first_names, pools.last_names, pools.email_locals
+        ages, salaries, departments = pools.ages, pools.salaries, pools.departments
+        n_names, n_ages, n_salaries, n_departments = len(first_names), len(ages), len(salaries), len(departments)
+        s_age, s_salary, s_department = _STRIDES[0], _STRIDES[1], _STRIDES[2]
+        for index in range(start, start + count):
+            name = index % n_names
+            yield {
+                "first_name": first_names[name],
+                "last_name": last_names[name],
+                "email": f"{email_locals[name]}.{index:x}@example.com",
+                "age": ages[index * s_age % n_ages],
+                "salary": salaries[index * s_salary % n_salaries],
+                "department": departments[index * s_department % n_departments],
+            }
+
+    def practice_forms(self, count, start=0):
+        """
+        Stream practice form payloads for indexes start .. start + count - 1.
+
+        Args:
+            count (int): Number of payloads
+            start (int): First record index
+
+        Yields:
+            dict: Payload with the keys of TestData.PRACTICE_FORM_DATA
+        """
+        pools = self.pools
+        first_names, last_names, email_locals = pools.first_names, pools.last_names, pools.email_locals
+        genders, dates, subjects = pools.genders, pools.dates, pools.subjects
+        hobbies, addresses = pools.hobbies, pools.addresses
+        n_names, n_genders, n_dates = len(first_names), len(genders), len(dates)
+        n_subjects, n_hobbies, n_addresses = len(subjects), len(hobbies), len(addresses)
+        for index in range(start, start + count):
+            name = index % n_names
+            yield {
+                "first_name": first_names[name],
+                "last_name": last_names[name],
+                "email": f"{email_locals[name]}.{index:x}@example.com",
+                "gender": genders[index * 7 % n_genders],
+                "mobile": str(MOBILE_BASE + (index * MOBILE_MULTIPLIER) % MOBILE_SPACE),
+                "date_of_birth": dates[index * 11 % n_dates],
+                "subjects": subjects[index * 13 % n_subjects],
+                "hobbies": hobbies[index * 17 % n_hobbies],
+                "current_address": addresses[index * 19 % n_addresses],
+            }
+
+    def next_email(self):
+        """
+        Returns:
+            str: Email unique across records, parallel workers and repeated runs
+        """
+        return self.email_at(self.next_index(), token=f"{self.run_token}.")
+
+    def next_mobile(self):
+        """
+        Returns:
+            str: 10-digit mobile unique within this run across parallel workers
+        """
+        return self.mobile_at(self.next_index())
+
+    def make_unique(self, record):
+        """
+        Copy a static test data dict, replacing its email (and mobile) with unique values.
+
+        Args:
+            record (dict): e.g. TestData.WEB_TABLE_RECORD
+
+        Returns:
+            dict: Copy safe to submit repeatedly or from parallel workers
+        """
+        unique = dict(record)
+        index = self.next_index()
+        if "email" in unique:
+            unique["email"] = self.email_at(index, token=f"{self.run_token}.")
+        if "mobile" in unique:
+            unique["mobile"] = self.mobile_at(index)
+        return unique
@@ -0,0 +1,214 @@
+"""
+Streaming data provider for data-driven tests.
+
+Records come from CSV/JSONL files (one record per line; quoted CSV fields may span lines) or from a
+seeded synthetic generator.
+Only row numbers are handed to pytest parametrization; each record is read from disk or generated
+when its test runs, so datasets with thousands of rows never sit in memory.
+"""
+import abc
+import csv
+import io
+import json
+import os
+from array import array
+from config.config import Config
+from utils.data_factory import DataFactory
+
+
+class FileSource(abc.ABC):
+    """Record-per-line file dataset. Indexes byte offsets once, then reads single records on demand."""
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Path to the data file
+        """
+        self.path = path
+        self._offsets = array("q")  # 8 bytes per record, whatever the record size
+        self._handle = None
+        self._handle_pid = None
+        self._index()
+
+    def _index(self):
+        """Scan the file once and remember where each record starts."""
+        with open(self.path, "rb") as data_file:
+            position = self._read_header(data_file)
+            for record in self._records(data_file):
+                if record.strip():
+                    self._offsets.append(position)
+                position += len(record)
+
+    def _records(self, data_file):
+        """Iterate over the raw bytes of the records from the current position; one line per record."""
+        return data_file
+
+    def _read_header(self, data_file):
+        """Consume a header if the format has one. Returns the offset of the first record."""
+        return 0
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def _read_record(self, index):
+        # Reopen after a fork (e.g. parallel workers) so processes never share a file position
+        if self._handle is None or self._handle_pid != os.getpid():
+            self._handle = open(self.path, "rb")
+            self._handle_pid = os.getpid()
+        self._handle.seek(self._offsets[index])
+        return next(iter(self._records(self._handle))).decode("utf-8")
+
+    @abc.abstractmethod
+    def load(self, index):
+        """
+        Args:
+            index (int): Record number
+
+        Returns:
+            dict: The record
+        """
+
+
+class CsvSource(FileSource):
+    """CSV file with a header row"""
+
+    def _read_header(self, data_file):
+        header = next(self._records(data_file), b"")
+        self.fieldnames = next(csv.reader(io.StringIO(header.decode("utf-8-sig"))))
+        return len(header)
+
+    def _records(self, data_file):
+        record = b""
+        for line in data_file:
+            record += line
+            # A quoted field spans lines until its closing quote; escaped quotes ("") keep the count even
+            if record.count(b'"') % 2 == 0:
+                yield record
+                record = b""
+        if record:
+            yield record  # Unclosed quote: the rest of the file is one record
+
+    def load(self, index):
+        values = next(csv.reader(io.StringIO(self._read_record(index))))
+        return dict(zip(self.fieldnames, values))
+
+
+class JsonlSource(FileSource):
+    """JSON Lines file, one object per line"""
+
+    def load(self, index):
+        return json.loads(self._read_record(index))
+
+
+class SyntheticSource:
+    """
+    Seeded generated dataset backed by DataFactory. Record N depends only on (seed, N), so any record
+    can be produced on demand in any process and every run sees the same data.
+    """
+
+    def __init__(self, kind, count, seed=0):
+        """
+        Args:
+            kind (str): Record type - web_table_record, practice_form, text_box or user
+            count (int): Number of records in the dataset
+            seed (int): Seed making the dataset reproducible
+        """
+        factory = DataFactory(seed=seed)
+        generators = {
+            "web_table_record": factory.web_table_record_at,
+            "practice_form": factory.practice_form_at,
+            "text_box": factory.text_box_at,
+            "user": factory.user_at,
+        }
+        if kind not in generators:
+            raise ValueError(f"Unknown synthetic dataset: {kind}")
+        self.kind = kind
+        self.count = count
+        self.seed = seed
+        self._generate = generators[kind]
+
+    def __len__(self):
+        return self.count
+
+    def load(self, index):
+        """
+        Args:
+            index (int): Record number
+
+        Returns:
+            dict: The generated record, with the same keys as the matching TestData dict
+        """
+        if not 0 <= index < self.count:
+            raise IndexError(f"Record {index} outside synthetic dataset of {self.count}")
+        return self._generate(index)
+
+
+class DataProvider:
+    """Opens datasets and splits them across parallel runs"""
+
+    _sources = {}
+
+    @staticmethod
+    def open(source, count=None, seed=None):
+        """
+        Open a dataset. Sources are cached per process, so a file is indexed only once.
+
+        Args:
+            source (str): Path to a .csv/.jsonl file, or "synthetic:<kind>"
+            count (int): Number of synthetic records (defaults to Config.SYNTHETIC_DATASET_SIZE)
+            seed (int): Synthetic seed (defaults to Config.SYNTHETIC_DATASET_SEED)
+
+        Returns:
+            Dataset supporting len() and load(index)
+        """
+        if source.startswith("synthetic:"):
+            count = Config.SYNTHETIC_DATASET_SIZE if count is None else count
+            seed = Config.SYNTHETIC_DATASET_SEED if seed is None else seed
+        key = (source, count, seed)
+        if key not in DataProvider._sources:
+            if source.startswith("synthetic:"):
+                dataset = SyntheticSource(source.split(":", 1)[1], count, seed)
+            elif source.endswith(".csv"):
+                dataset = CsvSource(source)
+            elif source.endswith(".jsonl"):
+                dataset = JsonlSource(source)
+            else:
+                raise ValueError(f"Unsupported dataset source: {source}")
+            DataProvider._sources[key] = dataset
+        return DataProvider._sources[key]
+
+    @staticmethod
+    def parse_shard(value):
+        """
+        Parse a shard spec such as "2/4" (second of four shards, 1-based).
+
+        Args:
+            value (str): Shard spec, or None for no sharding
+
+        Returns:
+            tuple: (shard index starting at 0, number of shards)
+        """
+        if not value:
+            return 0, 1
+        shard, shards = (int(part) for part in value.split("/"))
+        if not 1 <= shard <= shards:
+            raise ValueError(f"Invalid data shard {value}: expected N/M with 1 <= N <= M")
+        return shard - 1, shards
+
+    @staticmethod
+    def shard_indices(total, shard=0, shards=1, limit=None):
+        """
+        Record numbers belonging to one shard. Records are dealt round-robin, so every shard gets
+        the same share and the split does not depend on the machine or run order.
+
+        Args:
+            total (int): Number of records in the dataset
+            shard (int): Shard index starting at 0
+            shards (int): Number of shards
+            limit (int): Keep at most this many records in the shard
+
+        Returns:
+            range: Record numbers (lazy; no list is built)
+        """
+        indices = range(shard, total, shards)
+        return indices[:limit] if limit is not None else indices
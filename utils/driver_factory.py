@@ -1,26 +1,62 @@
 """
-Login Page Tests - Book Store Application
+WebDriver factory - Creates configured browser instances.
+Selenium and webdriver_manager modules are imported inside the browser-specific builders,
+so importing this module (e.g. from conftest.py during collection) stays cheap.
 """
-from selenium import webdriver  # Import the selenium webdriver module
-from selenium.webdriver.chrome.service import Service as ChromeService  # Import Chrome service to manage ChromeDriver
-from selenium.webdriver.firefox.service import Service as FirefoxService  # Import Firefox service
-from selenium.webdriver.edge.service import Service as EdgeService  # Import Edge service
-from webdriver_manager.chrome import ChromeDriverManager  # Import ChromeDriverManager to automatically handle driver installation
-from webdriver_manager.firefox import GeckoDriverManager  # Import GeckoDriverManager for Firefox
-from webdriver_manager.microsoft import EdgeChromiumDriverManager  # Import EdgeChromiumDriverManager for Edge
+import os  # File system checks on the installed driver
+import stat  # Permission bits for the driver executable
 from config.config import Config  # Import the Config class to access configuration settings
+from utils.logger import Logger  # Import Logger class
 
 
 class DriverFactory:
     """Factory class to create and configure WebDriver instances"""
     
+    # browserName capability values of Chromium browsers
+    CHROMIUM_NAMES = ("chrome", "MicrosoftEdge", "msedge")
+    
+    # Driver executable paths resolved by webdriver_manager, cached per browser for this process
+    _driver_paths = {}
+    
+    # Chrome / Edge switches of the "performance" launch profile: no background services or
+    # extensions competing with the test for CPU and network, and no throttling of background tabs
+    PERFORMANCE_CHROMIUM_ARGS = [
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-extensions",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--metrics-recording-only",
+        "--mute-audio",
+    ]
+    
+    # Firefox preferences of the "performance" launch profile
+    PERFORMANCE_FIREFOX_PREFS = {
+        "app.update.auto": False,
+        "extensions.update.enabled": False,
+        "browser.safebrowsing.malware.enabled": False,
+        "browser.safebrowsing.phishing.enabled": False,
+        "browser.shell.checkDefaultBrowser": False,
+        "datareporting.policy.dataSubmissionEnabled": False,
+        "toolkit.telemetry.enabled": False,
+    }
+    
     @staticmethod
-    def get_driver(browser=None):
+    def get_driver(browser=None, page_load_strategy=None, use_daemon=None):
         """
         Create and return a WebDriver instance based on browser type
         
         Args:
             browser (str): Browser name (chrome, firefox, edge)
+            page_load_strategy (str): Optional page load strategy (normal, eager, none).
+                Uses the browser default when not provided.
+            use_daemon (bool): Attach to the persistent browser daemon instead of launching a browser.
+                Defaults to Config.USE_BROWSER_DAEMON; falls back to a new browser if no daemon is running.
             
         Returns:
             WebDriver: Configured WebDriver instance
@@ -30,77 +66,56 @@ class DriverFactory:
         # Normalize the browser string to lowercase to ensure case-insensitive comparison
         browser = browser.lower()
         
-        if browser == "chrome":
-            # Initialize ChromeOptions to configure Chrome-specific settings
-            options = webdriver.ChromeOptions()
-            # If HEADLESS mode is enabled in config, add the argument to run in background
-            if Config.HEADLESS:
-                options.add_argument("--headless")
-            # Create a new Chrome instance with the specified service and options
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            
-            # Get the driver path and ensure it's the actual executable
-            driver_path = ChromeDriverManager().install()
-            
-            # Fix for macOS ARM64 - ensure we're using the actual chromedriver executable
-            import os
-            import stat
-            if os.path.isdir(driver_path):
-                # If it's a directory, find the chromedriver executable inside
-                driver_path = os.path.join(driver_path, "chromedriver")
-            elif "THIRD_PARTY_NOTICES" in driver_path or not driver_path.endswith("chromedriver"):
-                # If it's pointing to the wrong file, get the directory and find chromedriver
-                driver_dir = os.path.dirname(driver_path)
-                driver_path = os.path.join(driver_dir, "chromedriver")
-            
-            # Ensure the chromedriver has execute permissions
-            if os.path.exists(driver_path):
-                os.chmod(driver_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
-            
-            driver = webdriver.Chrome(
-                service=ChromeService(driver_path),
-                options=options
-            )
-            
-        elif browser == "firefox":
-            # Initialize FirefoxOptions for Firefox-specific settings
-            options = webdriver.FirefoxOptions()
-            # Check config to see if we should run headless
-            if Config.HEADLESS:
-                options.add_argument("--headless")
-            
-            # Initialize the Firefox driver using the installed GeckoDriver
-            driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()),
-                options=options
-            )
-            
-        elif browser == "edge":
-            # Initialize EdgeOptions
-            options = webdriver.EdgeOptions()
-            # Check for headless mode
-            if Config.HEADLESS:
-                options.add_argument("--headless")
-            
-            # Initialize the Edge driver
-            driver = webdriver.Edge(
-                service=EdgeService(EdgeChromiumDriverManager().install()),
-                options=options
-            )
-            
-        else:
+        # Reuse the daemon's already running browser when requested and it matches the requested setup
+        use_daemon = Config.USE_BROWSER_DAEMON if use_daemon is None else use_daemon
+        if use_daemon and page_load_strategy is None:
+            from utils.browser_daemon import BrowserDaemon  # Imported here: the daemon itself uses this factory
+            driver = BrowserDaemon.attach(browser)
+            if driver is not None:
+                return driver
+            Logger.get_logger("DriverFactory").warning("No browser daemon to attach to, launching a new browser")
+        
+        # Sessions on a Selenium Grid come from a pool of reusable remote sessions
+        if Config.GRID_URL:
+            from utils.remote_driver import RemoteSessionPool  # Imported here: only needed for grid runs
+            driver = RemoteSessionPool.for_browser(browser, page_load_strategy).acquire()
+            return DriverFactory._configure(driver)
+        
+        # Only the selected browser's Selenium and webdriver_manager modules get imported
+        builders = {
+            "chrome": DriverFactory._create_chrome,
+            "firefox": DriverFactory._create_firefox,
+            "edge": DriverFactory._create_edge,
+        }
+        if browser not in builders:
             # Raise an error if an unsupported browser is requested
             raise ValueError(f"Unsupported browser: {browser}")
+        driver = builders[browser](page_load_strategy)
+        if Config.COMMAND_TIMING:
+            from utils.command_timer import CommandTimer  # Imported here: only needed when timing is enabled
+            CommandTimer.shared().instrument(driver.command_executor)
+        return DriverFactory._configure(driver)
+    
+    @staticmethod
+    def _configure(driver):
+        """
+        Apply timeouts and window size from config to a new driver.
         
+        Args:
+            driver: WebDriver instance
+            
+        Returns:
+            WebDriver: The same driver, configured
+        """
         # Configure the driver with implicit wait time from config
         driver.implicitly_wait(Config.IMPLICIT_WAIT)
         # Set the page load timeout from config
         driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
         
         # Set the window size based on configuration
-        if Config.WINDOW_SIZE == "maximize":
+        if Config.LAUNCH_PROFILE == "performance":
+            pass  # Sized at launch (--window-size, or --width / --height for Firefox); no extra window command
+        elif Config.WINDOW_SIZE == "maximize":
             # Maximize the browser window
             driver.maximize_window()
         elif isinstance(Config.WINDOW_SIZE, tuple):
@@ -109,3 +124,202 @@ class DriverFactory:
         
         # Return the configured driver instance
         return driver
+    
+    @staticmethod
+    def get_options(browser, page_load_strategy=None):
+        """
+        Build the browser options from config. Shared by local and remote (grid) drivers.
+        
+        Args:
+            browser (str): Browser name (chrome, firefox, edge)
+            page_load_strategy (str): Optional page load strategy
+            
+        Returns:
+            Options instance for the browser
+        """
+        if browser == "chrome":
+            # Initialize ChromeOptions to configure Chrome-specific settings
+            from selenium.webdriver.chrome.options import Options
+        elif browser == "firefox":
+            # Initialize FirefoxOptions for Firefox-specific settings
+            from selenium.webdriver.firefox.options import Options
+        elif browser == "edge":
+            # Initialize EdgeOptions
+            from selenium.webdriver.edge.options import Options
+        else:
+            raise ValueError(f"Unsupported browser: {browser}")
+        options = Options()
+        performance = Config.LAUNCH_PROFILE == "performance"
+        
+        # If HEADLESS mode is enabled in config, add the argument to run in background
+        if Config.HEADLESS:
+            # New headless mode runs the regular browser instead of the separate legacy implementation
+            options.add_argument("--headless=new" if performance and browser != "firefox" else "--headless")
+        # Apply a custom page load strategy if requested (e.g. "none" for tab scheduling)
+        if page_load_strategy:
+            options.page_load_strategy = page_load_strategy
+        if browser == "chrome":
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-gpu")
+        if performance:
+            width, height = DriverFactory.launch_viewport()
+            if browser == "firefox":
+                options.add_argument(f"--width={width}")
+                options.add_argument(f"--height={height}")
+                for name, value in DriverFactory.PERFORMANCE_FIREFOX_PREFS.items():
+                    options.set_preference(name, value)
+                if not Config.GRID_URL:
+                    options.set_preference("browser.cache.disk.parent_directory", DriverFactory.cache_dir())
+            else:
+                for argument in DriverFactory.PERFORMANCE_CHROMIUM_ARGS:
+                    options.add_argument(argument)
+                options.add_argument(f"--window-size={width},{height}")
+                if not Config.GRID_URL:  # A local path means nothing on a grid node
+                    options.add_argument(f"--disk-cache-dir={DriverFactory.cache_dir()}")
+        return options
+    
+    @staticmethod
+    def launch_viewport():
+        """
+        Returns:
+            tuple: (width, height) the performance profile launches the window with
+        """
+        return Config.WINDOW_SIZE if isinstance(Config.WINDOW_SIZE, tuple) else Config.PERFORMANCE_VIEWPORT
+    
+    @staticmethod
+    def cache_dir():
+        """
+        Disk cache directory of the performance profile. It outlives the browser, so later sessions start
+        with a warm cache; each xdist worker gets its own, as browsers don't share a cache safely.
+        
+        Returns:
+            str: Absolute path of the cache directory
+        """
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        return os.path.abspath(os.path.join(Config.BROWSER_CACHE_PATH, worker))
+    
+    @staticmethod
+    def reset_state(driver):
+        """
+        Return a reused browser session to a clean state: one tab, no cookies or site storage, blank page.
+        
+        Args:
+            driver: WebDriver instance to reset
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if driver.caps.get("browserName") in DriverFactory.CHROMIUM_NAMES:
+            # DevTools clears cookies and storage for every origin, not just the current document
+            driver.execute("executeCdpCommand", {"cmd": "Network.clearBrowserCookies", "params": {}})
+            driver.execute("executeCdpCommand", {"cmd": "Storage.clearDataForOrigin", "params": {
+                "origin": Config.BASE_URL, "storageTypes": "all"
+            }})
+        else:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.get("about:blank")
+    
+    @staticmethod
+    def _install_driver(browser, manager_factory):
+        """
+        Resolve the driver executable once per process.
+        webdriver_manager checks versions (and may hit the network) on every install() call.
+        
+        Args:
+            browser (str): Browser name used as cache key
+            manager_factory (callable): Returns the webdriver_manager instance for the browser
+            
+        Returns:
+            str: Path to the driver executable
+        """
+        if browser not in DriverFactory._driver_paths:
+            DriverFactory._driver_paths[browser] = manager_factory().install()
+        return DriverFactory._driver_paths[browser]
+    
+    @staticmethod
+    def _create_chrome(page_load_strategy=None):
+        """
+        Create a Chrome driver.
+        
+        Args:
+            page_load_strategy (str): Optional page load strategy
+            
+        Returns:
+            WebDriver: Chrome driver instance
+        """
+        from selenium.webdriver.chrome.service import Service as ChromeService  # Chrome service to manage ChromeDriver
+        from selenium.webdriver.chrome.webdriver import WebDriver as Chrome  # Chrome driver
+        from webdriver_manager.chrome import ChromeDriverManager  # Automatic ChromeDriver installation
+        
+        options = DriverFactory.get_options("chrome", page_load_strategy)
+        
+        # Get the driver path and ensure it's the actual executable
+        driver_path = DriverFactory._install_driver("chrome", ChromeDriverManager)
+        
+        # Fix for macOS ARM64 - ensure we're using the actual chromedriver executable
+        if os.path.isdir(driver_path):
+            # If it's a directory, find the chromedriver executable inside
+            driver_path = os.path.join(driver_path, "chromedriver")
+        elif "THIRD_PARTY_NOTICES" in driver_path or not driver_path.endswith("chromedriver"):
+            # If it's pointing to the wrong file, get the directory and find chromedriver
+            driver_dir = os.path.dirname(driver_path)
+            driver_path = os.path.join(driver_dir, "chromedriver")
+        
+        # Ensure the chromedriver has execute permissions
+        if os.path.exists(driver_path):
+            os.chmod(driver_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+        
+        return Chrome(
+            service=ChromeService(driver_path),
+            options=options
+        )
+    
+    @staticmethod
+    def _create_firefox(page_load_strategy=None):
+        """
+        Create a Firefox driver.
+        
+        Args:
+            page_load_strategy (str): Optional page load strategy
+            
+        Returns:
+            WebDriver: Firefox driver instance
+        """
+        from selenium.webdriver.firefox.service import Service as FirefoxService  # Firefox service
+        from selenium.webdriver.firefox.webdriver import WebDriver as Firefox  # Firefox driver
+        from webdriver_manager.firefox import GeckoDriverManager  # Automatic GeckoDriver installation
+        
+        options = DriverFactory.get_options("firefox", page_load_strategy)
+        
+        # Initialize the Firefox driver using the installed GeckoDriver
+        return Firefox(
+            service=FirefoxService(DriverFactory._install_driver("firefox", GeckoDriverManager)),
+            options=options
+        )
+    
+    @staticmethod
+    def _create_edge(page_load_strategy=None):
+        """
+        Create an Edge driver.
+        
+        Args:
+            page_load_strategy (str): Optional page load strategy
+            
+        Returns:
+            WebDriver: Edge driver instance
+        """
+        from selenium.webdriver.edge.service import Service as EdgeService  # Edge service
+        from selenium.webdriver.edge.webdriver import WebDriver as Edge  # Edge driver
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager  # Automatic EdgeDriver installation
+        
+        options = DriverFactory.get_options("edge", page_load_strategy)
+        
+        # Initialize the Edge driver
+        return Edge(
+            service=EdgeService(DriverFactory._install_driver("edge", EdgeChromiumDriverManager)),
+            options=options
+        )
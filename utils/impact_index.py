@@ -0,0 +1,477 @@
+"""
+Test impact selection - runs only the tests affected by the changes in the working tree.
+
+The index maps each test to the symbols it exercises: page object classes and methods, locator
+constants, Config/TestData attributes. It is built statically from the source (test -> page methods ->
+locators, following self.* calls and base classes) and, with --impact-trace, from the functions each
+test actually called at runtime. It is cached in Config.IMPACT_INDEX_FILE and only files whose content
+changed are parsed again.
+
+    pytest --impact-trace              # full run, records runtime dependencies
+    pytest --impact                    # run only tests affected by changes since HEAD
+    pytest --impact --impact-base main
+
+Changes whose impact cannot be determined (conftest.py, pytest.ini, a function no indexed test
+reaches, ...) select the whole suite.
+"""
+import ast
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import pytest
+from config.config import Config
+from utils.logger import Logger
+
+# Packages whose symbols are indexed
+INDEXED_PACKAGES = ("pages", "locators", "utils", "config", "tests")
+
+# Changes that can affect any test (paths or directory prefixes); other files outside the
+# indexed packages (docs, benchmarks, reports, logs) never affect test behaviour
+RUN_ALL_PATHS = ("pytest.ini", "requirements.txt", "tests/conftest.py", "data/")
+# Files inside the indexed packages that are not loaded by tests
+IGNORED_SUFFIXES = (".md", ".html", ".pyc")
+
+
+class _FileAnalyzer(ast.NodeVisitor):
+    """Extracts the symbols defined in one file and the symbols each function refers to"""
+
+    def __init__(self, relpath, tree):
+        self.relpath = relpath
+        self.imports = {}  # Local name -> symbol of an imported project class
+        self.symbols = {}  # Symbol -> [first line, last line, kind]
+        self.refs = {}     # Function symbol -> referenced symbols ("?name" = attribute of an unknown object)
+        self.bases = {}    # Class symbol -> base class symbols
+        self.tests = {}    # Test name -> referenced symbols
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module and node.module.split(".")[0] in INDEXED_PACKAGES:
+                module_path = node.module.replace(".", "/") + ".py"
+                for alias in node.names:
+                    self.imports[alias.asname or alias.name] = f"{module_path}::{alias.name}"
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                self.imports[node.name] = f"{relpath}::{node.name}"
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                self._class(node)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._function(node, None)
+
+    def _class(self, node):
+        class_symbol = f"{self.relpath}::{node.name}"
+        self.symbols[class_symbol] = [node.lineno, node.end_lineno, "class"]
+        self.bases[class_symbol] = [self.imports[base.id] for base in node.bases
+                                    if isinstance(base, ast.Name) and base.id in self.imports]
+        for statement in node.body:
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._function(statement, node.name)
+            elif isinstance(statement, (ast.Assign, ast.AnnAssign)):
+                targets = statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        self.symbols[f"{class_symbol}.{target.id}"] = [statement.lineno, statement.end_lineno, "attribute"]
+
+    def _function(self, node, class_name):
+        qualname = f"{class_name}.{node.name}" if class_name else node.name
+        symbol = f"{self.relpath}::{qualname}"
+        self.symbols[symbol] = [node.lineno, node.end_lineno, "function"]
+        refs = set()
+        for child in ast.walk(node):
+            if isinstance(child, ast.Attribute) and isinstance(child.value, ast.Name):
+                owner = child.value.id
+                if owner in self.imports:
+                    refs.add(f"{self.imports[owner]}.{child.attr}")
+                elif owner == "self" and class_name:
+                    refs.add(f"{self.relpath}::{class_name}.{child.attr}")
+                else:
+                    refs.add(f"?{child.attr}")
+            elif isinstance(child, ast.Name) and child.id in self.imports:
+                refs.add(self.imports[child.id])
+        self.refs[symbol] = sorted(refs)
+        is_test_class = class_name is None or class_name.startswith("Test")
+        if self.relpath.startswith("tests/") and node.name.startswith("test_") and is_test_class:
+            self.tests[qualname.replace(".", "::")] = sorted(refs)
+
+
+class ImpactIndex:
+    """Cached test -> symbol dependency index"""
+
+    def __init__(self, root, path=None):
+        """
+        Args:
+            root (str): Project root (pytest rootdir)
+            path (str): Index file (defaults to Config.IMPACT_INDEX_FILE under the root)
+        """
+        self.root = root
+        self.path = path or os.path.join(root, Config.IMPACT_INDEX_FILE)
+        try:
+            with open(self.path) as index_file:
+                data = json.load(index_file)
+        except (FileNotFoundError, ValueError):
+            data = {}
+        self.files = data.get("files", {})
+        self.traced = data.get("traced", {})
+
+    def update(self):
+        """
+        Re-parse the project files whose content changed since the index was saved.
+
+        Returns:
+            int: Number of files parsed
+        """
+        parsed = 0
+        seen = set()
+        for package in INDEXED_PACKAGES:
+            for directory, _, filenames in os.walk(os.path.join(self.root, package)):
+                for filename in filenames:
+                    if not filename.endswith(".py"):
+                        continue
+                    relpath = os.path.relpath(os.path.join(directory, filename), self.root).replace(os.sep, "/")
+                    seen.add(relpath)
+                    with open(os.path.join(self.root, relpath), "rb") as source_file:
+                        source = source_file.read()
+                    digest = hashlib.sha1(source).hexdigest()
+                    if self.files.get(relpath, {}).get("hash") == digest:
+                        continue
+                    self.files[relpath] = self._analyze(relpath, source, digest)
+                    parsed += 1
+        for relpath in set(self.files) - seen:
+            del self.files[relpath]
+        return parsed
+
+    @staticmethod
+    def _analyze(relpath, source, digest):
+        try:
+            analyzer = _FileAnalyzer(relpath, ast.parse(source))
+        except SyntaxError:
+            return {"hash": digest, "symbols": {}, "refs": {}, "bases": {}, "tests": {}}
+        return {"hash": digest, "symbols": analyzer.symbols, "refs": analyzer.refs,
+                "bases": analyzer.bases, "tests": analyzer.tests}
+
+    def save(self):
+        """Write the index atomically."""
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as index_file:
+            json.dump({"files": self.files, "traced": self.traced}, index_file)
+        os.replace(temp_path, self.path)
+
+    def _lookup(self):
+        symbols, refs, bases = {}, {}, {}
+        for data in self.files.values():
+            symbols.update(data["symbols"])
+            refs.update(data["refs"])
+            bases.update(data["bases"])
+        return symbols, refs, bases
+
+    @staticmethod
+    def _resolve(symbol, symbols, bases):
+        """Map Class.attr to the class that defines attr, following base classes."""
+        if symbol in symbols or "." not in symbol.split("::")[-1]:
+            return symbol if symbol in symbols else None
+        class_symbol, attr = symbol.rsplit(".", 1)
+        for base in bases.get(class_symbol, []):
+            resolved = ImpactIndex._resolve(f"{base}.{attr}", symbols, bases)
+            if resolved:
+                return resolved
+        return None
+
+    def dependencies(self, test_id):
+        """
+        Args:
+            test_id (str): Node id without parametrization, e.g. tests/test_forms.py::test_submit
+
+        Returns:
+            set: Symbols the test depends on (static closure plus traced calls)
+        """
+        symbols, refs, bases = self._lookup()
+        relpath, name = test_id.split("::", 1)
+        test_refs = self.files.get(relpath, {}).get("tests", {}).get(name, [])
+        pending = [f"{relpath}::{name.replace('::', '.')}"] + list(test_refs) + self.traced.get(test_id, [])
+        classes, unknown_attrs, found = set(), set(), set()
+        while pending:
+            symbol = pending.pop()
+            if symbol.startswith("?"):
+                unknown_attrs.add(symbol[1:])
+                continue
+            resolved = self._resolve(symbol, symbols, bases)
+            if resolved is None or resolved in found:
+                continue
+            found.add(resolved)
+            if symbols[resolved][2] == "class":
+                classes.add(resolved)
+                pending.append(f"{resolved}.__init__")
+                pending.extend(bases.get(resolved, []))
+            pending.extend(refs.get(resolved, []))
+            # page.method() on an object of unknown type: resolve against the classes the test uses
+            for attr in list(unknown_attrs):
+                for class_symbol in classes:
+                    pending.append(f"{class_symbol}.{attr}")
+        return found
+
+    def changed_lines(self, base="HEAD"):
+        """
+        Args:
+            base (str): Git revision to compare the working tree with
+
+        Returns:
+            dict: Changed file (relative path) -> set of changed line numbers (negative: next to deleted
+                lines), or None for a file that is new or deleted
+        """
+        diff = subprocess.run(["git", "diff", "-U0", "--no-color", "--no-ext-diff", base, "--"],
+                              cwd=self.root, capture_output=True, text=True, check=True).stdout
+        changes, old_path, current = {}, None, None
+        for line in diff.splitlines():
+            if line.startswith("diff --git "):
+                old_path, current = None, None
+            elif line.startswith("--- a/"):
+                old_path = line[len("--- a/"):]
+            elif line.startswith("+++ "):
+                if line == "+++ /dev/null":
+                    changes[old_path] = None  # Deleted file
+                else:
+                    current = line[len("+++ b/"):]
+                    changes.setdefault(current, set())
+            elif line.startswith("@@") and current:
+                start, _, length = re.match(r"@@ -\S+ \+(\d+)(,(\d+))? @@", line).groups()
+                start, length = int(start), 1 if length is None else int(length)
+                if length:
+                    changes[current].update(range(start, start + length))
+                else:
+                    # Pure deletion after line `start`: negative numbers mark the lines around it
+                    changes[current].update((-max(start, 1), -start - 1))
+        untracked = subprocess.run(["git", "ls-files", "--others", "--exclude-standard"],
+                                   cwd=self.root, capture_output=True, text=True, check=True).stdout
+        for relpath in untracked.splitlines():
+            changes[relpath] = None
+        return changes
+
+    def changed_symbols(self, changes):
+        """
+        Map changed lines to the symbols defined on them.
+
+        Args:
+            changes (dict): Output of changed_lines()
+
+        Returns:
+            tuple: (changed symbols, reason to run every test or None)
+        """
+        changed = set()
+        for relpath, lines in changes.items():
+            if relpath.startswith(RUN_ALL_PATHS):
+                return changed, f"{relpath} changed"
+            if relpath.split("/")[0] not in INDEXED_PACKAGES or relpath.endswith(IGNORED_SUFFIXES):
+                continue
+            if not relpath.endswith(".py"):
+                return changed, f"{relpath} changed"
+            data = self.files.get(relpath)
+            if data is None:
+                if relpath.startswith("tests/"):
+                    continue  # Deleted test file: nothing left to run
+                return changed, f"{relpath} deleted"
+            if lines is None:
+                # New file: every symbol in it is new
+                changed.update(self._file_symbols(relpath, data))
+                continue
+            with open(os.path.join(self.root, relpath), encoding="utf-8") as source_file:
+                source_lines = source_file.read().splitlines()
+            for line in sorted(lines):
+                if line < 0:
+                    line = -line  # Next to deleted lines, which may have been code
+                else:
+                    text = source_lines[line - 1].strip() if line <= len(source_lines) else ""
+                    if not text or text.startswith("#"):
+                        continue  # Blank and comment lines change nothing
+                # Innermost symbol containing the line; lines outside any symbol affect the whole file
+                matches = [(end - start, symbol) for symbol, (start, end, _) in data["symbols"].items()
+                           if start <= line <= end]
+                symbol = min(matches)[1] if matches else None
+                if relpath.startswith("tests/"):
+                    # Fixtures and helpers of a test module: rerun the whole module
+                    is_test = symbol and symbol.split("::", 1)[1].replace(".", "::") in data["tests"]
+                    changed.update([symbol] if is_test else self._file_symbols(relpath, data))
+                elif symbol is None:
+                    return changed, f"{relpath}:{line} is outside any class or function"
+                else:
+                    changed.add(symbol)
+        return changed, None
+
+    @staticmethod
+    def _file_symbols(relpath, data):
+        """Symbols standing for a whole file: its tests for a test module, everything it defines otherwise."""
+        if relpath.startswith("tests/"):
+            return [f"{relpath}::{name.replace('::', '.')}" for name in data["tests"]]
+        return list(data["symbols"])
+
+    def select(self, items, base="HEAD"):
+        """
+        Split collected tests into affected and unaffected ones.
+
+        Args:
+            items (list): Collected pytest items
+            base (str): Git revision to compare with
+
+        Returns:
+            tuple: (selected items, deselected items, reason every test was kept or None)
+        """
+        changed, run_all = self.changed_symbols(self.changed_lines(base))
+        if run_all:
+            return list(items), [], run_all
+        symbols, refs, bases = self._lookup()
+        referenced = set()
+        dependencies = {}
+        for item in items:
+            test_id = item.nodeid.split("[", 1)[0]
+            if test_id not in dependencies:
+                dependencies[test_id] = self.dependencies(test_id)
+                referenced |= dependencies[test_id]
+        for symbol in changed:
+            kind = symbols.get(symbol, [0, 0, "function"])[2]
+            # A changed function no test reaches may still run indirectly; an unused constant cannot
+            if symbol not in referenced and kind != "attribute" and not symbol.startswith("tests/"):
+                return list(items), [], f"{symbol} changed and no indexed test reaches it"
+        selected, deselected = [], []
+        for item in items:
+            test_id = item.nodeid.split("[", 1)[0]
+            relpath, name = test_id.split("::", 1)
+            is_new = name not in self.files.get(relpath, {}).get("tests", {})
+            affected = is_new or dependencies[test_id] & changed
+            (selected if affected else deselected).append(item)
+        return selected, deselected, None
+
+
+class ImpactTracer:
+    """Records the project functions each test calls (--impact-trace)"""
+
+    def __init__(self, root, index):
+        """
+        Args:
+            root (str): Project root; only functions defined under its indexed packages are recorded
+            index (ImpactIndex): Updated index the called code objects are mapped to symbols with
+        """
+        self.prefixes = tuple(os.path.join(os.path.abspath(root), package) + os.sep for package in INDEXED_PACKAGES)
+        self.root = os.path.abspath(root)
+        self.index = index
+        self.calls = set()
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            code = frame.f_code
+            if code.co_filename.startswith(self.prefixes):
+                # co_qualname would name the symbol directly, but needs Python 3.11
+                self.calls.add((code.co_filename, code.co_name, code.co_firstlineno))
+
+    def start(self):
+        self.calls = set()
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)  # Threads started by the test, e.g. the tab scheduler
+
+    def _symbol(self, relpath, name, line):
+        """Indexed function a code object belongs to; line is its first line, decorators included."""
+        functions = [(symbol, first, last) for symbol, (first, last, kind)
+                     in self.index.files.get(relpath, {}).get("symbols", {}).items() if kind == "function"]
+        # Nested functions and lambdas are recorded as the indexed function around them
+        enclosing = [function for function in functions if function[1] < line <= function[2]]
+        if enclosing:
+            return max(enclosing, key=lambda function: function[1])[0]
+        # Otherwise the function of that name defined at the line, or right after its decorators
+        named = [function for function in functions
+                 if function[0].split("::", 1)[1].split(".")[-1] == name and function[1] >= line]
+        return min(named, key=lambda function: function[1])[0] if named else None  # None: module code
+
+    def stop(self):
+        """
+        Returns:
+            list: Symbols of the project functions called since start()
+        """
+        sys.setprofile(None)
+        threading.setprofile(None)
+        symbols = set()
+        for filename, name, line in self.calls:
+            relpath = os.path.relpath(filename, self.root).replace(os.sep, "/")
+            if relpath == "utils/impact_index.py":
+                continue  # The tracer itself
+            symbol = self._symbol(relpath, name, line)
+            if symbol:
+                symbols.add(symbol)
+        return sorted(symbols)
+
+
+class ImpactSelection:
+    """Pytest plugin deselecting unaffected tests (--impact) and recording runtime dependencies (--impact-trace)"""
+
+    def __init__(self, root, select=False, base="HEAD", trace=False):
+        """
+        Args:
+            root (str): Project root
+            select (bool): Deselect tests the working tree changes cannot affect
+            base (str): Git revision the changes are measured against
+            trace (bool): Record the project functions each test calls
+        """
+        self.index = ImpactIndex(root)
+        self.select = select
+        self.base = base
+        self.tracer = ImpactTracer(root, self.index) if trace else None
+        self.summary = None
+        # Only the process that sees every test (no xdist worker) writes the index; workers send the
+        # calls they traced to it through workeroutput
+        self.writes_index = "PYTEST_XDIST_WORKER" not in os.environ
+        self.traced_here = {}  # Test id -> symbols traced by this process
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def pytest_collection_modifyitems(self, config, items):
+        parsed = self.index.update()
+        self.logger.info(f"Impact index: {parsed} changed files parsed")
+        if not self.select:
+            return
+        try:
+            selected, deselected, run_all = self.index.select(items, self.base)
+        except (OSError, subprocess.CalledProcessError) as error:
+            selected, deselected, run_all = list(items), [], f"git diff against {self.base} failed ({error})"
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.summary = (f"{len(selected)}/{len(selected) + len(deselected)} tests affected by changes since "
+                        f"{self.base}" + (f" (running all: {run_all})" if run_all else ""))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        if self.tracer is None:
+            yield
+            return
+        self.tracer.start()
+        try:
+            yield
+        finally:
+            called = self.tracer.stop()
+            # Parametrized cases share one entry: the union of what any of them called
+            test_id = item.nodeid.split("[", 1)[0]
+            self.traced_here[test_id] = sorted(set(self.traced_here.get(test_id, [])) | set(called))
+            self.merge_traced({test_id: called})
+
+    def merge_traced(self, traced):
+        """
+        Args:
+            traced (dict): Test id -> symbols called, added to the ones already recorded
+        """
+        for test_id, called in traced.items():
+            self.index.traced[test_id] = sorted(set(self.index.traced.get(test_id, [])) | set(called))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        # xdist controller: a worker finished; merge what its tests called
+        traced = getattr(node, "workeroutput", {}).get("impact_traced")
+        if traced:
+            self.merge_traced(json.loads(traced))
+
+    def pytest_sessionfinish(self, session):
+        if self.writes_index:
+            self.index.save()
+        elif self.traced_here and hasattr(session.config, "workeroutput"):
+            session.config.workeroutput["impact_traced"] = json.dumps(self.traced_here)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.summary:
+            terminalreporter.write_sep("-", self.summary)
@@ -0,0 +1,276 @@
+"""
+Locator registry - every locator in locators/*.py, loaded once, checked for slow patterns, with an
+equivalent CSS form for XPath locators that have one.
+
+Browsers evaluate CSS selectors natively and cache them, while XPath goes through a separate engine.
+Text-matching XPath reads the text of every candidate node, and deep descendant chains scan large
+parts of the DOM. With Config.PREFER_CSS_LOCATORS, BasePage looks elements up with the CSS form.
+
+    python -m utils.locator_registry                 # static report: warnings and CSS rewrites
+    python -m utils.locator_registry --validate      # also check every locator on its page in a browser
+    python -m benchmarks.locator_cost                # lookup cost per locator in a real browser
+"""
+import argparse
+import functools
+import importlib
+import inspect
+import pkgutil
+import re
+from selenium.webdriver.common.by import By
+from config.config import Config
+
+# Descendant combinators in one CSS selector above which it is flagged as a deep scan
+MAX_CSS_DESCENDANTS = 3
+
+_XPATH_STEP = re.compile(r"(//|/)([\w-]+|\*)((?:\[[^\[\]]*\])*)")
+_XPATH_PREDICATE = re.compile(r"\[([^\[\]]*)\]")
+_VALUE = r"""\s*(?:'([^']*)'|"([^"]*)")\s*"""
+_XPATH_CONDITIONS = [
+    (re.compile(rf"^@([\w-]+)\s*={_VALUE}$"), "="),
+    (re.compile(rf"^contains\(\s*@([\w-]+)\s*,{_VALUE}\)$"), "*="),
+    (re.compile(rf"^starts-with\(\s*@([\w-]+)\s*,{_VALUE}\)$"), "^="),
+]
+_TEXT_XPATH = re.compile(r"text\(\)|normalize-space\(|string\(|\.\s*=")
+_CSS_IDENTIFIER = re.compile(r"^[A-Za-z_][\w-]*$")
+
+
+def _css_value(value):
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+@functools.lru_cache(maxsize=1024)
+def _xpath_to_css(xpath):
+    steps = list(_XPATH_STEP.finditer(xpath))
+    if not steps or "".join(step.group(0) for step in steps) != xpath:
+        return None
+    parts = []
+    for index, step in enumerate(steps):
+        axis, tag, predicates = step.groups()
+        selector = "" if tag == "*" and predicates else tag
+        for position, predicate in enumerate(_XPATH_PREDICATE.findall(predicates)):
+            predicate = predicate.strip()
+            if predicate.isdigit():
+                if position:
+                    # [@class='x'][2] counts among the matches of the earlier predicates, nth-of-type among siblings
+                    return None
+                selector += f":nth-of-type({predicate})" if tag != "*" else f":nth-child({predicate})"
+                continue
+            for condition in re.split(r"\s+and\s+", predicate):
+                css = _condition_to_css(condition.strip())
+                if css is None:
+                    return None
+                selector += css
+        if index:
+            parts.append(" " if axis == "//" else " > ")
+        elif axis == "/":
+            selector += ":root"  # Absolute path: the first step is the document element
+        parts.append(selector or "*")
+    return "".join(parts)
+
+
+def _condition_to_css(condition):
+    if re.fullmatch(r"@[\w-]+", condition):
+        return f"[{condition[1:]}]"
+    for pattern, operator in _XPATH_CONDITIONS:
+        match = pattern.match(condition)
+        if match:
+            attribute, value = match.group(1), match.group(2) if match.group(2) is not None else match.group(3)
+            if attribute == "id" and operator == "=" and _CSS_IDENTIFIER.match(value):
+                return f"#{value}"
+            return f"[{attribute}{operator}{_css_value(value)}]"
+    return None  # text(), position(), or, functions: no CSS equivalent
+
+
+class LocatorRegistry:
+    """All locator constants of the locators package, loaded once"""
+
+    _locators = None  # "Class.NAME" -> locator tuple
+
+    @staticmethod
+    def all():
+        """
+        Returns:
+            dict: "LocatorClass.NAME" -> locator tuple, for every locator class in the locators package
+        """
+        if LocatorRegistry._locators is None:
+            import locators  # Imported here: the package is only scanned when the registry is used
+            found = {}
+            for module_info in pkgutil.iter_modules(locators.__path__):
+                module = importlib.import_module(f"locators.{module_info.name}")
+                for class_name, locator_class in inspect.getmembers(module, inspect.isclass):
+                    if locator_class.__module__ != module.__name__:
+                        continue
+                    for name, value in vars(locator_class).items():
+                        if LocatorRegistry.is_locator(value):
+                            found[f"{class_name}.{name}"] = value
+            LocatorRegistry._locators = found
+        return LocatorRegistry._locators
+
+    @staticmethod
+    def is_locator(value):
+        """
+        Args:
+            value: Any object
+
+        Returns:
+            bool: Whether value is a (By.TYPE, "value") tuple
+        """
+        strategies = {By.ID, By.XPATH, By.LINK_TEXT, By.PARTIAL_LINK_TEXT, By.NAME, By.TAG_NAME,
+                      By.CLASS_NAME, By.CSS_SELECTOR}
+        return (isinstance(value, tuple) and len(value) == 2 and value[0] in strategies
+                and isinstance(value[1], str))
+
+    @staticmethod
+    def to_css(locator):
+        """
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+
+        Returns:
+            tuple: Equivalent CSS locator, or None when there is none (or it already is CSS)
+        """
+        by, value = locator
+        if by == By.XPATH:
+            css = _xpath_to_css(value.strip())
+            return (By.CSS_SELECTOR, css) if css else None
+        return None
+
+    @staticmethod
+    def preferred(locator):
+        """
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+
+        Returns:
+            tuple: The CSS form when Config.PREFER_CSS_LOCATORS is on and one exists, else the locator
+        """
+        if not Config.PREFER_CSS_LOCATORS or locator[0] != By.XPATH:
+            return locator
+        return LocatorRegistry.to_css(locator) or locator
+
+    @staticmethod
+    def analyze(locator):
+        """
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+
+        Returns:
+            list: Descriptions of slow patterns in the locator (empty when none)
+        """
+        by, value = locator
+        warnings = []
+        if by == By.XPATH:
+            if _TEXT_XPATH.search(value):
+                warnings.append("matches on text: reads the text of every candidate node; prefer an id or attribute")
+            if value.startswith("//*"):
+                warnings.append("starts with //*: scans every element in the document")
+            if value.count("//") > 1:
+                warnings.append("nested // descendant scans")
+            if LocatorRegistry.to_css(locator):
+                warnings.append("XPath with an equivalent CSS selector")
+        elif by == By.CSS_SELECTOR:
+            compound = re.sub(r"\s*([>+~])\s*", r"\1", value.strip())
+            if compound.count(" ") > MAX_CSS_DESCENDANTS:
+                warnings.append(f"more than {MAX_CSS_DESCENDANTS} descendant combinators")
+            if re.search(r"(^|[\s>+~])\*$", compound):
+                warnings.append("universal key selector: every element is a candidate")
+        elif by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            warnings.append("matches on link text; prefer an id or attribute")
+        return warnings
+
+    @staticmethod
+    def report():
+        """
+        Returns:
+            list: (name, locator, warnings, CSS form or None) for every registered locator
+        """
+        return [(name, locator, LocatorRegistry.analyze(locator), LocatorRegistry.to_css(locator))
+                for name, locator in sorted(LocatorRegistry.all().items())]
+
+    @staticmethod
+    def page_locators():
+        """
+        Map page URLs to the locators used on them, from the page objects' sources.
+
+        Returns:
+            dict: URL -> list of registry names
+        """
+        import pages  # Imported here: page objects pull in Selenium waits and the driver helpers
+        from pages.base_page import BasePage
+        by_class = {}
+        for name in LocatorRegistry.all():
+            by_class.setdefault(name.split(".")[0], []).append(name)
+        urls = {}
+        for module_info in pkgutil.iter_modules(pages.__path__):
+            module = importlib.import_module(f"pages.{module_info.name}")
+            for _, page_class in inspect.getmembers(module, inspect.isclass):
+                if not issubclass(page_class, BasePage) or page_class.__module__ != module.__name__:
+                    continue
+                source = inspect.getsource(page_class)
+                for url_name in re.findall(r"Config\.(\w+_URL)\b", source):
+                    names = urls.setdefault(getattr(Config, url_name), [])
+                    for class_name in sorted(set(re.findall(r"\b(\w+Locators)\.", source))):
+                        names.extend(name for name in by_class.get(class_name, []) if name not in names)
+        return urls
+
+    @staticmethod
+    def validate(driver, urls=None):
+        """
+        Open each page and check its locators: templates are skipped, other locators must match an
+        element and their CSS form must match exactly the same elements.
+
+        Args:
+            driver: WebDriver instance
+            urls (list): Pages to check (defaults to every page with locators)
+
+        Returns:
+            list: Problem descriptions (empty when every locator is valid)
+        """
+        registry = LocatorRegistry.all()
+        problems = []
+        for url, names in LocatorRegistry.page_locators().items():
+            if urls and url not in urls:
+                continue
+            driver.get(url)
+            for name in names:
+                locator = registry[name]
+                if "{" in locator[1]:
+                    continue  # Template, formatted at runtime
+                elements = driver.find_elements(*locator)
+                if not elements:
+                    # Elements of dialogs and results only exist after an interaction
+                    problems.append(f"{name} {locator} matches nothing on {url} (may appear after an interaction)")
+                css = LocatorRegistry.to_css(locator)
+                if css and [element.id for element in driver.find_elements(*css)] != [element.id for element in elements]:
+                    problems.append(f"{name}: CSS form {css[1]!r} matches different elements on {url}")
+        return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Locator registry report")
+    parser.add_argument("--validate", action="store_true", help="Check every locator on its page in a browser")
+    args = parser.parse_args()
+
+    for name, locator, warnings, css in LocatorRegistry.report():
+        if warnings or css:
+            print(f"{name} = {locator}")
+            for warning in warnings:
+                print(f"    - {warning}")
+            if css:
+                print(f"    CSS: {css}")
+    print(f"{len(LocatorRegistry.all())} locators registered")
+
+    if args.validate:
+        from utils.driver_factory import DriverFactory  # Imported here: only validation needs a browser
+        driver = DriverFactory.get_driver()
+        try:
+            problems = LocatorRegistry.validate(driver)
+        finally:
+            driver.quit()
+        for problem in problems:
+            print(f"! {problem}")
+        print(f"{len(problems)} validation problems")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,10 @@ from config.config import Config
 class Logger:
     """Custom logger class for framework logging"""
     
+    # One log file per process, shared by all named loggers
+    log_file = None
+    _file_handler = None
+    
     @staticmethod
     def get_logger(name=__name__):
         """
@@ -29,16 +33,18 @@ class Logger:
         if logger.handlers:
             return logger
         
-        # Create logs directory if it doesn't exist
-        os.makedirs(Config.LOG_PATH, exist_ok=True)
-        
-        # Create file handler
-        log_file = os.path.join(
-            Config.LOG_PATH,
-            f"test_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        )
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
+        # Create the process's file handler on first use
+        if Logger._file_handler is None:
+            # Create logs directory if it doesn't exist
+            os.makedirs(Config.LOG_PATH, exist_ok=True)
+            worker = os.environ.get("PYTEST_XDIST_WORKER")
+            Logger.log_file = os.path.join(
+                Config.LOG_PATH,
+                f"test_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}{f'_{worker}' if worker else ''}.log"
+            )
+            Logger._file_handler = logging.FileHandler(Logger.log_file)
+            Logger._file_handler.setLevel(logging.DEBUG)
+        file_handler = Logger._file_handler
         
         # Create console handler
         console_handler = logging.StreamHandler()
@@ -0,0 +1,220 @@
+"""
+Run metrics in OpenMetrics text format - test throughput and outcomes, navigation latency per page,
+BasePage action latency, driver startup time and recycles.
+
+Enabled with --metrics (Config.METRICS_ENABLED). The exposition is written to Config.METRICS_FILE at the
+end of the session and, with --metrics-port, served at http://127.0.0.1:<port>/metrics during the run.
+"""
+import functools
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config.config import Config
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Histogram buckets in seconds: WebDriver actions are tens of ms, page loads and browser starts seconds
+ACTION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+PAGE_BUCKETS = (0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Metric:
+    """Metric family with one series per label set"""
+
+    def __init__(self, name, kind, help_text):
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.series = {}
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonic count, exposed with the _total suffix"""
+
+    def __init__(self, name, help_text):
+        super().__init__(name, "counter", help_text)
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        self.series[key] = self.series.get(key, 0) + amount
+
+    def lines(self):
+        return [f"{self.name}_total{_format_labels(key)} {value}" for key, value in self.series.items()]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    def __init__(self, name, help_text):
+        super().__init__(name, "gauge", help_text)
+
+    def set(self, value, **labels):
+        self.series[tuple(sorted(labels.items()))] = value
+
+    def lines(self):
+        return [f"{self.name}{_format_labels(key)} {value}" for key, value in self.series.items()]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets"""
+
+    def __init__(self, name, help_text, buckets):
+        super().__init__(name, "histogram", help_text)
+        self.buckets = buckets
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        # Per series: [count per bucket..., count in +Inf, sum]
+        series = self.series.setdefault(key, [0] * (len(self.buckets) + 1) + [0.0])
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[position] += 1
+                break
+        else:
+            series[len(self.buckets)] += 1
+        series[-1] += value
+
+    def lines(self):
+        lines = []
+        for key, series in self.series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(key + (('le', bound),))} {cumulative}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {round(series[-1], 6)}")
+        return lines
+
+
+class Metrics:
+    """Process-wide registry of the framework's metrics"""
+
+    _lock = threading.Lock()
+    _server = None
+    started = time.time()
+
+    tests = Counter("selenium_tests", "Finished tests by outcome")
+    test_duration = Histogram("selenium_test_duration_seconds", "Test call duration", PAGE_BUCKETS)
+    tests_per_second = Gauge("selenium_tests_per_second", "Finished tests per second of session time")
+    navigation = Histogram("selenium_navigation_seconds", "Page navigation latency by URL", PAGE_BUCKETS)
+    action = Histogram("selenium_action_seconds", "BasePage action latency by action", ACTION_BUCKETS)
+    driver_startup = Histogram("selenium_driver_startup_seconds", "Time to create and configure a driver", PAGE_BUCKETS)
+    driver_recycles = Counter("selenium_driver_recycles", "Long-lived drivers recycled by the resource monitor")
+
+    @staticmethod
+    def _families():
+        return [Metrics.tests, Metrics.test_duration, Metrics.tests_per_second,
+                Metrics.navigation, Metrics.action, Metrics.driver_startup, Metrics.driver_recycles]
+
+    @staticmethod
+    def record(metric, value, **labels):
+        """
+        Record a value if metrics are enabled.
+
+        Args:
+            metric: Counter (value is the increment), Gauge or Histogram of this registry
+            value (float): Value to record
+            **labels: Series labels
+        """
+        if not Config.METRICS_ENABLED:
+            return
+        with Metrics._lock:
+            if isinstance(metric, Counter):
+                metric.inc(value, **labels)
+            elif isinstance(metric, Gauge):
+                metric.set(value, **labels)
+            else:
+                metric.observe(value, **labels)
+
+    @staticmethod
+    def timed_action(method):
+        """
+        Decorator for BasePage methods: records their latency in selenium_action_seconds.
+        Costs one config lookup per call when metrics are disabled.
+        """
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if not Config.METRICS_ENABLED:
+                return method(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                Metrics.record(Metrics.action, time.perf_counter() - start, action=method.__name__)
+        return wrapper
+
+    @staticmethod
+    def exposition():
+        """
+        Returns:
+            str: All metrics in OpenMetrics text format
+        """
+        with Metrics._lock:
+            finished = sum(Metrics.tests.series.values())
+            elapsed = time.time() - Metrics.started
+            Metrics.tests_per_second.set(round(finished / elapsed, 4) if elapsed > 0 else 0)
+            lines = []
+            for family in Metrics._families():
+                lines.extend(family.header())
+                lines.extend(family.lines())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def write(path):
+        """
+        Args:
+            path (str): File receiving the exposition
+        """
+        with open(path, "w") as metrics_file:
+            metrics_file.write(Metrics.exposition())
+
+    @staticmethod
+    def serve(port):
+        """
+        Serve the live exposition at http://127.0.0.1:<port>/metrics from a background thread.
+
+        Args:
+            port (int): Local port (0 picks a free one)
+
+        Returns:
+            int: Port actually bound
+        """
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = Metrics.exposition().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        Metrics._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        threading.Thread(target=Metrics._server.serve_forever, daemon=True).start()
+        return Metrics._server.server_port
+
+    @staticmethod
+    def stop():
+        """Stop the endpoint started by serve()."""
+        if Metrics._server is not None:
+            Metrics._server.shutdown()
+            Metrics._server = None
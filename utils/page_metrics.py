@@ -0,0 +1,125 @@
+"""
+Page performance metrics - Navigation Timing, resource timing summary, paint timings and Web Vitals
+read from the browser after a page load, checked against the budgets in Config.PERFORMANCE_BUDGETS.
+
+Enabled with --page-metrics (Config.COLLECT_PAGE_METRICS). Metrics of every navigation made by a test
+are attached to its result; budget violations fail the test once its own steps have finished.
+"""
+from config.config import Config
+from utils.logger import Logger
+
+
+# Runs in the page as an async script. LCP and layout shifts are only exposed to buffered
+# PerformanceObservers, so the callback waits one task for the buffered entries to be delivered.
+COLLECT_METRICS_JS = """
+const done = arguments[arguments.length - 1];
+const round = value => Math.round(value * 10) / 10;
+const supported = PerformanceObserver.supportedEntryTypes || [];
+const metrics = {};
+const buffered = {'largest-contentful-paint': [], 'layout-shift': []};
+const observers = Object.keys(buffered).filter(type => supported.includes(type)).map(type => {
+    const observer = new PerformanceObserver(list => buffered[type].push(...list.getEntries()));
+    observer.observe({type: type, buffered: true});
+    return observer;
+});
+setTimeout(() => {
+    observers.forEach(observer => observer.disconnect());
+    const navigation = performance.getEntriesByType('navigation')[0];
+    if (navigation) {
+        metrics.ttfb = round(navigation.responseStart - navigation.requestStart);
+        metrics.dom_content_loaded = round(navigation.domContentLoadedEventEnd);
+        metrics.load = round(navigation.loadEventEnd);
+        metrics.transfer_size = navigation.transferSize;
+    }
+    for (const paint of performance.getEntriesByType('paint')) {
+        metrics[paint.name.replace(/-/g, '_')] = round(paint.startTime);
+    }
+    const lcp = buffered['largest-contentful-paint'];
+    if (lcp.length) metrics.largest_contentful_paint = round(lcp[lcp.length - 1].startTime);
+    if (supported.includes('layout-shift')) {
+        metrics.cumulative_layout_shift = Math.round(buffered['layout-shift']
+            .filter(shift => !shift.hadRecentInput)
+            .reduce((total, shift) => total + shift.value, 0) * 1000) / 1000;
+    }
+    const resources = performance.getEntriesByType('resource');
+    const byType = {};
+    let slowest = null;
+    for (const resource of resources) {
+        const summary = byType[resource.initiatorType] = byType[resource.initiatorType] || {count: 0, bytes: 0};
+        summary.count += 1;
+        summary.bytes += resource.transferSize || 0;
+        if (!slowest || resource.duration > slowest.duration) slowest = resource;
+    }
+    metrics.resource_count = resources.length;
+    metrics.resource_bytes = resources.reduce((total, resource) => total + (resource.transferSize || 0), 0);
+    metrics.resources_by_type = byType;
+    if (slowest) metrics.slowest_resource = {name: slowest.name, duration: round(slowest.duration)};
+    done(metrics);
+}, 0);
+"""
+
+
+class PageMetrics:
+    """Collects page metrics for the running test and checks them against budgets"""
+
+    # Navigations recorded during the current test: (url, metrics, violations)
+    records = []
+
+    @staticmethod
+    def collect(driver):
+        """
+        Read the performance metrics of the page currently loaded in the driver.
+
+        Args:
+            driver: WebDriver instance right after a page load
+
+        Returns:
+            dict: Metric name to value (timings in ms from navigation start)
+        """
+        return driver.execute_async_script(COLLECT_METRICS_JS)
+
+    @staticmethod
+    def check_budget(metrics, budget):
+        """
+        Compare metrics with a budget.
+
+        Args:
+            metrics (dict): Metrics returned by collect()
+            budget (dict): Metric name to maximum allowed value
+
+        Returns:
+            list: Human readable violations, empty if the page is within budget
+        """
+        violations = []
+        for name, limit in budget.items():
+            value = metrics.get(name)
+            if value is not None and value > limit:
+                violations.append(f"{name} = {value} exceeds budget {limit}")
+        return violations
+
+    @staticmethod
+    def record(driver, url):
+        """
+        Collect the metrics of a page that was just loaded and check its budget.
+
+        Args:
+            driver: WebDriver instance
+            url (str): URL that was navigated to (key of Config.PERFORMANCE_BUDGETS)
+
+        Returns:
+            dict: Collected metrics
+        """
+        metrics = PageMetrics.collect(driver)
+        violations = PageMetrics.check_budget(metrics, Config.PERFORMANCE_BUDGETS.get(url, {}))
+        PageMetrics.records.append((url, metrics, violations))
+        logger = Logger.get_logger("PageMetrics")
+        logger.info(f"Page metrics for {url}: load {metrics.get('load')} ms, "
+                    f"FCP {metrics.get('first_contentful_paint')} ms, LCP {metrics.get('largest_contentful_paint')} ms")
+        for violation in violations:
+            logger.warning(f"Performance budget exceeded on {url}: {violation}")
+        return metrics
+
+    @staticmethod
+    def reset():
+        """Forget the records of the previous test."""
+        PageMetrics.records = []
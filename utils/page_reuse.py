@@ -0,0 +1,65 @@
+"""
+Page reuse - runs tests that use the same page object back to back on one shared driver, so a test
+can start from the document the previous test left loaded instead of navigating to it again.
+
+Enabled with --reuse-pages (Config.REUSE_PAGES). Only page objects with REUSABLE = True are reused;
+their reset_page() must bring the loaded document back to a usable state without a reload.
+"""
+import inspect
+
+
+class PageReuse:
+    """Collection-time grouping of tests by page object and navigation statistics"""
+
+    # Navigations performed and avoided by BasePage.navigate() in this process
+    navigations = 0
+    navigations_saved = 0
+
+    @staticmethod
+    def page_key(item):
+        """
+        Find the page object a test works with.
+
+        Args:
+            item: Collected pytest item
+
+        Returns:
+            str: Qualified name of the first page object class the test references, or None
+        """
+        from pages.base_page import BasePage  # Imported here: only needed while collecting
+        function = getattr(item, "function", None)
+        if function is None:
+            return None
+        for name in function.__code__.co_names:
+            candidate = function.__globals__.get(name)
+            if inspect.isclass(candidate) and issubclass(candidate, BasePage) and candidate is not BasePage:
+                return f"{candidate.__module__}.{candidate.__qualname__}"
+        return None
+
+    @staticmethod
+    def reorder(items):
+        """
+        Group tests by page object, keeping the original order inside each group and ordering groups
+        by their first test. Tests without a page object stay together at their group's position.
+
+        Args:
+            items (list): Collected pytest items
+
+        Returns:
+            list: The same items, grouped
+        """
+        groups = {}
+        for item in items:
+            groups.setdefault(PageReuse.page_key(item), []).append(item)
+        return [item for group in groups.values() for item in group]
+
+    @staticmethod
+    def count_navigation(saved):
+        """
+        Args:
+            saved (bool): True if the page was reused instead of loaded
+        """
+        if saved:
+            PageReuse.navigations_saved += 1
+        else:
+            PageReuse.navigations += 1
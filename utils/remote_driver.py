@@ -0,0 +1,220 @@
+"""
+Remote WebDriver backend - Selenium Grid (or standalone server) sessions with pooled HTTP
+connections, session reuse across tests and client-side queueing when the grid is full.
+"""
+import atexit
+import json
+import threading
+import time
+import urllib3
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from config.config import Config
+from utils.command_timer import CommandTimer
+from utils.driver_factory import DriverFactory
+from utils.logger import Logger
+
+
+class PooledRemoteDriver(RemoteWebDriver):
+    """Remote driver whose quit() hands the session back to its pool instead of ending it"""
+
+    # Set by ResourceMonitor.recycle(): the pool ends the session on release instead of reusing it
+    recycle_reason = None
+
+    def __init__(self, pool, command_executor, options):
+        """
+        Args:
+            pool (RemoteSessionPool): Pool that owns the session
+            command_executor: Shared pooled RemoteConnection
+            options: Browser options for the new session
+        """
+        self.pool = pool
+        super().__init__(command_executor=command_executor, options=options)
+
+    def quit(self):
+        """Release the session back to the pool."""
+        self.pool.release(self)
+
+    def end_session(self):
+        """Really end the session on the grid."""
+        super().quit()
+
+
+class RemoteSessionPool:
+    """
+    Hands out grid sessions for one browser configuration.
+    All sessions share a single keep-alive connection pool to the hub.
+    """
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, browser, page_load_strategy=None):
+        """
+        Args:
+            browser (str): Browser name (chrome, firefox, edge)
+            page_load_strategy (str): Optional page load strategy of the sessions
+        """
+        self.browser = browser
+        self.page_load_strategy = page_load_strategy
+        self.grid_url = Config.GRID_URL.rstrip("/")
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.connection = self._create_connection()
+        self._idle = []
+        self._checked_out = set()  # Sessions handed to tests and not released yet
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(Config.GRID_MAX_SESSIONS)
+        atexit.register(self.shutdown)
+
+    @staticmethod
+    def for_browser(browser, page_load_strategy=None):
+        """
+        Get the process-wide pool for a browser configuration, creating it on first use.
+
+        Args:
+            browser (str): Browser name (chrome, firefox, edge)
+            page_load_strategy (str): Optional page load strategy
+
+        Returns:
+            RemoteSessionPool: Shared pool
+        """
+        key = (browser, page_load_strategy)
+        with RemoteSessionPool._pools_lock:
+            if key not in RemoteSessionPool._pools:
+                RemoteSessionPool._pools[key] = RemoteSessionPool(browser, page_load_strategy)
+            return RemoteSessionPool._pools[key]
+
+    def _create_connection(self):
+        """Build the browser's RemoteConnection with a tuned keep-alive pool shared by all sessions."""
+        if self.browser == "chrome":
+            from selenium.webdriver.chrome.remote_connection import ChromeRemoteConnection as Connection
+        elif self.browser == "edge":
+            from selenium.webdriver.edge.remote_connection import EdgeRemoteConnection as Connection
+        else:
+            from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection as Connection
+        connection = Connection(self.grid_url, keep_alive=True)
+        # One host, up to GRID_POOL_SIZE persistent sockets; block instead of opening throwaway connections
+        connection._conn = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=Config.GRID_POOL_SIZE,
+            block=True,
+            timeout=connection.get_timeout(),
+            retries=urllib3.Retry(connect=3, read=0, redirect=3, backoff_factor=0.2),
+        )
+        if Config.COMMAND_TIMING:
+            CommandTimer.shared().instrument(connection)
+        return connection
+
+    @staticmethod
+    def count_free_slots(status, browser):
+        """
+        Count idle slots able to run a browser in a grid /status response.
+
+        Args:
+            status (dict): Parsed JSON of GET /status
+            browser (str): Browser name (chrome, firefox, edge)
+
+        Returns:
+            int: Number of free slots
+        """
+        names = {"edge": ("msedge", "microsoftedge")}.get(browser, (browser,))
+        free = 0
+        for node in status.get("value", {}).get("nodes", []):
+            if node.get("availability", "UP") != "UP":
+                continue
+            for slot in node.get("slots", []):
+                stereotype = slot.get("stereotype", {}).get("browserName", "").lower()
+                if slot.get("session") is None and stereotype in names:
+                    free += 1
+        return free
+
+    def free_slots(self):
+        """
+        Returns:
+            int: Free slots for this pool's browser reported by the grid
+        """
+        response = self.connection._conn.request("GET", f"{self.grid_url}/status")
+        return self.count_free_slots(json.loads(response.data), self.browser)
+
+    def _wait_for_capacity(self, deadline):
+        """Poll the grid with capped backoff until a slot is free, instead of piling up in its queue."""
+        delay = 0.5
+        while self.free_slots() == 0:
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"No free {self.browser} slot on {self.grid_url} within {Config.GRID_QUEUE_TIMEOUT}s")
+            self.logger.info(f"Grid saturated, waiting {delay:.1f}s for a free {self.browser} slot")
+            time.sleep(delay)
+            delay = min(delay * 2, 5)
+
+    def acquire(self):
+        """
+        Get a session: a reset idle one if available, otherwise a new one once the grid has capacity.
+
+        Returns:
+            PooledRemoteDriver: Remote driver ready for a test
+        """
+        deadline = time.monotonic() + Config.GRID_QUEUE_TIMEOUT
+        if not self._slots.acquire(timeout=Config.GRID_QUEUE_TIMEOUT):
+            raise TimeoutError(f"All {Config.GRID_MAX_SESSIONS} local grid sessions stayed busy")
+        try:
+            while True:
+                with self._lock:
+                    driver = self._idle.pop() if self._idle else None
+                if driver is None:
+                    break
+                try:
+                    DriverFactory.reset_state(driver)
+                    self.logger.debug(f"Reusing grid session {driver.session_id}")
+                    with self._lock:
+                        self._checked_out.add(driver)
+                    return driver
+                except WebDriverException:
+                    # The session expired on the grid; drop it and try the next one
+                    self._end_quietly(driver)
+
+            self._wait_for_capacity(deadline)
+            driver = PooledRemoteDriver(
+                self, self.connection, DriverFactory.get_options(self.browser, self.page_load_strategy)
+            )
+            self.logger.info(f"Created grid session {driver.session_id}")
+            with self._lock:
+                self._checked_out.add(driver)
+            return driver
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, driver):
+        """
+        Return a session to the pool, or end it when reuse is disabled.
+
+        Args:
+            driver (PooledRemoteDriver): Session acquired from this pool
+        """
+        reuse = Config.GRID_REUSE_SESSIONS and not driver.recycle_reason
+        with self._lock:
+            if driver not in self._checked_out:
+                # quit() called twice for the same test: the session was already returned or ended
+                return
+            self._checked_out.discard(driver)
+            if reuse:
+                self._idle.append(driver)
+        if not reuse:
+            if driver.recycle_reason:
+                self.logger.info(f"Ending grid session {driver.session_id}: {driver.recycle_reason}")
+            self._end_quietly(driver)
+        self._slots.release()
+
+    def shutdown(self):
+        """End all idle sessions."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._end_quietly(driver)
+
+    @staticmethod
+    def _end_quietly(driver):
+        try:
+            driver.end_session()
+        except WebDriverException:
+            pass
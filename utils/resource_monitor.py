@@ -0,0 +1,174 @@
+"""
+Browser resource monitor - per-test memory, CPU and JavaScript heap of a driver's browser, and
+recycling of long-lived drivers that cross the Config.RECYCLE_* thresholds.
+
+Enabled with --resource-monitor (Config.RESOURCE_MONITOR). Each test's sample is attached to its
+result as the "resources" property. Process figures come from psutil for the driver service and all
+its browser processes; heap, DOM node and document counts from DevTools Performance.getMetrics
+(Chromium only). Long-lived drivers - the --reuse-pages shared driver, reused grid sessions and the
+browser daemon - are recycled when a threshold is crossed, so long sessions stay fast.
+"""
+import time
+import weakref
+import psutil
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from config.config import Config
+from utils.logger import Logger
+
+MB = 1024 * 1024
+
+# browserName capability -> DriverFactory browser name
+_BROWSERS = {"chrome": "chrome", "firefox": "firefox", "MicrosoftEdge": "edge", "msedge": "edge"}
+
+
+class ResourceMonitor:
+    """Samples the resources of one driver's browser; get instances with ResourceMonitor.for_driver()"""
+
+    _monitors = weakref.WeakKeyDictionary()  # Driver -> monitor, dropped with the driver
+    # Session id -> monitor for drivers re-attached to one session per test (the browser daemon)
+    _session_monitors = {}
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: WebDriver instance to monitor
+        """
+        self.driver = driver
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.tests = 0  # Tests served since the browser (re)started
+        self._cpu_mark = None  # (wall time, CPU seconds) when the current test started
+        self._cdp_session = None  # Session id the DevTools Performance domain was enabled for
+
+    @staticmethod
+    def for_driver(driver):
+        """
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            ResourceMonitor: The monitor of this driver, or of its session when every test attaches a new
+                driver to it (created on first use)
+        """
+        if getattr(driver, "SHARED_SESSION", False):
+            monitor = ResourceMonitor._session_monitors.get(driver.session_id)
+            if monitor is None:
+                monitor = ResourceMonitor._session_monitors[driver.session_id] = ResourceMonitor(driver)
+            monitor.driver = driver  # This test's attachment; the count of tests served carries over
+            return monitor
+        if driver not in ResourceMonitor._monitors:
+            ResourceMonitor._monitors[driver] = ResourceMonitor(driver)
+        return ResourceMonitor._monitors[driver]
+
+    def _processes(self):
+        # Local drivers only: remote and daemon sessions have no service process in this Python process
+        service = getattr(self.driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            return []
+        try:
+            root = psutil.Process(process.pid)
+            return [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return []
+
+    def _process_usage(self):
+        rss, cpu = 0, 0.0
+        processes = self._processes()
+        for process in processes:
+            try:
+                rss += process.memory_info().rss
+                times = process.cpu_times()
+                cpu += times.user + times.system
+            except psutil.NoSuchProcess:
+                continue  # Renderer processes come and go
+        return (rss, cpu) if processes else (None, None)
+
+    def _performance_metrics(self):
+        if self.driver.caps.get("browserName") not in ("chrome", "MicrosoftEdge", "msedge"):
+            return {}
+        try:
+            if self._cdp_session != self.driver.session_id:
+                self.driver.execute("executeCdpCommand", {"cmd": "Performance.enable", "params": {}})
+                self._cdp_session = self.driver.session_id
+            result = self.driver.execute("executeCdpCommand", {"cmd": "Performance.getMetrics", "params": {}})
+        except WebDriverException:
+            return {}
+        return {metric["name"]: metric["value"] for metric in result["value"]["metrics"]}
+
+    def begin_test(self):
+        """Mark the start of a test, for the CPU share of its sample."""
+        _, cpu = self._process_usage()
+        self._cpu_mark = (time.monotonic(), cpu) if cpu is not None else None
+
+    def sample(self):
+        """
+        Sample the browser after a test; counts the test as served by this browser.
+
+        Returns:
+            dict: rss_mb and cpu_percent (local drivers), js_heap_mb, js_heap_total_mb, dom_nodes and
+                documents (Chromium), tests served by the browser; unavailable figures are left out
+        """
+        self.tests += 1
+        sample = {"tests": self.tests}
+        rss, cpu = self._process_usage()
+        if rss is not None:
+            sample["rss_mb"] = round(rss / MB, 1)
+            if self._cpu_mark:
+                started, cpu_started = self._cpu_mark
+                elapsed = time.monotonic() - started
+                # Share of one core over the test; above 100 when several browser processes were busy
+                sample["cpu_percent"] = round(100 * (cpu - cpu_started) / elapsed, 1) if elapsed > 0 else 0.0
+        metrics = self._performance_metrics()
+        if "JSHeapUsedSize" in metrics:
+            sample["js_heap_mb"] = round(metrics["JSHeapUsedSize"] / MB, 1)
+            sample["js_heap_total_mb"] = round(metrics["JSHeapTotalSize"] / MB, 1)
+            sample["dom_nodes"] = int(metrics.get("Nodes", 0))
+            sample["documents"] = int(metrics.get("Documents", 0))
+        return sample
+
+    @staticmethod
+    def recycle_reason(sample):
+        """
+        Args:
+            sample (dict): Result of sample()
+
+        Returns:
+            str: Threshold the sample crossed, or None when the browser can keep going
+        """
+        limits = [
+            ("rss_mb", Config.RECYCLE_RSS_MB, "browser memory {value} MB > {limit} MB"),
+            ("js_heap_mb", Config.RECYCLE_JS_HEAP_MB, "JS heap {value} MB > {limit} MB"),
+            ("dom_nodes", Config.RECYCLE_DOM_NODES, "{value} DOM nodes > {limit}"),
+            ("tests", Config.RECYCLE_AFTER_TESTS, "served {value} tests (limit {limit})"),
+        ]
+        for key, limit, message in limits:
+            if limit is not None and sample.get(key, 0) > limit:
+                return message.format(value=sample[key], limit=limit)
+        return None
+
+    def recycle(self, reason):
+        """
+        Replace the browser of a long-lived driver. Pooled grid sessions and daemon-attached drivers are
+        flagged, so their pool or daemon ends the session when the test releases it; other drivers start
+        a fresh browser session in place, so every holder of the driver object keeps working.
+
+        Args:
+            reason (str): Why the driver is recycled (logged)
+        """
+        self.logger.info(f"Recycling driver {self.driver.session_id}: {reason}")
+        self.tests = 0
+        ResourceMonitor._session_monitors.pop(self.driver.session_id, None)  # The new session gets its own
+        if hasattr(type(self.driver), "recycle_reason"):
+            self.driver.recycle_reason = reason
+            return
+        from utils.driver_factory import DriverFactory  # Imported here: only needed for in-place restarts
+        browser = _BROWSERS.get(self.driver.caps.get("browserName"), Config.BROWSER)
+        strategy = self.driver.caps.get("pageLoadStrategy")
+        options = DriverFactory.get_options(browser, strategy if strategy != "normal" else None)
+        try:
+            self.driver.execute(Command.QUIT)  # Ends the browser; the driver service keeps running
+        except WebDriverException:
+            pass
+        self.driver.start_session(options.to_capabilities())
+        DriverFactory._configure(self.driver)
@@ -0,0 +1,181 @@
+"""
+Authenticated session cache - logs in once per credential set and replays the resulting cookies and
+web storage into fresh drivers, so tests that only need a logged-in user skip the login UI.
+
+Sessions are stored as JSON files under Config.SESSION_CACHE_PATH (readable by the owner only, they
+contain auth tokens) and expire after Config.SESSION_CACHE_TTL or when their first cookie expires.
+"""
+import hashlib
+import json
+import os
+import time
+import weakref
+from urllib.parse import urlsplit
+from config.config import Config
+from utils.logger import Logger
+
+
+class SessionCache:
+    """Captures, stores and injects authenticated browser state"""
+
+    # In-process copy of the states read from disk, keyed by cache file path
+    _memory = {}
+    # Driver -> identifier of its storage seeding script (Chromium), dropped with the driver
+    _scripts = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _path(username, password):
+        # The password is part of the key so a changed password never replays a stale session
+        key = hashlib.sha256(f"{Config.BASE_URL}\0{username}\0{password}".encode("utf-8")).hexdigest()[:32]
+        return os.path.join(Config.SESSION_CACHE_PATH, f"{key}.json")
+
+    @staticmethod
+    def capture(driver):
+        """
+        Read the authenticated state of the page currently open in the driver.
+
+        Args:
+            driver: WebDriver instance on a page of the logged-in application
+
+        Returns:
+            dict: Origin, cookies, localStorage and sessionStorage items, and expiry timestamp
+        """
+        parts = urlsplit(driver.current_url)
+        cookies = driver.get_cookies()
+        storage = driver.execute_script(
+            "return [Object.assign({}, window.localStorage), Object.assign({}, window.sessionStorage)];"
+        )
+        expires = time.time() + Config.SESSION_CACHE_TTL
+        # Never replay a session past the expiry of any of its cookies
+        cookie_expiries = [cookie["expiry"] for cookie in cookies if cookie.get("expiry")]
+        if cookie_expiries:
+            expires = min(expires, min(cookie_expiries))
+        return {
+            "origin": f"{parts.scheme}://{parts.netloc}",
+            "cookies": cookies,
+            "local_storage": storage[0],
+            "session_storage": storage[1],
+            "expires": expires,
+        }
+
+    @staticmethod
+    def save(username, password, state):
+        """
+        Store a captured state for a credential set.
+
+        Args:
+            username (str): Username the state belongs to
+            password (str): Password the state belongs to
+            state (dict): State returned by capture()
+        """
+        path = SessionCache._path(username, password)
+        os.makedirs(Config.SESSION_CACHE_PATH, exist_ok=True)
+        # Write atomically so parallel workers never read a half-written file
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as state_file:
+            json.dump(state, state_file)
+        os.replace(temp_path, path)
+        SessionCache._memory[path] = state
+
+    @staticmethod
+    def load(username, password):
+        """
+        Args:
+            username (str): Username of the cached session
+            password (str): Password of the cached session
+
+        Returns:
+            dict: Cached state, or None if there is none or it has expired
+        """
+        path = SessionCache._path(username, password)
+        state = SessionCache._memory.get(path)
+        if state is None:
+            try:
+                with open(path) as state_file:
+                    state = json.load(state_file)
+            except (FileNotFoundError, ValueError):
+                return None
+        if state["expires"] <= time.time():
+            SessionCache.invalidate(username, password)
+            return None
+        SessionCache._memory[path] = state
+        return state
+
+    @staticmethod
+    def invalidate(username, password):
+        """
+        Forget the cached session of a credential set, e.g. after the application rejected it.
+
+        Args:
+            username (str): Username of the cached session
+            password (str): Password of the cached session
+        """
+        path = SessionCache._path(username, password)
+        SessionCache._memory.pop(path, None)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def inject(driver, state):
+        """
+        Load a cached state into a driver before it opens the application.
+        Chromium browsers get it through DevTools without any navigation; other browsers must first
+        open a page of the origin (Config.SESSION_BOOTSTRAP_PATH) because cookies and storage can only
+        be written for the current document.
+
+        Args:
+            driver: Fresh WebDriver instance
+            state (dict): State returned by load()
+        """
+        logger = Logger.get_logger("SessionCache")
+        write_storage = (
+            "(function(state) {"
+            "  for (const [key, value] of Object.entries(state.local_storage)) window.localStorage.setItem(key, value);"
+            "  for (const [key, value] of Object.entries(state.session_storage)) window.sessionStorage.setItem(key, value);"
+            "})"
+        )
+        if driver.caps.get("browserName") in ("chrome", "MicrosoftEdge", "msedge"):
+            SessionCache.remove_injected(driver)  # A reused driver may still seed a previous session
+            cookies = []
+            for cookie in state["cookies"]:
+                cdp_cookie = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly")
+                              if key in cookie}
+                if cookie.get("expiry"):
+                    cdp_cookie["expires"] = cookie["expiry"]
+                if cookie.get("sameSite"):
+                    cdp_cookie["sameSite"] = cookie["sameSite"]
+                cookies.append(cdp_cookie)
+            driver.execute("executeCdpCommand", {"cmd": "Network.setCookies", "params": {"cookies": cookies}})
+            # Storage is written by the first document of the origin, before the application's own scripts run
+            script = driver.execute("executeCdpCommand", {"cmd": "Page.addScriptToEvaluateOnNewDocument", "params": {
+                "source": (
+                    f"if (location.origin === {json.dumps(state['origin'])}"
+                    " && !window.sessionStorage.getItem('__session_cache_injected')) {"
+                    f"  {write_storage}({json.dumps(state)});"
+                    "  window.sessionStorage.setItem('__session_cache_injected', '1');"
+                    "}"
+                )
+            }})
+            SessionCache._scripts[driver] = script["value"]["identifier"]
+        else:
+            driver.get(state["origin"] + Config.SESSION_BOOTSTRAP_PATH)
+            for cookie in state["cookies"]:
+                driver.add_cookie(cookie)
+            driver.execute_script(f"{write_storage}(arguments[0]);", state)
+        logger.info(f"Injected cached session for {state['origin']}")
+
+    @staticmethod
+    def remove_injected(driver):
+        """
+        Stop seeding the storage of a session injected into a Chromium driver, e.g. after the application
+        rejected it; later documents of the origin no longer get its tokens.
+
+        Args:
+            driver: WebDriver instance passed to inject()
+        """
+        identifier = SessionCache._scripts.pop(driver, None)
+        if identifier is not None:
+            driver.execute("executeCdpCommand", {"cmd": "Page.removeScriptToEvaluateOnNewDocument",
+                                                 "params": {"identifier": identifier}})
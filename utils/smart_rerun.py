@@ -0,0 +1,117 @@
+"""
+Smart rerun - retries a failing test body right away on the same (already running) driver, with
+capped backoff, instead of re-running the whole suite. Outcomes and retry counts go to the test
+history store, which reports flakiness rates and can order the next session last-failed first.
+
+    pytest --retries 2                 # retry each failing test up to twice
+    pytest --last-failed-first         # start with the tests that failed in the previous session
+"""
+import inspect
+import os
+import time
+import pytest
+from config.config import Config
+from utils.circuit_breaker import CircuitOpenError
+from utils.logger import Logger
+from utils.test_history import TestHistory
+
+
+class SmartRerun:
+    """Pytest plugin retrying failing tests in place and recording their history"""
+
+    def __init__(self, retries, last_failed_first=False):
+        """
+        Args:
+            retries (int): Extra attempts for a failing test body
+            last_failed_first (bool): Reorder the session using the stored history
+        """
+        self.retries = retries
+        self.last_failed_first = last_failed_first
+        self.history = TestHistory()
+        # The history is only kept for sessions that use it, and only by the process that sees every
+        # report (no xdist worker)
+        self.writes_history = bool(retries or last_failed_first) and "PYTEST_XDIST_WORKER" not in os.environ
+        self._pending = {}  # nodeid -> [outcome, attempts, duration]
+        self.flaky = []
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, items):
+        # Before the --reuse-pages grouping, which keeps this order inside each page group and puts the
+        # groups of the failed tests first
+        if self.last_failed_first:
+            items[:] = self.history.failed_first(items)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        """Run the test body, retrying failures while its fixtures (and driver) stay up."""
+        if (self.retries <= 0 or inspect.iscoroutinefunction(pyfuncitem.obj)
+                or pyfuncitem.get_closest_marker("xfail")):
+            return None  # Default pytest call
+        funcargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+        delay = Config.RETRY_BACKOFF
+        for attempt in range(1, self.retries + 2):
+            try:
+                pyfuncitem.obj(**funcargs)
+                break
+            except CircuitOpenError:
+                raise  # The application is down; retrying cannot help
+            except Exception as error:
+                if attempt > self.retries:
+                    pyfuncitem.user_properties.append(("attempts", attempt))
+                    raise
+                self.logger.warning(f"{pyfuncitem.nodeid} failed on attempt {attempt} ({type(error).__name__}: "
+                                    f"{error}); retrying in {delay:.1f}s on the same driver")
+                try:
+                    self._reset_driver(pyfuncitem.funcargs)
+                except Exception:
+                    raise error  # The driver itself is gone; report the original failure
+                time.sleep(delay)
+                delay = min(delay * 2, Config.RETRY_BACKOFF_MAX)
+        if attempt > 1:
+            pyfuncitem.user_properties.append(("attempts", attempt))
+        return True
+
+    @staticmethod
+    def _reset_driver(funcargs):
+        # Leave cookies (and a cached login) alone; the test navigates to its page again anyway
+        driver = funcargs.get("driver") or funcargs.get("logged_in_driver")
+        if driver is None:
+            return
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get("about:blank")
+
+    def pytest_runtest_logreport(self, report):
+        entry = self._pending.setdefault(report.nodeid, ["passed", 1, 0.0])
+        entry[2] += report.duration
+        if report.failed:
+            entry[0] = "failed" if report.when == "call" else "error"
+        elif report.skipped and entry[0] == "passed":
+            entry[0] = "skipped"
+        for name, value in report.user_properties:
+            if name == "attempts":
+                entry[1] = value
+        if report.when == "teardown":
+            outcome, attempts, duration = self._pending.pop(report.nodeid)
+            self.history.record(report.nodeid, outcome, attempts, duration)
+            if outcome == "passed" and attempts > 1:
+                self.flaky.append(report.nodeid)
+
+    def pytest_sessionfinish(self, session):
+        if self.writes_history:
+            self.history.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.flaky:
+            return
+        terminalreporter.write_sep("-", "flaky tests (passed after retry)")
+        for nodeid in self.flaky:
+            entry = self.history.tests[nodeid]
+            terminalreporter.write_line(
+                f"{nodeid}: {entry['last_attempts']} attempts, flaky in {entry['flaky']}/{entry['runs']} "
+                f"runs ({self.history.flaky_rate(nodeid):.0%})"
+            )
@@ -0,0 +1,124 @@
+"""
+Streaming test report - one JSON line per finished test, appended and flushed as the test ends.
+
+Nothing is kept in memory or assembled at the end of the run: artifacts (screenshots, ...) are
+referenced by path, and a static viewer (index.html next to the results) renders the JSONL file.
+Result files of separate jobs are merged by concatenation:
+    python -m utils.stream_report merge job1/results.jsonl job2/results.jsonl -o reports/stream/results.jsonl
+"""
+import argparse
+import json
+import os
+import shutil
+import socket
+import time
+from config.config import Config
+
+VIEWER_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stream_report_viewer.html")
+
+
+class StreamReport:
+    """Pytest plugin writing results incrementally to Config.STREAM_REPORT_DIR"""
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory (str): Report directory; receives results.jsonl and index.html
+        """
+        self.directory = directory
+        self.path = os.path.join(directory, "results.jsonl")
+        self._pending = {}  # nodeid -> record being built from the setup/call/teardown reports
+        self._counts = {}
+        self._file = None
+
+    def pytest_sessionstart(self, session):
+        os.makedirs(self.directory, exist_ok=True)
+        shutil.copyfile(VIEWER_TEMPLATE, os.path.join(self.directory, "index.html"))
+        # Line buffered: every record reaches the disk as soon as it is written
+        self._file = open(self.path, "w", buffering=1, encoding="utf-8")
+        self._write({"type": "session", "host": socket.gethostname(), "started": time.time(),
+                     "args": session.config.invocation_params.args})
+
+    def pytest_runtest_logreport(self, report):
+        record = self._pending.setdefault(report.nodeid, {
+            "type": "test", "nodeid": report.nodeid, "outcome": "passed", "duration": 0.0,
+            "phases": {}, "artifacts": [], "properties": {},
+        })
+        record["duration"] = round(record["duration"] + report.duration, 4)
+        record["phases"][report.when] = report.outcome
+        if report.failed:
+            # A failure outside the test body is an error, as in pytest's own summary
+            record["outcome"] = "failed" if report.when == "call" else "error"
+            record["longrepr"] = str(report.longrepr)[:Config.STREAM_REPORT_MAX_TRACEBACK]
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "xfailed" if hasattr(report, "wasxfail") else "skipped"
+            if not hasattr(report, "wasxfail") and isinstance(report.longrepr, tuple):
+                record["longrepr"] = report.longrepr[2]  # Skip reason
+        elif report.when == "call" and hasattr(report, "wasxfail"):
+            record["outcome"] = "xpassed"
+        for name, value in report.user_properties:
+            if name == "artifact":
+                if not any(artifact["path"] == value for artifact in record["artifacts"]):
+                    record["artifacts"].append({
+                        "path": value,
+                        "href": os.path.relpath(os.path.abspath(value), os.path.abspath(self.directory)),
+                    })
+            else:
+                record["properties"][name] = value
+        if report.when == "teardown":
+            record["finished"] = time.time()
+            self._write(self._pending.pop(report.nodeid))
+            self._counts[record["outcome"]] = self._counts.get(record["outcome"], 0) + 1
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self._file is None:
+            return
+        self._write({"type": "summary", "finished": time.time(), "exitstatus": int(exitstatus),
+                     "counts": self._counts})
+        self._file.close()
+        self._file = None
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", f"streaming report: {os.path.join(self.directory, 'index.html')}")
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, default=str) + "\n")
+
+    @staticmethod
+    def merge(sources, destination):
+        """
+        Merge result files of several jobs or shards. Records are independent lines, so this is
+        a plain byte concatenation; the viewer groups them by session.
+
+        Args:
+            sources (list): Paths of results.jsonl files
+            destination (str): Path of the merged file
+
+        Returns:
+            int: Number of files merged
+        """
+        if any(os.path.abspath(source) == os.path.abspath(destination) for source in sources):
+            raise ValueError(f"{destination} is also a source; merge into a new file")
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+        with open(destination, "wb") as merged:
+            for source in sources:
+                with open(source, "rb") as shard:
+                    shutil.copyfileobj(shard, merged)
+        shutil.copyfile(VIEWER_TEMPLATE, os.path.join(os.path.dirname(destination) or ".", "index.html"))
+        return len(sources)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming report tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    merge_parser = subparsers.add_parser("merge", help="Concatenate results.jsonl files of several jobs")
+    merge_parser.add_argument("sources", nargs="+")
+    merge_parser.add_argument("-o", "--output", default=os.path.join(Config.STREAM_REPORT_DIR, "results.jsonl"))
+    args = parser.parse_args()
+
+    count = StreamReport.merge(args.sources, args.output)
+    print(f"Merged {count} result files into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Multi-tab scheduler - Runs several independent page-object flows in the tabs of a single driver
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.command import Command
+from config.config import Config
+from utils.logger import Logger
+
+
+class TabFlowResult:
+    """Outcome of a single flow executed by the TabScheduler"""
+
+    def __init__(self, name, duration, error=None):
+        """
+        Args:
+            name (str): Flow name
+            duration (float): Wall-clock duration of the flow in seconds
+            error (Exception): Exception raised by the flow, or None if it passed
+        """
+        self.name = name
+        self.duration = duration
+        self.error = error
+
+    @property
+    def passed(self):
+        """bool: True if the flow finished without raising"""
+        return self.error is None
+
+    def __repr__(self):
+        status = "passed" if self.passed else f"failed: {self.error!r}"
+        return f"TabFlowResult({self.name}, {self.duration:.2f}s, {status})"
+
+
+class TabScheduler:
+    """
+    Interleaves independent flows across the tabs of one WebDriver.
+
+    Every WebDriver command (including the ones issued by WebElements and ActionChains)
+    goes through driver.execute, so the scheduler wraps that single method: each command
+    takes a shared lock and, if another tab is active, switches to the window handle owned
+    by the calling thread first. Waits and sleeps happen outside the lock, which lets the
+    other tabs use the browser while one tab is waiting for its page to load.
+
+    For real overlap of page loads the driver should be created with page_load_strategy="none"
+    (see DriverFactory.get_driver); the scheduler then polls document.readyState itself.
+    """
+
+    # Interval (in seconds) between document.readyState polls after a navigation
+    LOAD_POLL_INTERVAL = 0.1
+
+    def __init__(self, driver, tabs=2):
+        """
+        Args:
+            driver: WebDriver instance that will host all the tabs
+            tabs (int): Number of tabs (and therefore concurrent flows)
+        """
+        if tabs < 1:
+            raise ValueError(f"TabScheduler needs at least one tab, got {tabs}")
+        self.driver = driver
+        self.tabs = tabs
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._handles = queue.Queue()
+        self._tab_handles = []
+        self._current_handle = None
+        self._original_execute = None
+        self._page_load_strategy = driver.capabilities.get("pageLoadStrategy", "normal")
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """
+        Open the tabs and start routing driver commands through the scheduler.
+        The tab that is already open is reused as the first tab.
+        """
+        # Client-side polling only works if find_element does not block server-side
+        self.driver.implicitly_wait(0)
+        handles = [self.driver.current_window_handle]
+        for _ in range(self.tabs - 1):
+            self.driver.switch_to.new_window("tab")
+            handles.append(self.driver.current_window_handle)
+        for handle in handles:
+            self._handles.put(handle)
+        self._tab_handles = handles
+        self._current_handle = handles[-1]
+
+        # Route every command through the scheduler
+        self._original_execute = self.driver.execute
+        self.driver.execute = self._execute
+        self.logger.info(f"Opened {self.tabs} tabs for interleaved execution")
+
+    def close(self):
+        """Restore the driver, close the extra tabs and the implicit wait."""
+        if self._original_execute is None:
+            return
+        self.driver.execute = self._original_execute
+        self._original_execute = None
+
+        # Keep the first tab open so the driver stays usable for the caller
+        for handle in self._tab_handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(self._tab_handles[0])
+        self._tab_handles = []
+        self._handles = queue.Queue()
+        self.driver.implicitly_wait(Config.IMPLICIT_WAIT)
+
+    def run(self, flows):
+        """
+        Run flows concurrently, one per tab.
+        Each flow is called with the shared driver, so existing page objects can be used as-is.
+
+        Args:
+            flows (list): Callables taking the driver, or (name, callable) tuples
+
+        Returns:
+            list: TabFlowResult per flow, in the order the flows were given
+        """
+        if self._original_execute is None:
+            raise RuntimeError("TabScheduler.run() called before open()")
+
+        named_flows = [
+            flow if isinstance(flow, tuple) else (getattr(flow, "__name__", repr(flow)), flow)
+            for flow in flows
+        ]
+        with ThreadPoolExecutor(max_workers=self.tabs, thread_name_prefix="tab") as executor:
+            futures = [executor.submit(self._run_flow, name, flow) for name, flow in named_flows]
+            return [future.result() for future in futures]
+
+    def _run_flow(self, name, flow):
+        """Claim a free tab, run the flow inside it and hand the tab back."""
+        handle = self._handles.get()
+        self._local.handle = handle
+        start = time.perf_counter()
+        error = None
+        try:
+            flow(self.driver)
+        except Exception as exc:  # Report the failure instead of aborting the other flows
+            error = exc
+            self.logger.error(f"Flow '{name}' failed in tab {handle}: {exc}")
+        finally:
+            self._local.handle = None
+            self._handles.put(handle)
+        result = TabFlowResult(name, time.perf_counter() - start, error)
+        self.logger.info(f"Flow '{name}' finished in {result.duration:.2f}s")
+        return result
+
+    def _execute(self, driver_command, params=None):
+        """
+        Replacement for driver.execute.
+        Switches to the calling thread's tab before running the command.
+        """
+        handle = getattr(self._local, "handle", None)
+        with self._lock:
+            if handle is not None and handle != self._current_handle:
+                self._original_execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+                self._current_handle = handle
+            response = self._original_execute(driver_command, params)
+
+        # With a non-blocking load strategy, wait for the page outside the lock
+        if driver_command == Command.GET and handle is not None and self._page_load_strategy == "none":
+            self._wait_for_page_load()
+        return response
+
+    def _wait_for_page_load(self):
+        """Poll document.readyState until the current tab finished loading."""
+        deadline = time.monotonic() + Config.PAGE_LOAD_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.driver.execute_script("return document.readyState") == "complete":
+                return
+            time.sleep(self.LOAD_POLL_INTERVAL)
+        raise TimeoutException(f"Page did not finish loading within {Config.PAGE_LOAD_TIMEOUT}s")
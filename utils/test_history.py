@@ -0,0 +1,85 @@
+"""
+Test history store - per-test run, failure and flaky counts kept between sessions in
+Config.TEST_HISTORY_FILE. Used to report flakiness rates and to run last-failed tests first.
+"""
+import json
+import os
+import time
+from config.config import Config
+
+
+class TestHistory:
+    """Outcome history of every test, keyed by node id"""
+
+    __test__ = False  # Not a test class, despite the name
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): History file (defaults to Config.TEST_HISTORY_FILE)
+        """
+        self.path = path or Config.TEST_HISTORY_FILE
+        try:
+            with open(self.path) as history_file:
+                self.tests = json.load(history_file)
+        except (FileNotFoundError, ValueError):
+            self.tests = {}
+
+    def record(self, nodeid, outcome, attempts=1, duration=0.0):
+        """
+        Add one finished test to the history.
+
+        Args:
+            nodeid (str): Test node id
+            outcome (str): passed, failed, error or skipped
+            attempts (int): Number of times the test body ran (more than 1 when it was retried)
+            duration (float): Total duration in seconds
+        """
+        if outcome == "skipped":
+            return
+        entry = self.tests.setdefault(nodeid, {"runs": 0, "failures": 0, "flaky": 0})
+        entry["runs"] += 1
+        if outcome != "passed":
+            entry["failures"] += 1
+            entry["last_failed"] = time.time()
+        elif attempts > 1:
+            # Passed only after a retry
+            entry["flaky"] += 1
+        entry["last_outcome"] = outcome
+        entry["last_attempts"] = attempts
+        entry["last_duration"] = round(duration, 3)
+
+    def flaky_rate(self, nodeid):
+        """
+        Args:
+            nodeid (str): Test node id
+
+        Returns:
+            float: Share of runs that needed a retry to pass (0 for unknown tests)
+        """
+        entry = self.tests.get(nodeid)
+        return entry["flaky"] / entry["runs"] if entry and entry["runs"] else 0.0
+
+    def failed_first(self, items):
+        """
+        Order tests so the ones that failed last time run first, then the flakiest ones.
+        The original order is kept inside each tier.
+
+        Args:
+            items (list): Collected pytest items
+
+        Returns:
+            list: The same items, reordered
+        """
+        def priority(item):
+            entry = self.tests.get(item.nodeid, {})
+            failed_last_time = entry.get("last_outcome") in ("failed", "error")
+            return (0 if failed_last_time else 1, -round(self.flaky_rate(item.nodeid), 2))
+        return sorted(items, key=priority)
+
+    def save(self):
+        """Write the history atomically."""
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as history_file:
+            json.dump(self.tests, history_file, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
@@ -0,0 +1,277 @@
+"""
+Visual diff - compares page screenshots with stored baselines as NumPy arrays.
+
+Screenshots are decoded once into uint8 arrays; changed pixels are found with a few whole-array
+operations and counted per region, each with its own threshold. Ignore boxes (ad slots, clocks, ...)
+are masked out before counting. Pixel-identical screenshots return before any diff is computed; with
+Config.VISUAL_TRUST_PHASH, so do screenshots with equal 64-bit perceptual hashes (DCT of a 32x32
+thumbnail), at the risk of missing changes too small to move the hash.
+
+    page.assert_visual_match("text_box_form", ignore=[AdLocators.BANNER])
+    pytest --update-baselines                             # accept the current screenshots
+    python -m utils.visual_diff visual_baselines screenshots/run    # compare two directories in parallel
+"""
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import numpy as np
+from PIL import Image
+from config.config import Config
+
+# DCT-II basis for the 32x32 perceptual hash thumbnail
+_HASH_SIZE = 32
+_DCT = np.cos(np.pi * np.outer(np.arange(_HASH_SIZE), 2 * np.arange(_HASH_SIZE) + 1) / (2 * _HASH_SIZE))
+
+
+class VisualDiffResult:
+    """Outcome of one screenshot comparison"""
+
+    def __init__(self, name, passed, reason, regions=None, phash_distance=None):
+        """
+        Args:
+            name (str): Check name (baseline file name without extension)
+            passed (bool): Whether every region is within its threshold
+            reason (str): Short explanation (identical, within thresholds, ...)
+            regions (dict): Region name -> {"changed": share of changed pixels, "threshold": allowed share}
+            phash_distance (int): Hamming distance between the perceptual hashes (0-64), None if not computed
+        """
+        self.name = name
+        self.passed = passed
+        self.reason = reason
+        self.regions = regions or {}
+        self.phash_distance = phash_distance
+        self.diff_path = None  # Highlighted diff image, written for failed checks
+
+    def __repr__(self):
+        failed = {name: f"{region['changed']:.4%} > {region['threshold']:.4%}"
+                  for name, region in self.regions.items() if region["changed"] > region["threshold"]}
+        details = f"phash distance {self.phash_distance}" if self.phash_distance is not None else ""
+        if failed:
+            details += f"{', ' if details else ''}failed regions: {failed}"
+        if self.diff_path:
+            details += f"{', ' if details else ''}diff: {self.diff_path}"
+        return f"{self.name}: {self.reason}" + (f" ({details})" if details else "")
+
+
+class VisualDiff:
+    """Vectorized screenshot comparison and baseline management"""
+
+    @staticmethod
+    def load(source):
+        """
+        Decode a screenshot into an RGB array.
+
+        Args:
+            source: PNG bytes, a file path, or an already decoded array
+
+        Returns:
+            numpy.ndarray: Array of shape (height, width, 3), dtype uint8
+        """
+        if isinstance(source, np.ndarray):
+            return source
+        with Image.open(BytesIO(source) if isinstance(source, bytes) else source) as image:
+            return np.asarray(image.convert("RGB"))
+
+    @staticmethod
+    def phash(image, ignore=None):
+        """
+        Perceptual hash: sign of the low-frequency DCT coefficients of a 32x32 grayscale thumbnail
+        against their median. Small rendering differences leave it unchanged.
+
+        Args:
+            image (numpy.ndarray): RGB array
+            ignore (list): Boxes (x, y, width, height) blanked before hashing
+
+        Returns:
+            int: 64-bit hash
+        """
+        gray = Image.fromarray(image).convert("L")
+        if ignore:
+            pixels = np.array(gray)
+            for x, y, width, height in ignore:
+                pixels[y:y + height, x:x + width] = 0
+            gray = Image.fromarray(pixels)
+        # reducing_gap: shrink by an integer factor first, then resample the small image
+        thumbnail = np.asarray(gray.resize((_HASH_SIZE, _HASH_SIZE), Image.BOX, reducing_gap=2.0), dtype=np.float64)
+        low = (_DCT @ thumbnail @ _DCT.T)[:8, :8].ravel()
+        bits = low > np.median(low[1:])  # The DC term (average brightness) would skew the median
+        return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+    @staticmethod
+    def hash_distance(first, second):
+        """
+        Args:
+            first (int): Perceptual hash
+            second (int): Perceptual hash
+
+        Returns:
+            int: Number of differing bits
+        """
+        return bin(first ^ second).count("1")
+
+    @staticmethod
+    def changed_mask(baseline, actual, tolerance=None, ignore=None):
+        """
+        Args:
+            baseline (numpy.ndarray): RGB array
+            actual (numpy.ndarray): RGB array of the same shape
+            tolerance (int): Largest channel difference still treated as equal
+            ignore (list): Boxes (x, y, width, height) never reported as changed
+
+        Returns:
+            numpy.ndarray: Boolean (height, width) array, True where the pixel changed
+        """
+        tolerance = Config.VISUAL_PIXEL_TOLERANCE if tolerance is None else tolerance
+        # |a - b| on uint8 without widening to a larger dtype
+        delta = np.maximum(baseline, actual)
+        delta -= np.minimum(baseline, actual)
+        # Channel maximum as two element-wise passes; a reduction over the 3-wide axis is ~20x slower
+        channel_max = np.maximum(delta[..., 0], delta[..., 1])
+        np.maximum(channel_max, delta[..., 2], out=channel_max)
+        changed = channel_max > tolerance
+        for x, y, width, height in ignore or []:
+            changed[y:y + height, x:x + width] = False
+        return changed
+
+    @staticmethod
+    def compare(baseline, actual, regions=None, ignore=None, tolerance=None, name="screenshot"):
+        """
+        Compare a screenshot with its baseline.
+
+        Args:
+            baseline: Baseline PNG bytes, path or array
+            actual: Screenshot PNG bytes, path or array
+            regions (list): Dicts with "name", "box" (x, y, width, height) and "threshold" (allowed share of
+                changed pixels); the whole page with Config.VISUAL_THRESHOLD when omitted
+            ignore (list): Boxes (x, y, width, height) excluded from the comparison
+            tolerance (int): Largest channel difference still treated as equal
+            name (str): Check name used in the result
+
+        Returns:
+            tuple: (VisualDiffResult, boolean changed-pixel array or None)
+        """
+        baseline, actual = VisualDiff.load(baseline), VisualDiff.load(actual)
+        if baseline.shape != actual.shape:
+            return VisualDiffResult(name, False, f"size changed from {baseline.shape[1::-1]} "
+                                                 f"to {actual.shape[1::-1]}"), None
+        if np.array_equal(baseline, actual):
+            return VisualDiffResult(name, True, "identical", phash_distance=0), None
+        distance = None
+        if Config.VISUAL_TRUST_PHASH:
+            # Hashing both images costs about as much as the pixel diff; only worth it when it can skip it
+            distance = VisualDiff.hash_distance(VisualDiff.phash(baseline, ignore), VisualDiff.phash(actual, ignore))
+            if distance == 0:
+                return VisualDiffResult(name, True, "perceptually identical", phash_distance=0), None
+
+        changed = VisualDiff.changed_mask(baseline, actual, tolerance, ignore)
+        ignored = None
+        if ignore:
+            ignored = np.zeros(changed.shape, dtype=bool)
+            for x, y, width, height in ignore:
+                ignored[y:y + height, x:x + width] = True
+        height, width = changed.shape
+        stats = {}
+        for region in regions or [{"name": "page", "threshold": Config.VISUAL_THRESHOLD}]:
+            x, y, region_width, region_height = region.get("box") or (0, 0, width, height)
+            window = (slice(y, y + region_height), slice(x, x + region_width))
+            area = changed[window].size - (np.count_nonzero(ignored[window]) if ignored is not None else 0)
+            stats[region["name"]] = {
+                "changed": np.count_nonzero(changed[window]) / area if area else 0.0,
+                "threshold": region["threshold"],
+            }
+        passed = all(region["changed"] <= region["threshold"] for region in stats.values())
+        reason = "within thresholds" if passed else "changed"
+        return VisualDiffResult(name, passed, reason, stats, distance), changed
+
+    @staticmethod
+    def save_diff(actual, changed, path):
+        """
+        Write the screenshot dimmed, with changed pixels in red.
+
+        Args:
+            actual (numpy.ndarray): RGB array
+            changed (numpy.ndarray): Output of changed_mask()
+            path (str): PNG file to write
+        """
+        highlighted = actual // 3
+        highlighted[changed] = (255, 0, 0)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        Image.fromarray(highlighted).save(path, compress_level=1)
+
+    @staticmethod
+    def check(name, screenshot, regions=None, ignore=None):
+        """
+        Compare a screenshot with the stored baseline of the same name, creating the baseline on first
+        use (or always with Config.UPDATE_BASELINES). Failed checks leave the actual screenshot and a
+        diff image in Config.VISUAL_DIFF_PATH.
+
+        Args:
+            name (str): Baseline name
+            screenshot (bytes): PNG screenshot
+            regions (list): See compare()
+            ignore (list): See compare()
+
+        Returns:
+            VisualDiffResult: Comparison result
+        """
+        baseline_path = os.path.join(Config.VISUAL_BASELINE_PATH, f"{name}.png")
+        if Config.UPDATE_BASELINES or not os.path.exists(baseline_path):
+            os.makedirs(Config.VISUAL_BASELINE_PATH, exist_ok=True)
+            with open(baseline_path, "wb") as baseline_file:
+                baseline_file.write(screenshot)
+            return VisualDiffResult(name, True, "baseline saved")
+        actual = VisualDiff.load(screenshot)
+        result, changed = VisualDiff.compare(baseline_path, actual, regions, ignore, name=name)
+        if not result.passed:
+            os.makedirs(Config.VISUAL_DIFF_PATH, exist_ok=True)
+            with open(os.path.join(Config.VISUAL_DIFF_PATH, f"{name}_actual.png"), "wb") as actual_file:
+                actual_file.write(screenshot)
+            if changed is not None:
+                result.diff_path = os.path.join(Config.VISUAL_DIFF_PATH, f"{name}_diff.png")
+                VisualDiff.save_diff(actual, changed, result.diff_path)
+        return result
+
+    @staticmethod
+    def compare_batch(pairs, workers=None, **options):
+        """
+        Compare many screenshot pairs in parallel. PNG decoding and the NumPy operations release the
+        GIL, so threads scale across cores without copying images between processes.
+
+        Args:
+            pairs (list): (baseline, actual) tuples of paths, PNG bytes or arrays
+            workers (int): Worker threads (defaults to the CPU count)
+            **options: Passed to compare() (regions, ignore, tolerance)
+
+        Returns:
+            list: VisualDiffResult per pair, in input order
+        """
+        def compare_pair(pair):
+            baseline, actual = pair
+            name = os.path.splitext(os.path.basename(actual))[0] if isinstance(actual, str) else "screenshot"
+            return VisualDiff.compare(baseline, actual, name=name, **options)[0]
+
+        with ThreadPoolExecutor(workers or os.cpu_count()) as executor:
+            return list(executor.map(compare_pair, pairs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare a directory of screenshots with baselines")
+    parser.add_argument("baselines", help="Directory of baseline PNG files")
+    parser.add_argument("screenshots", help="Directory of screenshots with the same file names")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    names = sorted(name for name in os.listdir(args.screenshots)
+                   if name.endswith(".png") and os.path.exists(os.path.join(args.baselines, name)))
+    pairs = [(os.path.join(args.baselines, name), os.path.join(args.screenshots, name)) for name in names]
+    results = VisualDiff.compare_batch(pairs, args.workers)
+    for result in results:
+        print(("PASS " if result.passed else "FAIL ") + repr(result))
+    failed = sum(not result.passed for result in results)
+    print(f"{len(results) - failed}/{len(results)} screenshots match their baselines")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()